@@ -0,0 +1,73 @@
+"""
+Shared fixtures for the benchmark suite.
+
+Run with ``poe bench`` (or ``pytest benchmarks --benchmark-autosave``). Results
+are stored as JSON in ``.benchmarks/`` and can be compared across commits with
+``pytest benchmarks --benchmark-compare``.
+"""
+
+import os
+import pathlib
+
+import numpy as np
+import pytest
+from pybFoam import Time, fvMesh, scalarField, volScalarField
+
+import pyOFTools.patch_pybfoam  # noqa: F401
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+# OpenFOAM cases with a committed mesh, so no solver run is required
+CASES = {
+    "cube": ROOT / "tests" / "integration" / "cube",
+    "damBreak": ROOT / "tests" / "setFields",
+}
+
+SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+class PointGeometry:
+    """Minimal InternalMesh with random positions and unit volumes."""
+
+    def __init__(self, positions, volumes):
+        self._positions = positions
+        self._volumes = volumes
+
+    @property
+    def positions(self):
+        return self._positions
+
+    @property
+    def volumes(self):
+        return self._volumes
+
+
+@pytest.fixture(scope="session")
+def rng():
+    return np.random.default_rng(42)
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda n: f"n={n:.0e}")
+def n_elements(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def point_geometry(rng, n_elements):
+    from pybFoam import vectorField
+
+    positions = vectorField(rng.random((n_elements, 3)))
+    return PointGeometry(positions, scalarField(np.ones(n_elements)))
+
+
+@pytest.fixture(params=sorted(CASES))
+def case_mesh(request):
+    """Mesh of a bundled case with its fields read into the registry."""
+    cwd = os.getcwd()
+    os.chdir(CASES[request.param])
+    time = Time(".", ".")
+    mesh = fvMesh(time)
+    fields = [volScalarField.read_field(mesh, name) for name in ("alpha.water", "p")]
+    yield mesh
+    del fields
+    os.chdir(cwd)
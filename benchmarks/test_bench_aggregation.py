@@ -0,0 +1,65 @@
+"""Benchmarks of the C++ aggregation kernels."""
+
+import numpy as np
+import pytest
+from pybFoam import boolList, scalarField, vectorField
+
+from pyOFTools import aggregation
+
+
+@pytest.fixture(scope="module")
+def kernel_inputs(rng, n_elements):
+    # built from numpy buffers, as datasets.set_selection does
+    return {
+        "scalar": scalarField(rng.random(n_elements)),
+        "vector": vectorField(rng.random((n_elements, 3))),
+        "mask": boolList(rng.random(n_elements) > 0.5),
+        "group": aggregation.label_list(rng.integers(0, 10, n_elements)),
+        "weights": scalarField(rng.random(n_elements)),
+        "sparse_mask": boolList(rng.random(n_elements) < 0.01),
+        "indices": aggregation.label_list(np.flatnonzero(rng.random(n_elements) < 0.01)),
+    }
+
+
+@pytest.mark.parametrize("kernel", ["sum", "mean", "max", "min"])
+@pytest.mark.parametrize("field_type", ["scalar", "vector"])
+def test_kernel(benchmark, kernel_inputs, kernel, field_type):
+    func = getattr(aggregation, kernel)
+    benchmark(func, kernel_inputs[field_type], None, None)
+
+
+@pytest.mark.parametrize("kernel", ["sum", "mean", "max", "min"])
+def test_kernel_mask_group(benchmark, kernel_inputs, kernel):
+    func = getattr(aggregation, kernel)
+    benchmark(func, kernel_inputs["scalar"], kernel_inputs["mask"], kernel_inputs["group"])
+
+
+@pytest.mark.parametrize("kernel", ["sum", "mean"])
+def test_kernel_scaling_factor(benchmark, kernel_inputs, kernel):
+    func = getattr(aggregation, kernel)
+    benchmark(
+        func,
+        kernel_inputs["scalar"],
+        kernel_inputs["mask"],
+        None,
+        scalingFactor=kernel_inputs["weights"],
+    )
+
+
+@pytest.mark.parametrize("kernel", ["sum", "max"])
+@pytest.mark.parametrize("selection", ["sparse_mask", "indices"])
+def test_kernel_small_selection(benchmark, kernel_inputs, kernel, selection):
+    # 1% of the elements selected, as dense mask or as index list
+    func = getattr(aggregation, kernel)
+    if selection == "indices":
+        benchmark(func, kernel_inputs["scalar"], None, None, indices=kernel_inputs["indices"])
+    else:
+        benchmark(func, kernel_inputs["scalar"], kernel_inputs["sparse_mask"], None)
+
+
+def test_compute_agg_data(benchmark, rng):
+    from pyOFTools.aggregators import _compute_agg_data
+
+    n = 1000
+    agg_res = aggregation.sum(scalarField(rng.random(n)), None, aggregation.label_list(np.arange(n)))
+    benchmark(_compute_agg_data, agg_res)
@@ -0,0 +1,45 @@
+"""Benchmarks of spatial selectors and binning."""
+
+from copy import copy
+
+import numpy as np
+import pytest
+from pybFoam import scalarField
+
+from pyOFTools.binning import Directional
+from pyOFTools.datasets import InternalDataSet
+from pyOFTools.spatial_selectors import Box, Sphere
+
+BOX = Box(min=(0.1, 0.1, 0.1), max=(0.6, 0.6, 0.6))
+SPHERE = Sphere(center=(0.5, 0.5, 0.5), radius=0.3)
+SMALL_BOX = Box(min=(0.45, 0.45, 0.45), max=(0.55, 0.55, 0.55))
+
+SELECTORS = {
+    "box": BOX,
+    "sphere": SPHERE,
+    "box_and_sphere": BOX & SPHERE,
+    "box_or_sphere": BOX | SPHERE,
+    "nested": (BOX & ~SPHERE) | (SMALL_BOX & SPHERE),
+    "small_box": SMALL_BOX,
+}
+
+
+@pytest.fixture(scope="module")
+def dataset(point_geometry):
+    n = len(point_geometry.volumes)
+    return InternalDataSet(
+        name="bench",
+        field=scalarField(np.ones(n)),
+        geometry=point_geometry,
+    )
+
+
+@pytest.mark.parametrize("name", sorted(SELECTORS))
+def test_selector(benchmark, dataset, name):
+    selector = SELECTORS[name]
+    benchmark(lambda: selector.compute(copy(dataset)))
+
+
+def test_directional(benchmark, dataset):
+    binning = Directional(bins=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0], direction=(1, 0, 0))
+    benchmark(lambda: binning.compute(copy(dataset)))
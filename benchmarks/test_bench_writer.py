@@ -0,0 +1,59 @@
+"""Benchmarks of table writing and the PostProcessorRunner."""
+
+import numpy as np
+import pytest
+from pybFoam import scalarField
+
+from pyOFTools import aggregation
+from pyOFTools.aggregators import Sum, VolIntegrate
+from pyOFTools.builders import area, field, iso_surface
+from pyOFTools.datasets import InternalDataSet
+from pyOFTools.postprocessor import PostProcessorBase
+from pyOFTools.tables.csvWriter import CSVWriter
+from pyOFTools.workflow import WorkFlow
+
+
+class _Geometry:
+    @property
+    def positions(self):
+        return None
+
+    @property
+    def volumes(self):
+        return scalarField(np.ones(1000))
+
+
+@pytest.mark.parametrize("n_groups", [1, 100])
+def test_csv_write_result(benchmark, tmp_path, n_groups):
+    dataset = InternalDataSet(
+        name="bench",
+        field=scalarField(np.ones(1000)),
+        geometry=_Geometry(),
+        groups=aggregation.label_list(np.arange(1000) % n_groups),
+    )
+    result = WorkFlow(initial_dataset=dataset).then(Sum()).compute()
+
+    writer = CSVWriter(file_path=str(tmp_path / "bench.csv"))
+    writer.create_file()
+    benchmark(writer.write_result, time=0.0, result=result)
+
+
+def test_postprocessor_write(benchmark, tmp_path, case_mesh):
+    postProcess = PostProcessorBase(base_path=f"{tmp_path}/")
+
+    @postProcess.Table("vol_alpha.csv")
+    def vol_alpha(mesh):
+        return field(mesh, "alpha.water") | VolIntegrate()
+
+    @postProcess.Table("p_sum.csv")
+    def p_sum(mesh):
+        return field(mesh, "p") | Sum()
+
+    @postProcess.Table("free_surface_area.csv")
+    def free_surface_area(mesh):
+        return iso_surface(mesh, "alpha.water", 0.5) | area() | Sum()
+
+    runner = postProcess(case_mesh)
+    runner.execute()
+    benchmark(runner.write)
+    runner.end()
@@ -2,7 +2,6 @@ import numpy as np
 import pybFoam
 from pybFoam import volScalarField, write
 
-from pyOFTools.datasets import InternalDataSet
 from pyOFTools.geometry import FvMeshInternalAdapter
 from pyOFTools.spatial_selectors import Box, Sphere
 
@@ -12,18 +11,13 @@ def set_field(mesh):
     np_alpha = np.asarray(alpha["internalField"])
     np_alpha[:] = 0.0
 
-    int_alpha = InternalDataSet(
-        name="alpha.water",
-        field=alpha["internalField"],
-        geometry=FvMeshInternalAdapter(mesh),
-    )
-
     box = Box(min=(0, 0, -1), max=(0.1461, 0.292, 1))
     sphere = Sphere(center=(0.0, 0.0, 0.0), radius=0.25)
     combined = box | sphere
-    int_alpha = combined.compute(int_alpha)
-    mask = np.asarray(int_alpha.mask)
-    np_alpha[mask] = 1.0
+    # evaluate returns a dense bool array; compute() on a dataset would store
+    # small selections as indices instead of a mask
+    selected = combined.evaluate(np.asarray(FvMeshInternalAdapter(mesh).positions))
+    np_alpha[selected] = 1.0
     write(alpha)
 
 
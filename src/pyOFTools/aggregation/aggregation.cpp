@@ -20,6 +20,9 @@ License
 #include <nanobind/nanobind.h>
 
 #include "bind_aggregation.hpp"
+#include "bind_boundary.hpp"
+#include "bind_field_average.hpp"
+#include "bind_residuals.hpp"
 
 namespace nb = nanobind;
 
@@ -28,4 +31,7 @@ NB_MODULE(aggregation, aggregation) {
     aggregation.doc() = "openfoam aggregation package"; // optional module docstring
 
     Foam::bindAggregation(aggregation);
+    Foam::bindBoundary(aggregation);
+    Foam::bindFieldAverage(aggregation);
+    Foam::bindResiduals(aggregation);
 }
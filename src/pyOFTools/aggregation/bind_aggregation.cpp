@@ -19,13 +19,50 @@ License
 
 #include "bind_aggregation.hpp"
 
+#include "ListOps.H"
+#include "cellSet.H"
+#include "fvMesh.H"
+#include "stringList.H"
+#include "symmTensorField.H"
+
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+
+#include <algorithm>
+#include <set>
+#include <stdexcept>
+
 namespace nb = nanobind;
 
+// Number of groups of a grouped aggregation. It must be the same on all
+// processors for the reduction, so it is passed by the caller (e.g. the
+// number of bins or patches); otherwise it is the largest group of all
+// processors plus one.
+Foam::label countGroups(
+    const std::optional<Foam::labelList> &group,
+    const std::optional<Foam::label> &nGroups)
+{
+    if (!group)
+    {
+        return 1;
+    }
+    if (nGroups)
+    {
+        return *nGroups;
+    }
+    const Foam::label localGroups = group->empty() ? 0 : Foam::max(*group) + 1;
+    return Foam::returnReduce(localGroups, Foam::maxOp<Foam::label>());
+}
+
 template <class Type>
 struct aggregationResult
 {
     Foam::Field<Type> values;
     std::optional<Foam::labelList> group = std::nullopt;
+    // weights of the means (empty for the other kernels), needed to combine
+    // results of separately evaluated subdomains
+    Foam::scalarField weights;
 };
 
 template <typename T>
@@ -33,10 +70,12 @@ aggregationResult<T> aggSum(
     const Foam::Field<T> &values,
     std::optional<Foam::boolList> mask = std::nullopt,
     std::optional<Foam::labelList> group = std::nullopt,
-    std::optional<Foam::scalarField> scalingFactor = std::nullopt)
+    std::optional<Foam::scalarField> scalingFactor = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt,
+    std::optional<Foam::label> groupCount = std::nullopt)
 {
     aggregationResult<T> result;
-    auto nGroups = group ? max(*group) + 1 : 1;
+    const Foam::label nGroups = countGroups(group, groupCount);
     result.values = Foam::Field<T>(nGroups, Foam::Zero);
     // store the group information in the result
     // ranging from 0 to nGroups-1
@@ -50,10 +89,12 @@ aggregationResult<T> aggSum(
         }
     }
 
-    const Foam::label nElements = values.size();
+    // with an index list only the selected elements are visited
+    const Foam::label nElements = indices ? indices->size() : values.size();
 
-    for (Foam::label i = 0; i < nElements; ++i)
+    for (Foam::label k = 0; k < nElements; ++k)
     {
+        const Foam::label i = indices ? (*indices)[k] : k;
         Foam::label groupIndex = group ? (*group)[i] : 0;
         Foam::scalar masking = mask ? (*mask)[i] : 1.0;
         Foam::scalar scaleFactor = scalingFactor ? (*scalingFactor)[i] : 1.0;
@@ -71,10 +112,12 @@ aggregationResult<T> aggMean(
     const Foam::Field<T> &values,
     std::optional<Foam::boolList> mask = std::nullopt,
     std::optional<Foam::labelList> group = std::nullopt,
-    std::optional<Foam::scalarField> scalingFactor = std::nullopt)
+    std::optional<Foam::scalarField> scalingFactor = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt,
+    std::optional<Foam::label> groupCount = std::nullopt)
 {
     aggregationResult<T> result;
-    auto nGroups = group ? max(*group) + 1 : 1;
+    const Foam::label nGroups = countGroups(group, groupCount);
     result.values = Foam::Field<T>(nGroups, Foam::Zero);
     Foam::Field<Foam::scalar> weights(nGroups, 0.0);
     // store the group information in the result
@@ -89,10 +132,12 @@ aggregationResult<T> aggMean(
         }
     }
 
-    const Foam::label nElements = values.size();
+    // with an index list only the selected elements are visited
+    const Foam::label nElements = indices ? indices->size() : values.size();
 
-    for (Foam::label i = 0; i < nElements; ++i)
+    for (Foam::label k = 0; k < nElements; ++k)
     {
+        const Foam::label i = indices ? (*indices)[k] : k;
         Foam::label groupIndex = group ? (*group)[i] : 0;
         Foam::scalar masking = mask ? (*mask)[i] : 1.0;
         Foam::scalar scaleFactor = scalingFactor ? (*scalingFactor)[i] : 1.0;
@@ -102,6 +147,7 @@ aggregationResult<T> aggMean(
 
     Foam::reduce(result.values, Foam::sumOp<Foam::Field<T>>());
     Foam::reduce(weights, Foam::sumOp<Foam::Field<Foam::scalar>>());
+    result.weights = weights;
 
     for (Foam::label i = 0; i < nGroups; ++i)
     {
@@ -129,10 +175,12 @@ template <typename T>
 aggregationResult<T> aggMax(
     const Foam::Field<T> &values,
     std::optional<Foam::boolList> mask = std::nullopt,
-    std::optional<Foam::labelList> group = std::nullopt)
+    std::optional<Foam::labelList> group = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt,
+    std::optional<Foam::label> groupCount = std::nullopt)
 {
     aggregationResult<T> result;
-    auto nGroups = group ? max(*group) + 1 : 1;
+    const Foam::label nGroups = countGroups(group, groupCount);
     // store the group information in the result
     // ranging from 0 to nGroups-1
     // if no grouping is done, this remains nullopt
@@ -153,10 +201,12 @@ aggregationResult<T> aggMax(
         result.values = Foam::Field<T>(nGroups, T::one * -Foam::GREAT);
     }
 
-    const Foam::label nElements = values.size();
+    // with an index list only the selected elements are visited
+    const Foam::label nElements = indices ? indices->size() : values.size();
 
-    for (Foam::label i = 0; i < nElements; ++i)
+    for (Foam::label k = 0; k < nElements; ++k)
     {
+        const Foam::label i = indices ? (*indices)[k] : k;
         Foam::label groupIndex = group ? (*group)[i] : 0;
         if (mask)
         {
@@ -177,10 +227,12 @@ template <typename T>
 aggregationResult<T> aggMin(
     const Foam::Field<T> &values,
     std::optional<Foam::boolList> mask = std::nullopt,
-    std::optional<Foam::labelList> group = std::nullopt)
+    std::optional<Foam::labelList> group = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt,
+    std::optional<Foam::label> groupCount = std::nullopt)
 {
     aggregationResult<T> result;
-    auto nGroups = group ? max(*group) + 1 : 1;
+    const Foam::label nGroups = countGroups(group, groupCount);
     // store the group information in the result
     // ranging from 0 to nGroups-1
     // if no grouping is done, this remains nullopt
@@ -202,10 +254,12 @@ aggregationResult<T> aggMin(
         result.values = Foam::Field<T>(nGroups, T::one * Foam::GREAT);
     }
 
-    const Foam::label nElements = values.size();
+    // with an index list only the selected elements are visited
+    const Foam::label nElements = indices ? indices->size() : values.size();
 
-    for (Foam::label i = 0; i < nElements; ++i)
+    for (Foam::label k = 0; k < nElements; ++k)
     {
+        const Foam::label i = indices ? (*indices)[k] : k;
         Foam::label groupIndex = group ? (*group)[i] : 0;
         if (mask)
         {
@@ -222,26 +276,340 @@ aggregationResult<T> aggMin(
     return result;
 }
 
+aggregationResult<Foam::scalar> aggFlux(
+    const Foam::vectorField &values,
+    const Foam::vectorField &Sf,
+    std::optional<Foam::boolList> mask = std::nullopt,
+    std::optional<Foam::labelList> group = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt,
+    std::optional<Foam::label> groupCount = std::nullopt)
+{
+    // sum of values & Sf, e.g. the volume flow rate for the velocity
+    aggregationResult<Foam::scalar> result;
+    const Foam::label nGroups = countGroups(group, groupCount);
+    result.values = Foam::scalarField(nGroups, Foam::Zero);
+    if (group)
+    {
+        result.group = Foam::identity(nGroups);
+    }
+
+    const Foam::label nElements = indices ? indices->size() : values.size();
+
+    for (Foam::label k = 0; k < nElements; ++k)
+    {
+        const Foam::label i = indices ? (*indices)[k] : k;
+        if (mask && !(*mask)[i])
+        {
+            continue;
+        }
+        const Foam::label groupIndex = group ? (*group)[i] : 0;
+        result.values[groupIndex] += values[i] & Sf[i];
+    }
+
+    Foam::reduce(result.values, Foam::sumOp<Foam::scalarField>());
+
+    return result;
+}
+
+struct forcesResult
+{
+    Foam::vectorField pressureForce;
+    Foam::vectorField viscousForce;
+    Foam::vectorField pressureMoment;
+    Foam::vectorField viscousMoment;
+    std::optional<Foam::labelList> group = std::nullopt;
+};
+
+forcesResult aggForces(
+    const Foam::scalarField &p,
+    const Foam::vectorField &Sf,
+    const Foam::vectorField &Cf,
+    const Foam::vector &CofR,
+    std::optional<Foam::symmTensorField> stress = std::nullopt,
+    Foam::scalar rho = 1.0,
+    Foam::scalar pRef = 0.0,
+    std::optional<Foam::boolList> mask = std::nullopt,
+    std::optional<Foam::labelList> group = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt,
+    bool kinematicStress = false,
+    std::optional<Foam::label> groupCount = std::nullopt)
+{
+    // pRef is in the units of p (kinematic if rho is the reference density)
+    // pressure force rho*(p - pRef)*Sf and viscous force Sf & stress per
+    // face, as in the OpenFOAM forces function object; rho only scales the
+    // stress if it is kinematic (devReff), not the dynamic devRhoReff
+    const Foam::label nGroups = countGroups(group, groupCount);
+
+    // all four quantities are packed into one field for a single reduction
+    Foam::vectorField packed(4*nGroups, Foam::Zero);
+
+    const Foam::label nElements = indices ? indices->size() : p.size();
+    const Foam::scalar stressScale = kinematicStress ? rho : 1.0;
+
+    for (Foam::label k = 0; k < nElements; ++k)
+    {
+        const Foam::label i = indices ? (*indices)[k] : k;
+        if (mask && !(*mask)[i])
+        {
+            continue;
+        }
+        const Foam::label g = group ? (*group)[i] : 0;
+        const Foam::vector md = Cf[i] - CofR;
+
+        const Foam::vector fp = rho*(p[i] - pRef)*Sf[i];
+        packed[g] += fp;
+        packed[2*nGroups + g] += md ^ fp;
+
+        if (stress)
+        {
+            const Foam::vector fv = stressScale*(Sf[i] & (*stress)[i]);
+            packed[nGroups + g] += fv;
+            packed[3*nGroups + g] += md ^ fv;
+        }
+    }
+
+    Foam::reduce(packed, Foam::sumOp<Foam::vectorField>());
+
+    forcesResult result;
+    result.pressureForce = Foam::SubField<Foam::vector>(packed, nGroups, 0);
+    result.viscousForce = Foam::SubField<Foam::vector>(packed, nGroups, nGroups);
+    result.pressureMoment = Foam::SubField<Foam::vector>(packed, nGroups, 2*nGroups);
+    result.viscousMoment = Foam::SubField<Foam::vector>(packed, nGroups, 3*nGroups);
+    if (group)
+    {
+        result.group = Foam::identity(nGroups);
+    }
+    return result;
+}
+
+template <typename T>
+Foam::boolList thresholdMask(
+    const Foam::Field<T> &values,
+    std::optional<Foam::scalar> lower = std::nullopt,
+    std::optional<Foam::scalar> upper = std::nullopt,
+    std::optional<Foam::boolList> mask = std::nullopt,
+    std::optional<Foam::labelList> indices = std::nullopt)
+{
+    // elements are selected if lower <= value <= upper (magnitude for
+    // non-scalar types) and if they are part of the existing selection
+    Foam::boolList result(values.size(), false);
+
+    const Foam::label nElements = indices ? indices->size() : values.size();
+
+    for (Foam::label k = 0; k < nElements; ++k)
+    {
+        const Foam::label i = indices ? (*indices)[k] : k;
+        if (mask && !(*mask)[i])
+        {
+            continue;
+        }
+        Foam::scalar value;
+        if constexpr (std::is_same<T, Foam::scalar>::value)
+        {
+            value = values[i];
+        }
+        else
+        {
+            value = Foam::mag(values[i]);
+        }
+        result[i] = (!lower || value >= *lower) && (!upper || value <= *upper);
+    }
+
+    return result;
+}
+
+struct cellBoundsResult
+{
+    Foam::vectorField lower;
+    Foam::vectorField upper;
+};
+
+cellBoundsResult cellBounds(const Foam::fvMesh &mesh)
+{
+    // axis-aligned bounding box of the points of every cell
+    const Foam::pointField &points = mesh.points();
+    const Foam::faceList &faces = mesh.faces();
+    const Foam::cellList &cells = mesh.cells();
+
+    cellBoundsResult result;
+    result.lower = Foam::vectorField(cells.size(), Foam::vector(Foam::GREAT, Foam::GREAT, Foam::GREAT));
+    result.upper = Foam::vectorField(cells.size(), -Foam::vector(Foam::GREAT, Foam::GREAT, Foam::GREAT));
+    forAll(cells, celli)
+    {
+        Foam::vector &lo = result.lower[celli];
+        Foam::vector &hi = result.upper[celli];
+        for (const Foam::label facei : cells[celli])
+        {
+            for (const Foam::label pointi : faces[facei])
+            {
+                lo = Foam::min(lo, points[pointi]);
+                hi = Foam::max(hi, points[pointi]);
+            }
+        }
+    }
+    return result;
+}
+
+nb::ndarray<nb::numpy, bool, nb::ndim<1>> pointsInCells(
+    const Foam::fvMesh &mesh,
+    const Foam::vectorField &points,
+    const Foam::labelList &cells)
+{
+    // inside[i]: points[i] lies inside cell cells[i] (e.g. to reject sample
+    // points in the bounding box of a non-hexahedral cell)
+    if (points.size() != cells.size())
+    {
+        throw std::invalid_argument("points and cells must have the same size");
+    }
+    bool *inside = new bool[points.size()];
+    nb::capsule owner(inside, [](void *p) noexcept { delete[] static_cast<bool *>(p); });
+    forAll(points, i)
+    {
+        inside[i] = mesh.pointInCell(points[i], cells[i], Foam::polyMesh::FACE_DIAG_TRIS);
+    }
+    return nb::ndarray<nb::numpy, bool, nb::ndim<1>>(
+        inside, {static_cast<size_t>(points.size())}, owner);
+}
+
+Foam::labelList cellZoneCells(const Foam::fvMesh &mesh, const std::string &name)
+{
+    const Foam::label zoneId = mesh.cellZones().findZoneID(name);
+    if (zoneId < 0)
+    {
+        throw std::invalid_argument("Unknown cellZone '" + name + "'");
+    }
+    Foam::labelList cells(mesh.cellZones()[zoneId]);
+    Foam::sort(cells);
+    return cells;
+}
+
+Foam::labelList cellSetCells(const Foam::fvMesh &mesh, const std::string &name)
+{
+    // reads constant/polyMesh/sets/<name> (of the processor in parallel)
+    const Foam::fileName setsDir = Foam::polyMesh::meshSubDir/"sets";
+    Foam::IOobject io(
+        name,
+        mesh.time().findInstance(mesh.dbDir()/setsDir, name, Foam::IOobject::READ_IF_PRESENT),
+        setsDir,
+        mesh,
+        Foam::IOobject::MUST_READ,
+        Foam::IOobject::NO_WRITE);
+    if (!io.typeHeaderOk<Foam::cellSet>(false))
+    {
+        throw std::invalid_argument("Unknown cellSet '" + name + "'");
+    }
+    const Foam::cellSet set(io);
+    return set.sortedToc();
+}
+
+Foam::scalarField reduceField(const Foam::scalarField &values, const std::string &op)
+{
+    // all entries are reduced in a single collective call
+    Foam::scalarField result(values);
+
+    if (op == "sum")
+    {
+        Foam::reduce(result, Foam::sumOp<Foam::scalarField>());
+    }
+    else if (op == "max")
+    {
+        Foam::reduce(result, Foam::maxOp<Foam::scalarField>());
+    }
+    else if (op == "min")
+    {
+        Foam::reduce(result, Foam::minOp<Foam::scalarField>());
+    }
+    else
+    {
+        throw std::invalid_argument("Unknown reduction '" + op + "', expected sum, max or min");
+    }
+
+    return result;
+}
+
+Foam::labelList labelListFromArray(
+    nb::ndarray<const Foam::label, nb::ndim<1>, nb::c_contig, nb::device::cpu> values)
+{
+    // copies the buffer; other integer types are converted by nanobind
+    Foam::labelList result(values.shape(0));
+    std::copy(values.data(), values.data() + values.shape(0), result.begin());
+    return result;
+}
+
+std::vector<std::string> gatherNames(const std::vector<std::string> &names)
+{
+    // sorted union of the names of all processors, e.g. to reduce per-name
+    // values element-wise although not every name exists on every processor
+    Foam::List<Foam::stringList> allNames(Foam::UPstream::nProcs());
+    Foam::stringList &localNames = allNames[Foam::UPstream::myProcNo()];
+    localNames.resize(names.size());
+    forAll(localNames, i)
+    {
+        localNames[i] = names[i];
+    }
+    Foam::Pstream::gatherList(allNames);
+    Foam::Pstream::scatterList(allNames);
+
+    std::set<std::string> unique;
+    for (const Foam::stringList &procNames : allNames)
+    {
+        for (const Foam::string &name : procNames)
+        {
+            unique.insert(name);
+        }
+    }
+    return std::vector<std::string>(unique.begin(), unique.end());
+}
+
 void Foam::bindAggregation(nb::module_ &m)
 {
 
     nb::class_<aggregationResult<scalar>>(m, "scalarAggregationResult")
         .def_ro("values", &aggregationResult<scalar>::values)
-        .def_ro("group", &aggregationResult<scalar>::group);
+        .def_ro("group", &aggregationResult<scalar>::group)
+        .def_ro("weights", &aggregationResult<scalar>::weights);
 
     nb::class_<aggregationResult<vector>>(m, "vectorAggregationResult")
         .def_ro("values", &aggregationResult<vector>::values)
-        .def_ro("group", &aggregationResult<vector>::group);
+        .def_ro("group", &aggregationResult<vector>::group)
+        .def_ro("weights", &aggregationResult<vector>::weights);
+
+    m.def("sum", &aggSum<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt, nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+    m.def("sum", &aggSum<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt, nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+
+    m.def("mean", &aggMean<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt, nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+    m.def("mean", &aggMean<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt, nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+
+    m.def("max", &aggMax<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+    m.def("max", &aggMax<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+
+    m.def("min", &aggMin<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+    m.def("min", &aggMin<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+
+    m.def("flux", &aggFlux, nb::arg("values"), nb::arg("Sf"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("indices") = std::nullopt, nb::arg("nGroups") = std::nullopt);
+
+    nb::class_<forcesResult>(m, "forcesResult")
+        .def_ro("pressureForce", &forcesResult::pressureForce)
+        .def_ro("viscousForce", &forcesResult::viscousForce)
+        .def_ro("pressureMoment", &forcesResult::pressureMoment)
+        .def_ro("viscousMoment", &forcesResult::viscousMoment)
+        .def_ro("group", &forcesResult::group);
+
+    m.def("forces", &aggForces, nb::arg("p"), nb::arg("Sf"), nb::arg("Cf"), nb::arg("CofR"), nb::arg("stress") = std::nullopt, nb::kw_only(), nb::arg("rho") = 1.0, nb::arg("pRef") = 0.0, nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::arg("indices") = std::nullopt, nb::arg("kinematicStress") = false, nb::arg("nGroups") = std::nullopt);
 
-    m.def("sum", &aggSum<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt);
-    m.def("sum", &aggSum<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt);
+    m.def("threshold", &thresholdMask<scalar>, nb::arg("values"), nb::arg("lower") = std::nullopt, nb::arg("upper") = std::nullopt, nb::kw_only(), nb::arg("mask") = std::nullopt, nb::arg("indices") = std::nullopt);
+    m.def("threshold", &thresholdMask<vector>, nb::arg("values"), nb::arg("lower") = std::nullopt, nb::arg("upper") = std::nullopt, nb::kw_only(), nb::arg("mask") = std::nullopt, nb::arg("indices") = std::nullopt);
 
-    m.def("mean", &aggMean<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt);
-    m.def("mean", &aggMean<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt, nb::kw_only(), nb::arg("scalingFactor") = std::nullopt);
+    nb::class_<cellBoundsResult>(m, "cellBoundsResult")
+        .def_ro("lower", &cellBoundsResult::lower)
+        .def_ro("upper", &cellBoundsResult::upper);
 
-    m.def("max", &aggMax<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt);
-    m.def("max", &aggMax<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt);
+    m.def("cell_bounds", &cellBounds, nb::arg("mesh"));
+    m.def("points_in_cells", &pointsInCells, nb::arg("mesh"), nb::arg("points"), nb::arg("cells"));
+    m.def("cell_zone", &cellZoneCells, nb::arg("mesh"), nb::arg("name"));
+    m.def("cell_set", &cellSetCells, nb::arg("mesh"), nb::arg("name"));
 
-    m.def("min", &aggMin<scalar>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt);
-    m.def("min", &aggMin<vector>, nb::arg("values"), nb::arg("mask") = std::nullopt, nb::arg("group") = std::nullopt);
+    m.def("label_list", &labelListFromArray, nb::arg("values"));
+    m.def("reduce", &reduceField, nb::arg("values"), nb::arg("op") = "sum");
+    m.def("gather_names", &gatherNames, nb::arg("names"));
 }
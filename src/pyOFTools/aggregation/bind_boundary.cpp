@@ -0,0 +1,128 @@
+/*---------------------------------------------------------------------------*\
+            Copyright (c) 2026, Henning Scheufler
+-------------------------------------------------------------------------------
+License
+    This file is part of the pyOFTools source code library, which is an
+    unofficial extension to OpenFOAM.
+    OpenFOAM is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    OpenFOAM is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+    You should have received a copy of the GNU General Public License
+    along with OpenFOAM.  If not, see <http://www.gnu.org/licenses/>.
+
+\*---------------------------------------------------------------------------*/
+
+#include "bind_boundary.hpp"
+
+#include "fvMesh.H"
+#include "surfaceFields.H"
+#include "volFields.H"
+
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace nb = nanobind;
+
+struct patchGeometry
+{
+    Foam::vectorField Cf;
+    Foam::vectorField Sf;
+    Foam::scalarField magSf;
+    // position of the patch of each face in the requested patch list
+    Foam::labelList patch;
+};
+
+Foam::labelList patchIds(const Foam::fvMesh &mesh, const std::vector<std::string> &patches)
+{
+    Foam::labelList ids(patches.size());
+    forAll(ids, i)
+    {
+        ids[i] = mesh.boundaryMesh().findPatchID(patches[i]);
+        if (ids[i] < 0)
+        {
+            throw std::invalid_argument("Unknown patch '" + patches[i] + "'");
+        }
+    }
+    return ids;
+}
+
+patchGeometry boundaryGeometry(const Foam::fvMesh &mesh, const std::vector<std::string> &patches)
+{
+    const Foam::labelList ids = patchIds(mesh, patches);
+
+    Foam::label nFaces = 0;
+    for (const Foam::label patchi : ids)
+    {
+        nFaces += mesh.boundary()[patchi].size();
+    }
+
+    patchGeometry result;
+    result.Cf.setSize(nFaces);
+    result.Sf.setSize(nFaces);
+    result.magSf.setSize(nFaces);
+    result.patch.setSize(nFaces);
+
+    Foam::label start = 0;
+    forAll(ids, i)
+    {
+        const Foam::fvPatch &p = mesh.boundary()[ids[i]];
+        Foam::SubList<Foam::vector>(result.Cf, p.size(), start) = p.Cf();
+        Foam::SubList<Foam::vector>(result.Sf, p.size(), start) = p.Sf();
+        Foam::SubList<Foam::scalar>(result.magSf, p.size(), start) = p.magSf();
+        Foam::SubList<Foam::label>(result.patch, p.size(), start) = i;
+        start += p.size();
+    }
+
+    return result;
+}
+
+template <class Type, template <class> class PatchField, class GeoMesh>
+Foam::Field<Type> boundaryValues(
+    const Foam::GeometricField<Type, PatchField, GeoMesh> &field,
+    const std::vector<std::string> &patches)
+{
+    const Foam::labelList ids = patchIds(field.mesh(), patches);
+
+    Foam::label nFaces = 0;
+    for (const Foam::label patchi : ids)
+    {
+        nFaces += field.boundaryField()[patchi].size();
+    }
+
+    Foam::Field<Type> result(nFaces);
+    Foam::label start = 0;
+    for (const Foam::label patchi : ids)
+    {
+        const PatchField<Type> &pf = field.boundaryField()[patchi];
+        Foam::SubList<Type>(result, pf.size(), start) = pf;
+        start += pf.size();
+    }
+
+    return result;
+}
+
+void Foam::bindBoundary(nb::module_ &m)
+{
+    nb::class_<patchGeometry>(m, "patchGeometry")
+        .def_ro("Cf", &patchGeometry::Cf)
+        .def_ro("Sf", &patchGeometry::Sf)
+        .def_ro("magSf", &patchGeometry::magSf)
+        .def_ro("patch", &patchGeometry::patch);
+
+    m.def("boundary_geometry", &boundaryGeometry, nb::arg("mesh"), nb::arg("patches"));
+
+    m.def("boundary_values", &boundaryValues<scalar, fvPatchField, volMesh>, nb::arg("field"), nb::arg("patches"));
+    m.def("boundary_values", &boundaryValues<vector, fvPatchField, volMesh>, nb::arg("field"), nb::arg("patches"));
+    m.def("boundary_values", &boundaryValues<symmTensor, fvPatchField, volMesh>, nb::arg("field"), nb::arg("patches"));
+    // face fluxes such as phi
+    m.def("boundary_values", &boundaryValues<scalar, fvsPatchField, surfaceMesh>, nb::arg("field"), nb::arg("patches"));
+}
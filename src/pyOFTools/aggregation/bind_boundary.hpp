@@ -0,0 +1,39 @@
+/*---------------------------------------------------------------------------*\
+            Copyright (c) 2026, Henning Scheufler
+-------------------------------------------------------------------------------
+License
+    This file is part of the pyOFTools source code library, which is an
+    unofficial extension to OpenFOAM.
+    OpenFOAM is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    OpenFOAM is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+    You should have received a copy of the GNU General Public License
+    along with OpenFOAM.  If not, see <http://www.gnu.org/licenses/>.
+
+Description
+    Direct access to the boundary faces and boundary field values of a set
+    of patches, concatenated in the order of the patches.
+
+\*---------------------------------------------------------------------------*/
+
+#ifndef bind_boundary_hpp
+#define bind_boundary_hpp
+
+// System includes
+#include <nanobind/nanobind.h>
+
+namespace nb = nanobind;
+
+namespace Foam
+{
+
+void bindBoundary(nb::module_& m);
+
+}
+
+#endif
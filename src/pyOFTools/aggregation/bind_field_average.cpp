@@ -0,0 +1,212 @@
+/*---------------------------------------------------------------------------*\
+            Copyright (c) 2026, Henning Scheufler
+-------------------------------------------------------------------------------
+License
+    This file is part of the pyOFTools source code library, which is an
+    unofficial extension to OpenFOAM.
+    OpenFOAM is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    OpenFOAM is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+    You should have received a copy of the GNU General Public License
+    along with OpenFOAM.  If not, see <http://www.gnu.org/licenses/>.
+
+\*---------------------------------------------------------------------------*/
+
+#include "bind_field_average.hpp"
+
+#include "IOdictionary.H"
+#include "fvMesh.H"
+#include "volFields.H"
+
+#include <nanobind/stl/string.h>
+
+namespace nb = nanobind;
+
+// Time-weighted running mean and variance (West's weighted Welford update):
+//     W' = W + dt,  delta = x - mean
+//     mean' = mean + dt/W' delta
+//     prime2Mean' = W/W' (prime2Mean + dt/W' sqr(delta))
+// One pass over the values, no temporaries.
+template <class Type, class Type2>
+void updateAverage(
+    const Foam::Field<Type> &values,
+    Foam::Field<Type> &mean,
+    Foam::Field<Type2> *prime2Mean,
+    const Foam::scalar a,
+    const Foam::scalar b)
+{
+    if (prime2Mean)
+    {
+        Foam::Field<Type2> &p2 = *prime2Mean;
+        forAll(values, i)
+        {
+            const Type delta = values[i] - mean[i];
+            mean[i] += a*delta;
+            p2[i] = b*(p2[i] + a*Foam::sqr(delta));
+        }
+    }
+    else
+    {
+        forAll(values, i)
+        {
+            mean[i] += a*(values[i] - mean[i]);
+        }
+    }
+}
+
+// Registered field <name>; read from the current time directory if present
+// (restart), otherwise created with zero values
+template <class Type>
+Foam::GeometricField<Type, Foam::fvPatchField, Foam::volMesh> &lookupOrCreate(
+    const Foam::fvMesh &mesh, const Foam::word &name, const Foam::dimensionSet &dims)
+{
+    typedef Foam::GeometricField<Type, Foam::fvPatchField, Foam::volMesh> fieldType;
+
+    if (mesh.foundObject<fieldType>(name))
+    {
+        return mesh.lookupObjectRef<fieldType>(name);
+    }
+
+    Foam::IOobject io(
+        name, mesh.time().timeName(), mesh, Foam::IOobject::MUST_READ, Foam::IOobject::AUTO_WRITE);
+
+    fieldType *fieldPtr = nullptr;
+    if (io.typeHeaderOk<fieldType>(true))
+    {
+        fieldPtr = new fieldType(io, mesh);
+    }
+    else
+    {
+        io.readOpt(Foam::IOobject::NO_READ);
+        fieldPtr = new fieldType(io, mesh, Foam::dimensioned<Type>(dims, Foam::Zero));
+    }
+    // owned by the registry, written at the write times of the run
+    fieldPtr->store();
+    return *fieldPtr;
+}
+
+template <class Type, class Type2>
+class fieldAverage
+{
+public:
+    typedef Foam::GeometricField<Type, Foam::fvPatchField, Foam::volMesh> fieldType;
+    typedef Foam::GeometricField<Type2, Foam::fvPatchField, Foam::volMesh> prime2MeanType;
+
+    fieldAverage(const fieldType &field, bool prime2Mean)
+    :
+        field_(field),
+        mean_(lookupOrCreate<Type>(field.mesh(), field.name() + "Mean", field.dimensions())),
+        prime2Mean_(
+            prime2Mean
+          ? &lookupOrCreate<Type2>(
+                field.mesh(), field.name() + "Prime2Mean", Foam::sqr(field.dimensions()))
+          : nullptr),
+        properties_(nullptr),
+        timeIndex_(-1)
+    {
+        const Foam::fvMesh &mesh = field.mesh();
+        const Foam::word name = field.name() + "AverageProperties";
+        if (mesh.foundObject<Foam::IOdictionary>(name))
+        {
+            properties_ = &mesh.lookupObjectRef<Foam::IOdictionary>(name);
+        }
+        else
+        {
+            // averaging time of the checkpointed means in <time>/uniform
+            properties_ = new Foam::IOdictionary(Foam::IOobject(
+                name,
+                mesh.time().timeName(),
+                "uniform",
+                mesh,
+                Foam::IOobject::READ_IF_PRESENT,
+                Foam::IOobject::AUTO_WRITE));
+            properties_->store();
+        }
+        totalTime_ = properties_->getOrDefault<Foam::scalar>("totalTime", 0);
+    }
+
+    // Add the current values of the field; called once per time step
+    bool update()
+    {
+        const Foam::Time &runTime = field_.time();
+        if (runTime.timeIndex() == timeIndex_)
+        {
+            return false;
+        }
+        timeIndex_ = runTime.timeIndex();
+
+        const Foam::scalar dt = runTime.deltaTValue();
+        const Foam::scalar W = totalTime_ + dt;
+        const Foam::scalar a = dt/W;
+        const Foam::scalar b = totalTime_/W;
+
+        updateAverage<Type, Type2>(
+            field_.primitiveField(),
+            mean_.primitiveFieldRef(),
+            prime2Mean_ ? &prime2Mean_->primitiveFieldRef() : nullptr,
+            a,
+            b);
+
+        auto &meanBf = mean_.boundaryFieldRef();
+        forAll(meanBf, patchi)
+        {
+            updateAverage<Type, Type2>(
+                field_.boundaryField()[patchi],
+                meanBf[patchi],
+                prime2Mean_ ? &prime2Mean_->boundaryFieldRef()[patchi] : nullptr,
+                a,
+                b);
+        }
+
+        totalTime_ = W;
+        properties_->set("totalTime", totalTime_);
+        return true;
+    }
+
+    Foam::scalar totalTime() const
+    {
+        return totalTime_;
+    }
+
+    fieldType &mean()
+    {
+        return mean_;
+    }
+
+    prime2MeanType *prime2Mean()
+    {
+        return prime2Mean_;
+    }
+
+private:
+    const fieldType &field_;
+    fieldType &mean_;
+    prime2MeanType *prime2Mean_;
+    Foam::IOdictionary *properties_;
+    Foam::scalar totalTime_;
+    Foam::label timeIndex_;
+};
+
+template <class Type, class Type2>
+void bindFieldAverageType(nb::module_ &m, const char *name)
+{
+    typedef fieldAverage<Type, Type2> averageType;
+
+    nb::class_<averageType>(m, name)
+        .def(nb::init<const typename averageType::fieldType &, bool>(), nb::arg("field"), nb::arg("prime2Mean") = false, nb::keep_alive<1, 2>())
+        .def("update", &averageType::update)
+        .def_prop_ro("total_time", &averageType::totalTime)
+        .def("mean", &averageType::mean, nb::rv_policy::reference)
+        .def("prime2Mean", &averageType::prime2Mean, nb::rv_policy::reference);
+}
+
+void Foam::bindFieldAverage(nb::module_ &m)
+{
+    bindFieldAverageType<scalar, scalar>(m, "scalarFieldAverage");
+    bindFieldAverageType<vector, symmTensor>(m, "vectorFieldAverage");
+}
@@ -0,0 +1,40 @@
+/*---------------------------------------------------------------------------*\
+            Copyright (c) 2026, Henning Scheufler
+-------------------------------------------------------------------------------
+License
+    This file is part of the pyOFTools source code library, which is an
+    unofficial extension to OpenFOAM.
+    OpenFOAM is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    OpenFOAM is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+    You should have received a copy of the GNU General Public License
+    along with OpenFOAM.  If not, see <http://www.gnu.org/licenses/>.
+
+Description
+    Running time averages (mean and prime2Mean) of volume fields, updated in
+    place once per time step and registered as <field>Mean and
+    <field>Prime2Mean in the object registry of the mesh.
+
+\*---------------------------------------------------------------------------*/
+
+#ifndef bind_field_average_hpp
+#define bind_field_average_hpp
+
+// System includes
+#include <nanobind/nanobind.h>
+
+namespace nb = nanobind;
+
+namespace Foam
+{
+
+void bindFieldAverage(nb::module_& m);
+
+}
+
+#endif
@@ -0,0 +1,244 @@
+/*---------------------------------------------------------------------------*\
+            Copyright (c) 2026, Henning Scheufler
+-------------------------------------------------------------------------------
+License
+    This file is part of the pyOFTools source code library, which is an
+    unofficial extension to OpenFOAM.
+    OpenFOAM is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    OpenFOAM is distributed in the hope that it will be useful, but WITHOUT
+    ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+    FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+    for more details.
+    You should have received a copy of the GNU General Public License
+    along with OpenFOAM.  If not, see <http://www.gnu.org/licenses/>.
+
+\*---------------------------------------------------------------------------*/
+
+#include "bind_residuals.hpp"
+
+#include "DynamicList.H"
+#include "SolverPerformance.H"
+#include "fvMesh.H"
+#include "volFields.H"
+
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace nb = nanobind;
+
+// One row per field, inner iteration and component (component -1: maximum
+// over the components)
+struct solverPerformanceTable
+{
+    std::vector<std::string> field;
+    std::vector<std::string> solver;
+    Foam::labelList iteration;
+    Foam::labelList component;
+    Foam::scalarField initialResidual;
+    Foam::scalarField finalResidual;
+    Foam::labelList nIterations;
+};
+
+// Columns collected while reading the dictionary
+struct solverPerformanceColumns
+{
+    std::vector<std::string> field;
+    std::vector<std::string> solver;
+    Foam::DynamicList<Foam::label> iteration;
+    Foam::DynamicList<Foam::label> component;
+    Foam::DynamicList<Foam::scalar> initialResidual;
+    Foam::DynamicList<Foam::scalar> finalResidual;
+    Foam::DynamicList<Foam::label> nIterations;
+
+    void append(
+        const std::string &fieldName,
+        const std::string &solverName,
+        const Foam::label iter,
+        const Foam::label cmpt,
+        const Foam::scalar initial,
+        const Foam::scalar finalRes,
+        const Foam::label nIters)
+    {
+        field.push_back(fieldName);
+        solver.push_back(solverName);
+        iteration.append(iter);
+        component.append(cmpt);
+        initialResidual.append(initial);
+        finalResidual.append(finalRes);
+        nIterations.append(nIters);
+    }
+};
+
+// Append the solver performance entries of field `name` as Type
+template <class Type>
+void appendEntries(
+    const Foam::dictionary &dict,
+    const Foam::word &name,
+    const bool components,
+    solverPerformanceColumns &columns)
+{
+    const Foam::List<Foam::SolverPerformance<Type>> performances(dict.lookup(name));
+    const Foam::direction nCmpts = Foam::pTraits<Type>::nComponents;
+
+    forAll(performances, iter)
+    {
+        const Foam::SolverPerformance<Type> &sp = performances[iter];
+        const std::string solverName = sp.solverName();
+
+        if (components)
+        {
+            for (Foam::direction d = 0; d < nCmpts; ++d)
+            {
+                columns.append(
+                    name,
+                    solverName,
+                    iter,
+                    d,
+                    Foam::component(sp.initialResidual(), d),
+                    Foam::component(sp.finalResidual(), d),
+                    Foam::component(sp.nIterations(), d));
+            }
+            continue;
+        }
+
+        Foam::scalar initial = -Foam::GREAT;
+        Foam::scalar finalRes = -Foam::GREAT;
+        Foam::label nIters = 0;
+        for (Foam::direction d = 0; d < nCmpts; ++d)
+        {
+            initial = Foam::max(initial, Foam::component(sp.initialResidual(), d));
+            finalRes = Foam::max(finalRes, Foam::component(sp.finalResidual(), d));
+            nIters = Foam::max(nIters, Foam::component(sp.nIterations(), d));
+        }
+        columns.append(name, solverName, iter, -1, initial, finalRes, nIters);
+    }
+}
+
+// Append the entries of field `name` if it is a registered field of Type;
+// the type is taken from the registry instead of probing the stream
+template <class Type>
+bool appendPerformance(
+    const Foam::fvMesh &mesh,
+    const Foam::dictionary &dict,
+    const Foam::word &name,
+    const bool components,
+    solverPerformanceColumns &columns)
+{
+    typedef Foam::GeometricField<Type, Foam::fvPatchField, Foam::volMesh> fieldType;
+    if (!mesh.foundObject<fieldType>(name))
+    {
+        return false;
+    }
+    appendEntries<Type>(dict, name, components, columns);
+    return true;
+}
+
+// Number of components of the residuals of a solver performance entry, taken
+// from the tokens of its first element "(solver field residual ...)": the
+// residual is a number (scalar) or a list of 3, 6 or 9 numbers. 0 if unknown.
+Foam::label entryComponents(const Foam::ITstream &is)
+{
+    Foam::label nWords = 0;
+    for (Foam::label i = 0; i < is.size(); ++i)
+    {
+        if (nWords < 2)
+        {
+            nWords += is[i].isWord() || is[i].isString();
+            continue;
+        }
+        if (is[i].isNumber())
+        {
+            return 1;
+        }
+        if (is[i].isPunctuation(Foam::token::BEGIN_LIST))
+        {
+            Foam::label nCmpts = 0;
+            for (++i; i < is.size() && is[i].isNumber(); ++i)
+            {
+                ++nCmpts;
+            }
+            return nCmpts;
+        }
+        return 0;
+    }
+    return 0;
+}
+
+solverPerformanceTable solverPerformance(const Foam::fvMesh &mesh, const bool components)
+{
+    const Foam::dictionary &dict = mesh.solverPerformanceDict();
+
+    solverPerformanceColumns columns;
+    for (const Foam::word &name : dict.toc())
+    {
+        if (appendPerformance<Foam::scalar>(mesh, dict, name, components, columns))
+        {
+            continue;
+        }
+        if (appendPerformance<Foam::vector>(mesh, dict, name, components, columns))
+        {
+            continue;
+        }
+        if (appendPerformance<Foam::symmTensor>(mesh, dict, name, components, columns))
+        {
+            continue;
+        }
+        if (appendPerformance<Foam::tensor>(mesh, dict, name, components, columns))
+        {
+            continue;
+        }
+
+        // not a registered field (e.g. solved by a function object or a
+        // region solver): detect the type from the entry
+        switch (entryComponents(dict.lookup(name)))
+        {
+            case 1:
+                appendEntries<Foam::scalar>(dict, name, components, columns);
+                break;
+            case 3:
+                appendEntries<Foam::vector>(dict, name, components, columns);
+                break;
+            case 6:
+                appendEntries<Foam::symmTensor>(dict, name, components, columns);
+                break;
+            case 9:
+                appendEntries<Foam::tensor>(dict, name, components, columns);
+                break;
+            default:
+                WarningInFunction
+                    << "Skipping solver performance entry " << name
+                    << " of unknown type" << Foam::endl;
+        }
+    }
+
+    solverPerformanceTable table;
+    table.field = std::move(columns.field);
+    table.solver = std::move(columns.solver);
+    table.iteration.transfer(columns.iteration);
+    table.component.transfer(columns.component);
+    table.initialResidual.transfer(columns.initialResidual);
+    table.finalResidual.transfer(columns.finalResidual);
+    table.nIterations.transfer(columns.nIterations);
+    return table;
+}
+
+void Foam::bindResiduals(nb::module_ &m)
+{
+    nb::class_<solverPerformanceTable>(m, "solverPerformanceTable")
+        .def_ro("field", &solverPerformanceTable::field)
+        .def_ro("solver", &solverPerformanceTable::solver)
+        .def_ro("iteration", &solverPerformanceTable::iteration)
+        .def_ro("component", &solverPerformanceTable::component)
+        .def_ro("initialResidual", &solverPerformanceTable::initialResidual)
+        .def_ro("finalResidual", &solverPerformanceTable::finalResidual)
+        .def_ro("nIterations", &solverPerformanceTable::nIterations);
+
+    m.def("solver_performance", &solverPerformance, nb::arg("mesh"), nb::arg("components") = false);
+}
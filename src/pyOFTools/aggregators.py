@@ -1,10 +1,18 @@
 from typing import Literal, Optional, Union
 
+from pybFoam import scalarField
 from pydantic import BaseModel
 
 from pyOFTools import aggregation
 
-from .datasets import AggregatedData, AggregatedDataSet, DataSets, InternalDataSet, SurfaceDataSet
+from .datasets import (
+    AggregatedData,
+    AggregatedDataSet,
+    DataSets,
+    InternalDataSet,
+    PatchDataSet,
+    SurfaceDataSet,
+)
 from .node import Node
 
 
@@ -16,12 +24,15 @@ def _compute_agg_data(
     group_names = None
     if group:
         group_names = ["group"]
+    # only the means report weights
+    weights = list(agg_res.weights) if len(agg_res.weights) else None
     for i, val in enumerate(agg_res.values):
         agg_data.append(
             AggregatedData(
                 value=val,
                 group=[group[i]] if group else None,
                 group_name=group_names if group_names else None,
+                weight=weights[i] if weights else None,
             )
         )
 
@@ -34,13 +45,17 @@ class Sum(BaseModel):
     name: Optional[str] = None
 
     def compute(self, dataset: DataSets) -> AggregatedDataSet:
-        agg_res = aggregation.sum(dataset.field, dataset.mask, dataset.groups)  # type: ignore[union-attr, attr-defined]
+        agg_res = aggregation.sum(  # type: ignore[attr-defined]
+            dataset.field, dataset.mask, dataset.groups, indices=dataset.indices,  # type: ignore[union-attr]
+            nGroups=dataset.n_groups,  # type: ignore[union-attr]
+        )
 
         agg_data = _compute_agg_data(agg_res)
 
         return AggregatedDataSet(
             name=f"{self.name or f'{dataset.name}_sum'}",
             values=agg_data,
+            combine="sum",
         )
 
 
@@ -55,6 +70,8 @@ class VolIntegrate(BaseModel):
             dataset.mask,
             dataset.groups,
             scalingFactor=dataset.geometry.volumes,
+            indices=dataset.indices,
+            nGroups=dataset.n_groups,
         )
 
         agg_data = _compute_agg_data(agg_res)
@@ -62,6 +79,7 @@ class VolIntegrate(BaseModel):
         return AggregatedDataSet(
             name=f"{self.name or f'{dataset.name}_volIntegrate'}",
             values=agg_data,
+            combine="sum",
         )
 
 
@@ -70,12 +88,14 @@ class SurfIntegrate(BaseModel):
     type: Literal["surfIntegrate"] = "surfIntegrate"
     name: Optional[str] = None
 
-    def compute(self, dataset: SurfaceDataSet) -> AggregatedDataSet:
+    def compute(self, dataset: Union[SurfaceDataSet, PatchDataSet]) -> AggregatedDataSet:
         agg_res = aggregation.sum(  # type: ignore[attr-defined]
             dataset.field,
             dataset.mask,
             dataset.groups,
             scalingFactor=dataset.geometry.face_area_magnitudes,
+            indices=dataset.indices,
+            nGroups=dataset.n_groups,
         )
 
         agg_data = _compute_agg_data(agg_res)
@@ -83,6 +103,73 @@ class SurfIntegrate(BaseModel):
         return AggregatedDataSet(
             name=f"{self.name or f'{dataset.name}_volIntegrate'}",
             values=agg_data,
+            combine="sum",
+        )
+
+
+@Node.register()
+class FluxIntegrate(BaseModel):
+    """
+    Flux of a vector field through a surface or patch: sum of ``field & Sf``.
+
+    A scalar field is taken as face fluxes (e.g. the boundary values of
+    ``phi``) and summed directly.
+    """
+
+    type: Literal["fluxIntegrate"] = "fluxIntegrate"
+    name: Optional[str] = None
+
+    def compute(self, dataset: Union[SurfaceDataSet, PatchDataSet]) -> AggregatedDataSet:
+        if isinstance(dataset.field, scalarField):
+            agg_res = aggregation.sum(  # type: ignore[attr-defined]
+                dataset.field,
+                dataset.mask,
+                dataset.groups,
+                indices=dataset.indices,
+                nGroups=dataset.n_groups,
+            )
+        else:
+            agg_res = aggregation.flux(  # type: ignore[attr-defined]
+                dataset.field,
+                dataset.geometry.face_areas,
+                dataset.mask,
+                dataset.groups,
+                indices=dataset.indices,
+                nGroups=dataset.n_groups,
+            )
+
+        agg_data = _compute_agg_data(agg_res)
+
+        return AggregatedDataSet(
+            name=f"{self.name or f'{dataset.name}_flux'}",
+            values=agg_data,
+            combine="sum",
+        )
+
+
+@Node.register()
+class AreaMean(BaseModel):
+    """Area-weighted mean over the faces of a surface or patch dataset."""
+
+    type: Literal["areaMean"] = "areaMean"
+    name: Optional[str] = None
+
+    def compute(self, dataset: Union[SurfaceDataSet, PatchDataSet]) -> AggregatedDataSet:
+        agg_res = aggregation.mean(  # type: ignore[attr-defined]
+            dataset.field,
+            dataset.mask,
+            dataset.groups,
+            scalingFactor=dataset.geometry.face_area_magnitudes,
+            indices=dataset.indices,
+            nGroups=dataset.n_groups,
+        )
+
+        agg_data = _compute_agg_data(agg_res)
+
+        return AggregatedDataSet(
+            name=f"{self.name or f'{dataset.name}_areaMean'}",
+            values=agg_data,
+            combine="mean",
         )
 
 
@@ -92,13 +179,17 @@ class Mean(BaseModel):
     name: Optional[str] = None
 
     def compute(self, dataset: DataSets) -> AggregatedDataSet:
-        res_mean = aggregation.mean(dataset.field, dataset.mask, dataset.groups)  # type: ignore[union-attr, attr-defined]
+        res_mean = aggregation.mean(  # type: ignore[attr-defined]
+            dataset.field, dataset.mask, dataset.groups, indices=dataset.indices,  # type: ignore[union-attr]
+            nGroups=dataset.n_groups,  # type: ignore[union-attr]
+        )
 
         agg_data = _compute_agg_data(res_mean)
 
         return AggregatedDataSet(
             name=f"{self.name or f'{dataset.name}_mean'}",
             values=agg_data,
+            combine="mean",
         )
 
 
@@ -108,13 +199,17 @@ class Max(BaseModel):
     name: Optional[str] = None
 
     def compute(self, dataset: DataSets) -> AggregatedDataSet:
-        agg_res = aggregation.max(dataset.field, dataset.mask, dataset.groups)  # type: ignore[union-attr, attr-defined]
+        agg_res = aggregation.max(  # type: ignore[attr-defined]
+            dataset.field, dataset.mask, dataset.groups, indices=dataset.indices,  # type: ignore[union-attr]
+            nGroups=dataset.n_groups,  # type: ignore[union-attr]
+        )
 
         agg_data = _compute_agg_data(agg_res)
 
         return AggregatedDataSet(
             name=f"{self.name or f'{dataset.name}_max'}",
             values=agg_data,
+            combine="max",
         )
 
 
@@ -124,11 +219,15 @@ class Min(BaseModel):
     name: Optional[str] = None
 
     def compute(self, dataset: DataSets) -> AggregatedDataSet:
-        agg_res = aggregation.min(dataset.field, dataset.mask, dataset.groups)  # type: ignore[union-attr, attr-defined]
+        agg_res = aggregation.min(  # type: ignore[attr-defined]
+            dataset.field, dataset.mask, dataset.groups, indices=dataset.indices,  # type: ignore[union-attr]
+            nGroups=dataset.n_groups,  # type: ignore[union-attr]
+        )
 
         agg_data = _compute_agg_data(agg_res)
 
         return AggregatedDataSet(
             name=f"{self.name or f'{dataset.name}_min'}",
             values=agg_data,
+            combine="min",
         )
@@ -23,4 +23,6 @@ class Directional(Node):
         np_dist = np.asarray(distance)
         inds = np.digitize(np_dist, np.array(self.bins))
         dataset.groups = labelList([int(g) for g in inds])  # type: ignore[union-attr]
+        # all bins, also those empty on this processor
+        dataset.n_groups = len(self.bins) + 1  # type: ignore[union-attr]
         return dataset
@@ -5,7 +5,11 @@ This module provides high-level functions for creating workflows from
 OpenFOAM fields, surfaces, and lines.
 
 Geometry builders:
-    - ``field(mesh, name)`` --- volume field
+    - ``field(mesh, name)`` --- volume field (also running averages such as
+      ``pMean``, see :mod:`pyOFTools.field_average`)
+    - ``patch(mesh, name, patches)`` --- boundary values of a volume field
+    - ``forces(mesh, patches, CofR)`` --- pressure and viscous forces on patches
+    - ``flux(mesh, patches)`` --- face fluxes ``phi`` on patches
     - ``iso_surface(mesh, iso_field, iso_value)`` --- iso-surface (geometry only)
     - ``plane(mesh, point, normal)`` --- cutting plane (geometry only)
     - ``line(mesh, name, start, end, n, field_name)`` --- line sample
@@ -13,27 +17,32 @@ Geometry builders:
 Field selection nodes (used with ``|``):
     - ``area()`` --- face area magnitudes from surface geometry
     - ``sample(mesh, field_name)`` --- interpolate a volume field onto a surface
+      (``field_type="vector"`` for vector fields)
 
 Example::
 
     iso_surface(mesh, "alpha.water", 0.5) | area() | Sum()
     iso_surface(mesh, "alpha.water", 0.5) | sample(mesh, "p") | Mean()
     plane(mesh, point=(0.5,0,0), normal=(1,0,0)) | sample(mesh, "T") | Max()
+    plane(mesh, (0.5,0,0), (1,0,0)) | sample(mesh, "U", field_type="vector") | FluxIntegrate()
+    flux(mesh, ["outlet"]) | FluxIntegrate()
     field(mesh, "p") | VolIntegrate()
+    patch(mesh, "p", ["inlet", "outlet"]) | AreaMean()
     line(mesh, "centreline", (0,0,0), (1,0,0), 100, "p") | Mean()
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Literal, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Literal, Optional, Tuple, Union
 
-from pybFoam import volScalarField
+from pybFoam import volScalarField, volVectorField
 from pydantic import BaseModel
 
 # Import aggregators to populate Node registry
 from . import aggregators  # noqa: F401
-from .datasets import InternalDataSet, SurfaceDataSet
-from .geometry import FvMeshInternalAdapter
+from .datasets import InternalDataSet, PatchDataSet, SurfaceDataSet
+from .field_loader import lookup_field
+from .geometry import FvMeshBoundaryAdapter, FvMeshInternalAdapter
 from .interpolation import SurfaceInterpolator
 from .node import Node
 from .residuals import residual_dataset
@@ -48,8 +57,11 @@ if TYPE_CHECKING:
 __all__ = [
     "area",
     "field",
+    "flux",
+    "forces",
     "iso_surface",
     "line",
+    "patch",
     "plane",
     "residuals",
     "sample",
@@ -82,12 +94,14 @@ class Sample(BaseModel):
     mesh: Any  # fvMesh
     field_name: str
     scheme: str = "cellPoint"
+    field_type: Literal["scalar", "vector"] = "scalar"
     model_config = {"arbitrary_types_allowed": True}
 
     def compute(self, dataset: DataSets) -> DataSets:
         if not isinstance(dataset, SurfaceDataSet):
             raise TypeError(f"sample() requires a SurfaceDataSet, got {type(dataset).__name__}")
-        vf = volScalarField.from_registry(self.mesh, self.field_name)
+        geo_field_type = volVectorField if self.field_type == "vector" else volScalarField
+        vf = lookup_field(self.mesh, geo_field_type, self.field_name)
         interp = SurfaceInterpolator(scheme=self.scheme)  # type: ignore[arg-type]
         dataset.field = interp.interpolate(vf, dataset.geometry._surface)  # type: ignore[attr-defined]
         return dataset
@@ -103,7 +117,12 @@ def area() -> Area:
     return Area()
 
 
-def sample(mesh: fvMesh, field_name: str, scheme: str = "cellPoint") -> Sample:
+def sample(
+    mesh: fvMesh,
+    field_name: str,
+    scheme: str = "cellPoint",
+    field_type: Literal["scalar", "vector"] = "scalar",
+) -> Sample:
     """Interpolate a volume field onto a surface.
 
     Use in a pipe after a surface builder::
@@ -114,8 +133,9 @@ def sample(mesh: fvMesh, field_name: str, scheme: str = "cellPoint") -> Sample:
         mesh: OpenFOAM mesh object
         field_name: Name of the volume field to sample
         scheme: Interpolation scheme (default: "cellPoint")
+        field_type: Type of the volume field, "scalar" or "vector"
     """
-    return Sample(mesh=mesh, field_name=field_name, scheme=scheme)
+    return Sample(mesh=mesh, field_name=field_name, scheme=scheme, field_type=field_type)
 
 
 # ---------------------------------------------------------------------------
@@ -123,20 +143,25 @@ def sample(mesh: fvMesh, field_name: str, scheme: str = "cellPoint") -> Sample:
 # ---------------------------------------------------------------------------
 
 
-def field(mesh: fvMesh, name: str) -> Any:  # WorkFlow
-    """Create a WorkFlow from a registered volScalarField.
+def field(
+    mesh: fvMesh, name: str, field_type: Literal["scalar", "vector"] = "scalar"
+) -> Any:  # WorkFlow
+    """Create a WorkFlow from a registered volume field.
 
     Args:
         mesh: OpenFOAM mesh object
         name: Name of the field in the object registry
+        field_type: Type of the volume field, "scalar" or "vector"
 
     Example::
 
         field(mesh, "alpha.water") | VolIntegrate()
+        field(mesh, "UMean", field_type="vector") | Max()
     """
     from .workflow import WorkFlow
 
-    vf = volScalarField.from_registry(mesh, name)
+    geo_field_type = volVectorField if field_type == "vector" else volScalarField
+    vf = lookup_field(mesh, geo_field_type, name)
     return WorkFlow(  # type: ignore[misc]
         initial_dataset=InternalDataSet(
             name=name,
@@ -146,6 +171,123 @@ def field(mesh: fvMesh, name: str) -> Any:  # WorkFlow
     )
 
 
+def patch(
+    mesh: fvMesh, name: str, patches: List[str], per_patch: bool = False
+) -> Any:  # WorkFlow
+    """Create a WorkFlow from the boundary values of a registered volScalarField.
+
+    The values are read directly from the boundary field (no sampling). The
+    faces of all patches form one dataset, so area-weighted means and
+    integrals over several patches are computed in a single pass.
+
+    Args:
+        mesh: OpenFOAM mesh object
+        name: Name of the field in the object registry
+        patches: Names of the patches
+        per_patch: Group the faces by patch (group i is ``patches[i]``)
+
+    Example::
+
+        patch(mesh, "p", ["inlet", "outlet"], per_patch=True) | AreaMean()
+        patch(mesh, "wallHeatFlux", ["walls"]) | SurfIntegrate()
+    """
+    from . import aggregation
+    from .workflow import WorkFlow
+
+    vf = lookup_field(mesh, volScalarField, name)
+    geometry = FvMeshBoundaryAdapter(mesh, patches)
+    return WorkFlow(  # type: ignore[misc]
+        initial_dataset=PatchDataSet(
+            name=name,
+            field=aggregation.boundary_values(vf, geometry.patches),  # type: ignore[attr-defined]
+            geometry=geometry,
+            groups=geometry.patch_ids if per_patch else None,
+            n_groups=len(patches) if per_patch else None,
+        )
+    )
+
+
+def flux(mesh: fvMesh, patches: List[str], phi: str = "phi", per_patch: bool = False) -> Any:
+    """Create a WorkFlow from the face fluxes of a surfaceScalarField on patches.
+
+    The boundary values of ``phi`` are used directly, so no interpolation is
+    needed. Pipe into ``FluxIntegrate()`` for the flow rate through the
+    patches (positive for outflow)::
+
+        flux(mesh, ["outlet"]) | FluxIntegrate()
+
+    For cutting planes sample the velocity instead::
+
+        cut = plane(mesh, (0.5, 0, 0), (1, 0, 0))
+        cut | sample(mesh, "U", field_type="vector") | FluxIntegrate()
+
+    Args:
+        mesh: OpenFOAM mesh object
+        patches: Names of the patches
+        phi: Name of the face flux field in the object registry
+        per_patch: Group the faces by patch (group i is ``patches[i]``)
+    """
+    from pybFoam import surfaceScalarField
+
+    from . import aggregation
+    from .workflow import WorkFlow
+
+    phi_field = lookup_field(mesh, surfaceScalarField, phi)
+    geometry = FvMeshBoundaryAdapter(mesh, patches)
+    return WorkFlow(  # type: ignore[misc]
+        initial_dataset=PatchDataSet(
+            name=phi,
+            field=aggregation.boundary_values(phi_field, geometry.patches),  # type: ignore[attr-defined]
+            geometry=geometry,
+            groups=geometry.patch_ids if per_patch else None,
+            n_groups=len(patches) if per_patch else None,
+        )
+    )
+
+
+def forces(
+    mesh: fvMesh,
+    patches: List[str],
+    CofR: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+    p: str = "p",
+    rho: Optional[float] = None,
+    pRef: float = 0.0,
+    viscous: bool = True,
+    stress_field: Optional[str] = None,
+    bins: Optional[List[float]] = None,
+    direction: Tuple[float, float, float] = (1.0, 0.0, 0.0),
+) -> Any:  # WorkFlow
+    """Create a WorkFlow for the forces and moments on patches.
+
+    Args:
+        mesh: OpenFOAM mesh object
+        patches: Names of the patches
+        CofR: Centre of rotation for the moments
+        p: Name of the pressure field
+        rho: Reference density for a kinematic pressure and stress; None if
+            they are in Pa
+        pRef: Reference pressure in Pa (divided by ``rho`` for a kinematic pressure)
+        viscous: Include the viscous forces
+        stress_field: Name of a registered volSymmTensorField with the
+            effective deviatoric stress (default: from the turbulence model)
+        bins: Bin edges along ``direction`` (optional)
+        direction: Direction of the bins
+
+    Example::
+
+        forces(mesh, ["hull"], CofR=(0, 0, 0), rho=1000.0)
+    """
+    from .binning import Directional
+    from .forces import Forces
+
+    workflow = patch(mesh, p, patches)
+    if bins is not None:
+        workflow = workflow | Directional(bins=bins, direction=direction)
+    return workflow | Forces(
+        CofR=CofR, rho=rho, pRef=pRef, viscous=viscous, stress_field=stress_field
+    )
+
+
 def iso_surface(mesh: fvMesh, iso_field: str, iso_value: float) -> Any:  # WorkFlow
     """Create a WorkFlow for an iso-surface (geometry only, no field).
 
@@ -161,6 +303,8 @@ def iso_surface(mesh: fvMesh, iso_field: str, iso_value: float) -> Any:  # WorkF
     """
     from .workflow import WorkFlow
 
+    # the iso-surface looks the field up in the registry; make sure it is loaded
+    lookup_field(mesh, volScalarField, iso_field)
     surface = create_iso_surface(
         name=f"iso_{iso_field}",
         mesh=mesh,
@@ -181,6 +325,8 @@ def plane(
     Pipe into ``area()`` or ``sample()`` to select what to compute::
 
         plane(mesh, point=(0.5,0,0), normal=(1,0,0)) | sample(mesh, "T") | Max()
+        cut = plane(mesh, (0.5,0,0), (1,0,0))
+        cut | sample(mesh, "U", field_type="vector") | FluxIntegrate()
 
     Args:
         mesh: OpenFOAM mesh object
@@ -226,7 +372,7 @@ def line(
     from .sets import create_uniform_set
     from .workflow import WorkFlow
 
-    vf = volScalarField.read_field(mesh, field_name)
+    vf = lookup_field(mesh, volScalarField, field_name, read=True)
     dataset = create_uniform_set(
         mesh=mesh,
         name=name,
@@ -239,11 +385,13 @@ def line(
     return WorkFlow(initial_dataset=dataset)  # type: ignore[misc]
 
 
-def residuals(mesh: fvMesh) -> Any:  # WorkFlow
+def residuals(mesh: fvMesh, components: bool = False) -> Any:  # WorkFlow
     """Create a WorkFlow for solver residuals.
 
     Args:
         mesh: OpenFOAM mesh object
+        components: One row per component of vector and tensor fields instead
+            of the maximum component
 
     Example::
 
@@ -251,4 +399,5 @@ def residuals(mesh: fvMesh) -> Any:  # WorkFlow
     """
     from .workflow import WorkFlow
 
-    return WorkFlow(initial_dataset=residual_dataset(mesh))  # type: ignore[misc]
+    dataset = residual_dataset(mesh, components=components)
+    return WorkFlow(initial_dataset=dataset)  # type: ignore[misc]
@@ -2,9 +2,9 @@
 Command-line interface for pyOFTools using Typer.
 """
 
-import json
 import runpy
 from pathlib import Path
+from typing import Optional
 
 import typer
 
@@ -22,20 +22,72 @@ def setfields(
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would be done without executing"
     ),
+    decomposed: bool = typer.Option(
+        False, "--decomposed", "-d", help="Set the fields of the processor* directories (JSON)"
+    ),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j", help="Number of worker processes for --decomposed"
+    ),
 ) -> None:
     if input_file.endswith(".py"):
         typer.echo(f"Running Python setFields script: {input_file}")
         runpy.run_path(input_file, run_name="__main__")
     elif input_file.endswith(".json"):
+        from pybFoam import Time, fvMesh
+
+        from ..setfields import (
+            load_config,
+            select_regions,
+            selection_size,
+            set_fields,
+            set_fields_decomposed,
+        )
+
         typer.echo(f"Loading setFields JSON: {input_file}")
-        with open(input_file) as f:
-            data = json.load(f)
-        typer.echo(f"Loaded JSON: {data}")
+        config = load_config(input_file)
+        if decomposed and not dry_run:
+            counts = set_fields_decomposed(config, str(case_dir), jobs=jobs)
+        else:
+            run_time = Time(str(case_dir), ".")
+            mesh = fvMesh(run_time)
+            if dry_run:
+                selections = select_regions(config, mesh)
+                counts = [selection_size(selected) for selected, _ in selections]
+            else:
+                counts = set_fields(config, mesh)
+        for i, (region, n_cells) in enumerate(zip(config.regions, counts)):
+            typer.echo(f"Region {i} ({region.region.type}): {n_cells} cells")
+        typer.echo(f"{'Would set' if dry_run else 'Set'} fields: {', '.join(config.field_types())}")
     else:
         typer.echo("Error: Input file must be .py or .json", err=True)
         raise typer.Exit(1)
 
 
+@app.command("postprocess")
+def postprocess(
+    script: str,
+    case_dir: Path = typer.Option(".", "--case", "-C", help="OpenFOAM case directory"),
+    times: Optional[str] = typer.Option(
+        None, "--times", "-t", help="Times to process, e.g. '0:10', '0.5,1' or 'latestTime'"
+    ),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Number of worker processes"),
+    decomposed: bool = typer.Option(
+        False, "--decomposed", "-d", help="Process the processor* directories of the case"
+    ),
+    mpi: bool = typer.Option(
+        False, "--mpi", help="Distribute the work over the MPI ranks (requires mpi4py)"
+    ),
+) -> None:
+    """Run the table outputs of a post-processing script over the time directories of a case."""
+    from ..offline import run_offline
+
+    written = run_offline(
+        script, str(case_dir), times=times, jobs=jobs, decomposed=decomposed, mpi=mpi
+    )
+    for name, file_path in written.items():
+        typer.echo(f"{name}: {file_path}")
+
+
 @app.command("version")
 def version() -> None:
     """Show pyOFTools version."""
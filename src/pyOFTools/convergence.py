@@ -0,0 +1,122 @@
+"""
+Online convergence detection to end steady runs early.
+
+:class:`Convergence` is appended to a workflow that yields residuals or any
+aggregated monitor. It passes the result through unchanged and, once all
+monitored entries have converged, requests the end of the run. The
+PostProcessorRunner then ends the run after writing (``Time::writeAndEnd``)::
+
+    @postProcess.Table("residuals.csv", writeControl="timeStep")
+    def res(mesh):
+        return residuals(mesh) | Convergence(
+            residual=1e-4, where={"metric": "init_res", "iteration": 0}
+        )
+
+    @postProcess.Table("drag.csv", writeControl="timeStep")
+    def drag(mesh):
+        return forces(mesh, ["hull"]) | Convergence(tolerance=1e-4, window=50)
+
+An entry has converged if its value is below ``residual`` or, without
+``residual``, if it has reached a plateau: the exponential moving average of
+its relative change between two writes (span ``window``) is below
+``tolerance``. The state is constant in size per entry and kept by the
+runner (see :class:`~pyOFTools.time_average.StateStore`).
+"""
+
+from __future__ import annotations
+
+from typing import Literal, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .datasets import AggregatedData, AggregatedDataSet, _flatten_types
+from .node import Node
+from .time_average import active_store
+
+__all__ = [
+    "Convergence",
+]
+
+
+class _Monitor:
+    """Moving average of the relative change of one entry."""
+
+    __slots__ = ("samples", "last", "change")
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.last: Optional[np.ndarray] = None
+        self.change = np.inf
+
+    def update(self, value: np.ndarray, alpha: float) -> float:
+        if self.last is not None:
+            scale = np.maximum(np.maximum(np.abs(value), np.abs(self.last)), 1e-30)
+            change = float(np.max(np.abs(value - self.last) / scale))
+            if self.samples > 1:
+                change = alpha * change + (1 - alpha) * self.change
+            self.change = change
+        self.samples += 1
+        self.last = value
+        return self.change
+
+
+@Node.register()
+class Convergence(BaseModel):
+    """
+    Request the end of the run when all monitored entries have converged.
+
+    Args:
+        tolerance: Converged if the averaged relative change per write is below
+        window: Span of the moving average and minimum number of writes
+            before an entry can converge
+        residual: Converged if the value is below (e.g. initial residuals);
+            replaces the plateau test
+        where: Monitor only the entries whose group columns have these
+            values, e.g. ``{"metric": "init_res"}``
+    """
+
+    type: Literal["convergence"] = "convergence"
+    tolerance: float = Field(default=1e-3, gt=0)
+    window: int = Field(default=10, ge=1)
+    residual: Optional[float] = Field(default=None, gt=0)
+    where: dict[str, Union[int, str]] = {}
+
+    def compute(self, dataset: AggregatedDataSet) -> AggregatedDataSet:
+        store = active_store()
+        if store is None:
+            raise RuntimeError(
+                "Convergence keeps its state across writes and can only be "
+                "evaluated by a PostProcessorRunner"
+            )
+        key = (
+            "convergence",
+            dataset.name,
+            self.residual,
+            self.tolerance,
+            self.window,
+            tuple(sorted(self.where.items())),
+        )
+        monitors: dict[Tuple[Union[int, str], ...], _Monitor] = store.get(key, {})
+
+        alpha = 2.0 / (self.window + 1)
+        monitored = [data for data in dataset.values if self._selected(data)]
+        converged = bool(monitored)
+        for data in monitored:
+            value = np.asarray(_flatten_types(data.value))
+            if self.residual is not None:
+                converged &= bool(np.all(np.abs(value) < self.residual))
+                continue
+            monitor = monitors.setdefault(tuple(data.group or []), _Monitor())
+            change = monitor.update(value, alpha)
+            converged &= monitor.samples >= self.window and change < self.tolerance
+
+        # the runner ends the run once the last decision of every monitor is True
+        store.converged[key] = converged
+        return dataset
+
+    def _selected(self, data: AggregatedData) -> bool:
+        if not self.where:
+            return True
+        groups = dict(zip(data.group_name or [], data.group or []))
+        return all(groups.get(name) == value for name, value in self.where.items())
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated, Optional, Union
+from typing import Annotated, Literal, Optional, Union
 
+import numpy as np
 from pybFoam import (
     boolList,
     labelList,
@@ -90,7 +91,10 @@ class InternalDataSet(BaseModel):
     field: FieldType
     geometry: InternalMesh
     mask: Optional[PydanticBoolList] = None
+    indices: Optional[PydanticLabelList] = None
     groups: Optional[PydanticLabelList] = None
+    # number of groups, the same on all processors (e.g. bins or patches)
+    n_groups: Optional[int] = None
     model_config = {"arbitrary_types_allowed": True}
 
 
@@ -99,7 +103,10 @@ class PatchDataSet(BaseModel):
     field: FieldType
     geometry: BoundaryMesh
     mask: Optional[PydanticBoolList] = None
+    indices: Optional[PydanticLabelList] = None
     groups: Optional[PydanticLabelList] = None
+    # number of groups, the same on all processors (e.g. bins or patches)
+    n_groups: Optional[int] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -109,7 +116,10 @@ class SurfaceDataSet(BaseModel):
     field: Optional[FieldType] = None
     geometry: SurfaceMesh
     mask: Optional[PydanticBoolList] = None
+    indices: Optional[PydanticLabelList] = None
     groups: Optional[PydanticLabelList] = None
+    # number of groups, the same on all processors (e.g. bins or patches)
+    n_groups: Optional[int] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -119,11 +129,57 @@ class PointDataSet(BaseModel):
     field: FieldType
     geometry: SetGeometry
     mask: Optional[PydanticBoolList] = None
+    indices: Optional[PydanticLabelList] = None
     groups: Optional[PydanticLabelList] = None
+    # number of groups, the same on all processors (e.g. bins or patches)
+    n_groups: Optional[int] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
 
+# Selections of less than this fraction of the elements are stored as index
+# list (``indices``) instead of a dense ``mask``
+SPARSE_FRACTION = 0.1
+
+SelectableDataSet = Union[InternalDataSet, PatchDataSet, SurfaceDataSet, PointDataSet]
+
+
+def set_selection(dataset: SelectableDataSet, selection: np.ndarray, size: int) -> None:
+    """
+    Store a selection in the representation that fits its selectivity.
+
+    Small selections are stored as sorted index list in ``dataset.indices``,
+    so that the aggregation kernels only visit the selected elements; all
+    others as dense ``dataset.mask``. The other attribute is reset to None.
+
+    Args:
+        dataset: Dataset to update
+        selection: Bool mask of length ``size`` or sorted indices of the
+            selected elements
+        size: Number of elements of the dataset
+    """
+    from . import aggregation
+
+    selection = np.asarray(selection)
+    if selection.dtype == bool:
+        n_selected = int(np.count_nonzero(selection))
+    else:
+        n_selected = len(selection)
+
+    if n_selected < SPARSE_FRACTION * size:
+        if selection.dtype == bool:
+            selection = np.flatnonzero(selection)
+        dataset.mask = None
+        dataset.indices = aggregation.label_list(selection)  # type: ignore[attr-defined]
+    else:
+        if selection.dtype != bool:
+            mask = np.zeros(size, dtype=bool)
+            mask[selection] = True
+            selection = mask
+        dataset.mask = boolList(selection)
+        dataset.indices = None
+
+
 def _flatten_types(values: SimpleType) -> list[float]:
     out: list[float] = []
     if hasattr(values, "__len__"):
@@ -161,6 +217,8 @@ class AggregatedData(BaseModel):
     value: SimpleType
     group: Optional[list[Union[int, str]]] = None
     group_name: Optional[list[str]] = None
+    # weight of a mean (e.g. the selected volume), see AggregatedDataSet.combine
+    weight: Optional[float] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -168,6 +226,9 @@ class AggregatedData(BaseModel):
 class AggregatedDataSet(BaseModel):
     name: str
     values: list[AggregatedData]
+    # how results of separately evaluated subdomains (e.g. processor
+    # directories) are combined; None if they cannot be combined
+    combine: Optional[Literal["sum", "mean", "max", "min"]] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -3,6 +3,7 @@ from pybFoam import fvMesh, volScalarField, volSymmTensorField
 # from pybFoam.thermo import fluidThermo
 from pybFoam.turbulence import (
     compressibleTurbulenceModel,
+    incompressibleTurbulenceModel,
 )
 
 # from pydantic import BaseModel
@@ -23,6 +24,11 @@ def viscousStressTensorEff(mesh: fvMesh) -> volSymmTensorField:
     return volSymmTensorField(turb.devRhoReff())
 
 
+def kinematicViscousStressTensorEff(mesh: fvMesh) -> volSymmTensorField:
+    turb = incompressibleTurbulenceModel.from_registry(mesh)
+    return volSymmTensorField(turb.devReff())
+
+
 # def viscousForce(mesh: fvMesh, p_name: str = "p"):
 #     p = volScalarField.from_registry(mesh,p_name)
 #     return mesh.Sf() * p
@@ -0,0 +1,111 @@
+"""
+Running time averages of volume fields (equivalent of the fieldAverage function object).
+
+The averages are kept by the compiled :mod:`pyOFTools.aggregation` module as
+fields of the mesh, ``<field>Mean`` and (optionally) ``<field>Prime2Mean``.
+They are updated in place once per time step in a single pass over the cells
+and boundary faces, without copying the field to NumPy::
+
+    postProcess.FieldAverage(["p"], prime2Mean=True)
+    postProcess.FieldAverage(["U"], field_type="vector")
+
+    @postProcess.Table("pMean.csv")
+    def mean_pressure(mesh):
+        return field(mesh, "pMean") | VolIntegrate()
+
+The mean is weighted with the time step. The averaged fields and the
+averaging time (``<time>/uniform/<field>AverageProperties``) are written at
+the write times of the run, and read again if the run is restarted.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional
+
+from pybFoam import volScalarField, volVectorField
+
+from .field_loader import lookup_field
+
+if TYPE_CHECKING:
+    from pybFoam import fvMesh
+
+__all__ = [
+    "FieldAverageWriter",
+    "create_field_average",
+]
+
+
+def create_field_average(
+    mesh: fvMesh,
+    name: str,
+    field_type: Literal["scalar", "vector"] = "scalar",
+    prime2Mean: bool = False,
+) -> Any:
+    """
+    Create the running average of a registered volume field.
+
+    ``update()`` adds the current values (once per time step); ``mean()`` and
+    ``prime2Mean()`` return the averaged fields, which are registered as
+    ``<name>Mean`` and ``<name>Prime2Mean``.
+
+    Args:
+        mesh: OpenFOAM mesh object
+        name: Name of the field in the object registry
+        field_type: Type of the volume field, "scalar" or "vector"
+        prime2Mean: Also average the variance (symmTensor for vector fields)
+    """
+    from . import aggregation
+
+    if field_type == "vector":
+        vf = lookup_field(mesh, volVectorField, name)
+        return aggregation.vectorFieldAverage(vf, prime2Mean)  # type: ignore[attr-defined]
+    vf = lookup_field(mesh, volScalarField, name)
+    return aggregation.scalarFieldAverage(vf, prime2Mean)  # type: ignore[attr-defined]
+
+
+class FieldAverageWriter:
+    """
+    Output updating the running averages of fields every time step.
+
+    Implements the PostProcessorInterface; registered with
+    :meth:`PostProcessorBase.FieldAverage <pyOFTools.postprocessor.PostProcessorBase.FieldAverage>`.
+    Nothing is written by the writer itself: the averaged fields are written
+    with the other fields of the run.
+
+    Args:
+        mesh: OpenFOAM mesh object
+        func: Unused, for the PostProcessorInterface
+        base_path: Unused, for the PostProcessorInterface
+        fields: Names of the fields to average
+        field_type: Type of the fields, "scalar" or "vector"
+        prime2Mean: Also average the variance
+    """
+
+    def __init__(
+        self,
+        mesh: fvMesh,
+        func: Optional[Callable[..., Any]],
+        base_path: str,
+        fields: List[str],
+        field_type: Literal["scalar", "vector"] = "scalar",
+        prime2Mean: bool = False,
+    ):
+        self.mesh = mesh
+        self.fields = list(fields)
+        # created at construction, so the averaged fields can be looked up
+        # by the other outputs from the first write on
+        self._averages = [
+            create_field_average(mesh, name, field_type, prime2Mean) for name in self.fields
+        ]
+
+    def execute(self) -> bool:
+        """Add the current values of the fields to the averages."""
+        for average in self._averages:
+            average.update()
+        return True
+
+    def write(self) -> bool:
+        return True
+
+    def end(self) -> bool:
+        return True
@@ -0,0 +1,121 @@
+"""
+On-demand loading of fields for offline post-processing.
+
+Builders and nodes look up their fields with :func:`lookup_field`. During a
+solver run the fields are taken from the object registry. Offline (see
+:mod:`pyOFTools.offline`) no solver has registered them, so an active
+:class:`FieldLoader` reads each field from the current time directory the
+first time it is looked up and shares it with all later lookups::
+
+    loader = FieldLoader()
+    with activate(loader):
+        with loader.output("mass"):
+            result = mass(mesh).compute()
+    loader.release()
+
+The fields looked up by each output are recorded (:attr:`FieldLoader.dependencies`),
+so exactly the fields required by the workflows are read, once per time.
+The working set is dropped by :meth:`FieldLoader.release`, which bounds the
+memory to the fields of one time.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
+
+__all__ = [
+    "FieldLoader",
+    "activate",
+    "active_loader",
+    "lookup_field",
+]
+
+
+_active: Optional[FieldLoader] = None
+
+
+def active_loader() -> Optional[FieldLoader]:
+    """Return the currently active loader or None if fields come from the registry."""
+    return _active
+
+
+@contextmanager
+def activate(loader: Optional[FieldLoader]) -> Iterator[None]:
+    """Make ``loader`` the active loader for the duration of the context."""
+    global _active
+    previous = _active
+    _active = loader
+    try:
+        yield
+    finally:
+        _active = previous
+
+
+def lookup_field(mesh: Any, geo_field_type: Any, name: str, read: bool = False) -> Any:
+    """
+    Return the field ``name`` of type ``geo_field_type`` (e.g. volScalarField).
+
+    Args:
+        mesh: OpenFOAM mesh object
+        geo_field_type: pybFoam field class
+        name: Name of the field
+        read: Without active loader, read the field from the current time
+            directory instead of taking it from the object registry
+    """
+    if _active is not None:
+        return _active.get(mesh, geo_field_type, name)
+    if read:
+        return geo_field_type.read_field(mesh, name)
+    return geo_field_type.from_registry(mesh, name)
+
+
+class FieldLoader:
+    """
+    Working set of the fields read for the current time.
+
+    Attributes:
+        dependencies: Fields ``(class name, field name)`` looked up by each output
+        reads: Number of fields read from disk
+    """
+
+    def __init__(self) -> None:
+        self.dependencies: dict[str, set[Tuple[str, str]]] = {}
+        self.reads = 0
+        self._fields: dict[Tuple[str, str], Any] = {}
+        self._output: Optional[str] = None
+
+    @contextmanager
+    def output(self, name: str) -> Iterator[None]:
+        """Record the fields looked up in the enclosed block as dependencies of ``name``."""
+        previous = self._output
+        self._output = name
+        self.dependencies.setdefault(name, set())
+        try:
+            yield
+        finally:
+            self._output = previous
+
+    @property
+    def required(self) -> set[Tuple[str, str]]:
+        """Fields required by all outputs."""
+        return set().union(*self.dependencies.values())
+
+    def get(self, mesh: Any, geo_field_type: Any, name: str) -> Any:
+        """Return the field, reading it if it is not in the working set."""
+        key = (geo_field_type.__name__, name)
+        if self._output is not None:
+            self.dependencies[self._output].add(key)
+        field = self._fields.get(key)
+        if field is None:
+            field = geo_field_type.read_field(mesh, name)
+            self._fields[key] = field
+            self.reads += 1
+        return field
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def release(self) -> None:
+        """Drop the working set; the fields are deregistered when they are freed."""
+        self._fields.clear()
@@ -0,0 +1,169 @@
+"""
+Selectors based on field values.
+
+``Threshold`` and ``Where`` restrict the selection of a dataset to the
+elements whose field values lie in a range. The masks are evaluated by the
+``threshold`` kernel of the C++ aggregation extension in a single pass over
+the field, without converting the field to NumPy. The result is combined
+with the existing selection (``mask`` and ``indices``), so selectors can be
+chained::
+
+    field(mesh, "p") | Box(...) | Threshold(field_name="alpha.water", lower=0.5) | VolIntegrate()
+    field(mesh, "p") | Where(expr="mag(U) > 2 and alpha.water >= 0.5") | Mean()
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Literal, Optional
+
+from pybFoam import volScalarField, volVectorField
+from pydantic import BaseModel, PrivateAttr
+
+from pyOFTools import aggregation
+
+from .datasets import DataSets, InternalDataSet
+from .field_loader import lookup_field
+from .node import Node
+
+__all__ = [
+    "Threshold",
+    "Where",
+    "parse_condition",
+]
+
+
+def _lookup_internal_field(dataset: DataSets, field_name: str, magnitude: bool) -> Any:
+    # the values of the named field are per cell, so only cell datasets match
+    if not isinstance(dataset, InternalDataSet):
+        raise TypeError(
+            f"Selecting by field '{field_name}' requires a dataset on the mesh cells, "
+            f"got {type(dataset).__name__}"
+        )
+    mesh = dataset.geometry.mesh  # type: ignore[attr-defined]
+    geo_field_type = volVectorField if magnitude else volScalarField
+    return lookup_field(mesh, geo_field_type, field_name)["internalField"]
+
+
+def _apply_threshold(
+    dataset: DataSets, values: Any, lower: Optional[float], upper: Optional[float]
+) -> DataSets:
+    dataset.mask = aggregation.threshold(  # type: ignore[union-attr, attr-defined]
+        values,
+        lower,
+        upper,
+        mask=dataset.mask,  # type: ignore[union-attr]
+        indices=dataset.indices,  # type: ignore[union-attr]
+    )
+    return dataset
+
+
+@Node.register()
+class Threshold(BaseModel):
+    """
+    Select the elements with ``lower <= value <= upper``.
+
+    Without ``field_name`` the field of the dataset is used; otherwise the
+    named volScalarField is looked up on the mesh of the dataset. Vector
+    fields are compared by magnitude.
+    """
+
+    type: Literal["threshold"] = "threshold"
+    field_name: Optional[str] = None
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+    def compute(self, dataset: DataSets) -> DataSets:
+        if self.field_name is None:
+            values = dataset.field  # type: ignore[union-attr]
+        else:
+            values = _lookup_internal_field(dataset, self.field_name, magnitude=False)
+        return _apply_threshold(dataset, values, self.lower, self.upper)
+
+
+# operand: field name or mag(field name); value: float literal
+_NAME = r"(?:mag\(\s*[A-Za-z_][\w.:]*\s*\)|[A-Za-z_][\w.:]*)"
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_OP = r"<=|>=|<|>"
+_CONDITION = re.compile(
+    rf"^\s*(?:(?P<left>{_NUMBER})\s*(?P<left_op>{_OP})\s*)?"
+    rf"(?P<name>{_NAME})"
+    rf"(?:\s*(?P<right_op>{_OP})\s*(?P<right>{_NUMBER}))?\s*$"
+)
+_AND = re.compile(r"\s+and\s+|\s*&&\s*|\s*&\s*")
+
+
+class _Condition(BaseModel):
+    field_name: str
+    magnitude: bool = False
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+
+def _bound(value: float, op: str, operand_first: bool) -> tuple[str, float]:
+    """Turn ``operand op value`` (or ``value op operand``) into an inclusive bound."""
+    if not operand_first:
+        # value < x  <=>  x > value
+        op = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}[op]
+    if op == ">=":
+        return "lower", value
+    if op == ">":
+        return "lower", math.nextafter(value, math.inf)
+    if op == "<=":
+        return "upper", value
+    return "upper", math.nextafter(value, -math.inf)
+
+
+def parse_condition(expr: str) -> list[_Condition]:
+    """
+    Parse a conjunction of range conditions on fields.
+
+    Each condition compares a field (or ``mag(field)`` of a vector field)
+    with constants, e.g. ``alpha.water > 0.5``, ``mag(U) <= 2`` or
+    ``0.1 < alpha.water < 0.9``. Conditions are combined with ``and``,
+    ``&&`` or ``&``.
+    """
+    conditions = []
+    for clause in _AND.split(expr.strip()):
+        match = _CONDITION.match(clause)
+        if match is None or (match["left"] is None and match["right"] is None):
+            raise ValueError(f"Invalid condition '{clause}' in '{expr}'")
+
+        name = match["name"]
+        magnitude = name.startswith("mag(")
+        if magnitude:
+            name = name[4:-1].strip()
+        condition = _Condition(field_name=name, magnitude=magnitude)
+        if match["left"] is not None:
+            kind, value = _bound(float(match["left"]), match["left_op"], operand_first=False)
+            setattr(condition, kind, value)
+        if match["right"] is not None:
+            kind, value = _bound(float(match["right"]), match["right_op"], operand_first=True)
+            setattr(condition, kind, value)
+        conditions.append(condition)
+    return conditions
+
+
+@Node.register()
+class Where(BaseModel):
+    """
+    Select the elements satisfying a condition on mesh fields.
+
+    See :func:`parse_condition` for the syntax, e.g. ``"mag(U) > 2"``.
+    Each condition is evaluated with one pass of the threshold kernel.
+    """
+
+    type: Literal["where"] = "where"
+    expr: str
+    _conditions: list[_Condition] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        # fail on construction for invalid expressions
+        self._conditions = parse_condition(self.expr)
+
+    def compute(self, dataset: DataSets) -> DataSets:
+        for condition in self._conditions:
+            values = _lookup_internal_field(dataset, condition.field_name, condition.magnitude)
+            dataset = _apply_threshold(dataset, values, condition.lower, condition.upper)
+        return dataset
@@ -0,0 +1,132 @@
+"""
+Pressure and viscous forces and moments on patches.
+
+The :class:`Forces` node integrates the forces on the faces of a patch
+dataset (see :func:`pyOFTools.builders.patch`) in one pass of the ``forces``
+kernel of the C++ aggregation extension, with a single reduction for all
+quantities. Groups of the dataset (e.g. from ``Directional`` binning) yield
+forces per bin::
+
+    patch(mesh, "p", ["hull"]) | Forces(CofR=(0, 0, 0), rho=1000.0)
+    forces(mesh, ["hull"], CofR=(0, 0, 0), bins=[0.0, 0.5, 1.0], direction=(1, 0, 0))
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal, Optional, Tuple
+
+from pybFoam import vector, volSymmTensorField
+from pydantic import BaseModel
+
+from pyOFTools import aggregation
+
+from .datasets import AggregatedData, AggregatedDataSet, PatchDataSet
+from .field_loader import lookup_field
+from .node import Node
+
+__all__ = [
+    "Forces",
+]
+
+QUANTITIES = (
+    "pressure_force",
+    "viscous_force",
+    "total_force",
+    "pressure_moment",
+    "viscous_moment",
+    "total_moment",
+)
+
+
+@Node.register()
+class Forces(BaseModel):
+    """
+    Forces and moments on the faces of a patch dataset.
+
+    The field of the dataset is the pressure. Each quantity of
+    :data:`QUANTITIES` is one row (group ``quantity``, plus ``group`` if the
+    dataset is grouped).
+
+    Args:
+        CofR: Centre of rotation for the moments
+        rho: Reference density for a kinematic pressure and stress
+            (incompressible solvers); None if they are in Pa
+        pRef: Reference pressure subtracted from the pressure, in Pa as in the
+            OpenFOAM forces function object (divided by ``rho`` for a
+            kinematic pressure)
+        viscous: Include the viscous forces
+        stress_field: Name of a registered volSymmTensorField with the
+            effective deviatoric stress, kinematic if ``rho`` is set; by
+            default ``devReff`` of the incompressible turbulence model
+            (``rho`` set) or ``devRhoReff`` of the compressible one
+        name: Name of the output
+    """
+
+    type: Literal["forces"] = "forces"
+    CofR: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    rho: Optional[float] = None
+    pRef: float = 0.0
+    viscous: bool = True
+    stress_field: Optional[str] = None
+    name: Optional[str] = None
+
+    def _stress(self, dataset: PatchDataSet) -> Any:
+        mesh = dataset.geometry.mesh  # type: ignore[attr-defined]
+        if self.stress_field is not None:
+            stress = lookup_field(mesh, volSymmTensorField, self.stress_field)
+        else:
+            from .fieldFunctions import kinematicViscousStressTensorEff, viscousStressTensorEff
+
+            model = "incompressible" if self.rho is not None else "compressible"
+            try:
+                if self.rho is not None:
+                    stress = kinematicViscousStressTensorEff(mesh)
+                else:
+                    stress = viscousStressTensorEff(mesh)
+            except RuntimeError as err:
+                raise RuntimeError(
+                    f"Forces: no {model} turbulence model registered for the viscous "
+                    "forces (e.g. in post-processing); set stress_field or viscous=False"
+                ) from err
+        return aggregation.boundary_values(stress, dataset.geometry.patches)  # type: ignore[attr-defined]
+
+    def compute(self, dataset: PatchDataSet) -> AggregatedDataSet:
+        if not isinstance(dataset, PatchDataSet):
+            raise TypeError(f"Forces requires a PatchDataSet, got {type(dataset).__name__}")
+
+        res = aggregation.forces(  # type: ignore[attr-defined]
+            dataset.field,
+            dataset.geometry.face_areas,
+            dataset.geometry.positions,
+            vector(self.CofR),
+            self._stress(dataset) if self.viscous else None,
+            rho=1.0 if self.rho is None else self.rho,
+            pRef=self.pRef if self.rho is None else self.pRef / self.rho,
+            mask=dataset.mask,
+            group=dataset.groups,
+            indices=dataset.indices,
+            kinematicStress=self.rho is not None,
+            nGroups=dataset.n_groups,
+        )
+
+        group_names = ["quantity", "group"] if res.group is not None else ["quantity"]
+        values = []
+        for i in range(len(res.pressureForce)):
+            pressure_force, viscous_force = res.pressureForce[i], res.viscousForce[i]
+            pressure_moment, viscous_moment = res.pressureMoment[i], res.viscousMoment[i]
+            rows = zip(
+                QUANTITIES,
+                (
+                    pressure_force,
+                    viscous_force,
+                    pressure_force + viscous_force,
+                    pressure_moment,
+                    viscous_moment,
+                    pressure_moment + viscous_moment,
+                ),
+            )
+            for quantity, value in rows:
+                group: list[Any] = [quantity] if res.group is None else [quantity, res.group[i]]
+                values.append(AggregatedData(value=value, group=group, group_name=group_names))
+
+        return AggregatedDataSet(name=self.name or "forces", values=values, combine="sum")
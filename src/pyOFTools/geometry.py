@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import Any, Callable, Optional, Protocol, Tuple, runtime_checkable
 
+import numpy as np
 from pybFoam import fvMesh, scalarField, vectorField
 from pybFoam.sampling import sampledSet, sampledSurface
 
+from .selection_cache import mesh_reference, mesh_state
+from .spatial_index import UniformGridIndex, index_for_mesh
+
 
 @runtime_checkable
 class InternalMesh(Protocol):
@@ -20,6 +24,12 @@ class BoundaryMesh(Protocol):
     @property
     def positions(self) -> vectorField: ...
 
+    @property
+    def face_areas(self) -> vectorField: ...
+
+    @property
+    def face_area_magnitudes(self) -> scalarField: ...
+
 
 @runtime_checkable
 class SurfaceMesh(Protocol):
@@ -207,8 +217,13 @@ class SampledSetAdapter:
 
 
 class FvMeshInternalAdapter:
-    def __init__(self, mesh: fvMesh) -> None:
+    def __init__(self, mesh: fvMesh, spatial_index: bool = True) -> None:
         self._mesh = mesh
+        self._use_spatial_index = spatial_index
+
+    @property
+    def mesh(self) -> fvMesh:
+        return self._mesh
 
     @property
     def positions(self) -> vectorField:
@@ -217,3 +232,88 @@ class FvMeshInternalAdapter:
     @property
     def volumes(self) -> scalarField:
         return self._mesh.V()
+
+    @property
+    def cache_key(self) -> Tuple[Any, ...]:
+        """Key of the cell centres for caching selections (see selection_cache)."""
+        return ("cells", *mesh_state(self._mesh))
+
+    @property
+    def spatial_index(self) -> Optional[UniformGridIndex]:
+        """Spatial index of the cell centres, shared by all adapters of the mesh.
+
+        None if disabled or if the mesh is too small to benefit from an index.
+        """
+        if not self._use_spatial_index:
+            return None
+        return index_for_mesh(self._mesh, self.positions)
+
+
+# Boundary geometry by (patches, id of the mesh): a weak reference to the
+# mesh, the mesh state it was read for and the geometry
+_boundary_geometry: dict[Tuple[Any, ...], Tuple[Callable[[], Any], Tuple[Any, ...], Any]] = {}
+
+
+class FvMeshBoundaryAdapter:
+    """
+    Boundary faces of one or more patches of a mesh (BoundaryMesh protocol).
+
+    The faces of all patches are concatenated in the order of ``patches``.
+    Face centres, area vectors and magnitudes are read once per mesh state
+    and shared by all adapters of the same patches.
+
+    Args:
+        mesh: OpenFOAM mesh
+        patches: Names of the patches
+    """
+
+    def __init__(self, mesh: fvMesh, patches: list[str]) -> None:
+        self._mesh = mesh
+        self.patches = list(patches)
+
+    @property
+    def _geometry(self) -> Any:
+        from . import aggregation
+
+        key = (tuple(self.patches), id(self._mesh))
+        state = mesh_state(self._mesh)
+        entry = _boundary_geometry.get(key)
+        if entry is None or entry[0]() is not self._mesh or entry[1] != state:
+            geometry = aggregation.boundary_geometry(self._mesh, self.patches)  # type: ignore[attr-defined]
+            ref = mesh_reference(self._mesh, _boundary_geometry, key)
+            entry = _boundary_geometry[key] = (ref, state, geometry)
+        return entry[2]
+
+    @property
+    def mesh(self) -> fvMesh:
+        return self._mesh
+
+    @property
+    def positions(self) -> vectorField:
+        """Face centres."""
+        return self._geometry.Cf
+
+    @property
+    def face_areas(self) -> vectorField:
+        """Face area vectors (pointing out of the domain)."""
+        return self._geometry.Sf
+
+    @property
+    def face_area_magnitudes(self) -> scalarField:
+        """Face area magnitudes."""
+        return self._geometry.magSf
+
+    @property
+    def patch_ids(self) -> Any:
+        """Position of the patch of each face in ``patches`` (labelList)."""
+        return self._geometry.patch
+
+    @property
+    def total_area(self) -> float:
+        """Total area of the patches on this processor."""
+        return float(np.sum(np.asarray(self._geometry.magSf)))
+
+    @property
+    def cache_key(self) -> Tuple[Any, ...]:
+        """Key of the face centres for caching selections (see selection_cache)."""
+        return ("faces", tuple(self.patches), *mesh_state(self._mesh))
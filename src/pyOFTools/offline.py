@@ -0,0 +1,353 @@
+"""
+Offline post-processing of the time directories of a finished case.
+
+The outputs registered on a :class:`~pyOFTools.postprocessor.PostProcessorBase`
+in a script are evaluated for every selected time directory without rerunning
+the solver::
+
+    pyoftools postprocess postProcess.py --case . --times 0:10 -j 8
+
+The time directories are distributed over a pool of worker processes. Each
+worker loads the script and the mesh once and, for every time it is given,
+computes the workflows of all table outputs. Only the fields looked up by the
+workflows are read, once per time, and released before the next time (see
+:mod:`pyOFTools.field_loader`). The rows of all workers are merged and each
+table is written once, sorted by time.
+
+Nodes that keep state across times (:class:`~pyOFTools.time_average.TimeAverage`,
+:class:`~pyOFTools.convergence.Convergence`) need the times in order and are
+only evaluated with ``-j 1`` on a reconstructed case. Field averages
+(``PostProcessorBase.FieldAverage``) are accumulated during a run and skipped.
+
+Decomposed cases are processed without reconstruction: every ``processor*``
+directory is read as a case of its own, on local workers or on the ranks of
+an MPI run, and the partial results of the processors are combined (see
+:mod:`pyOFTools.partials`)::
+
+    pyoftools postprocess postProcess.py --decomposed -j 4
+    mpirun -np 16 pyoftools postprocess postProcess.py --decomposed --mpi
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import runpy
+import warnings
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from .convergence import Convergence
+from .field_loader import FieldLoader, activate
+from .partials import PartialState, combine_partials, partial_state
+from .postprocessor import PostProcessorBase
+from .tables.csvWriter import CSVWriter
+from .tables.table import TableWriter
+from .time_average import StateStore, TimeAverage
+from .time_average import activate as activate_states
+
+__all__ = [
+    "load_outputs",
+    "processor_directories",
+    "run_offline",
+    "select_times",
+    "time_directories",
+]
+
+# partial result of one output at one time: (output name, time, state)
+OutputState = Tuple[str, float, PartialState]
+
+# registered outputs of a post-processor: name -> (func, writer class, writer kwargs)
+Outputs = dict[str, Tuple[Callable[..., Any], type, dict[str, Any]]]
+
+_PROCESSOR = re.compile(r"processor\d+")
+
+# nodes keeping state across times, evaluated in time order only
+_STATEFUL_NODES = (TimeAverage, Convergence)
+
+
+def time_directories(case: str) -> list[Tuple[float, str]]:
+    """Return ``(time, directory name)`` of all time directories of a case, sorted by time."""
+    times = []
+    for name in os.listdir(case):
+        if not os.path.isdir(os.path.join(case, name)):
+            continue
+        try:
+            times.append((float(name), name))
+        except ValueError:
+            continue
+    return sorted(times)
+
+
+def select_times(times: list[Tuple[float, str]], spec: Optional[str]) -> list[Tuple[float, str]]:
+    """
+    Select time directories following the OpenFOAM ``-time`` syntax.
+
+    ``spec`` is a comma separated list of times and inclusive ranges, e.g.
+    ``"0.5"``, ``"0:10"``, ``":1,2.5,4:"``, or ``"latestTime"``. None selects
+    all times.
+    """
+    if spec is None or not spec.strip():
+        return list(times)
+    if spec.strip() == "latestTime":
+        return times[-1:]
+
+    selected = set()
+    for item in spec.split(","):
+        item = item.strip()
+        if ":" in item:
+            lower, upper = (part.strip() for part in item.split(":", 1))
+            lo = float(lower) if lower else -float("inf")
+            hi = float(upper) if upper else float("inf")
+            selected.update(i for i, (t, _) in enumerate(times) if lo <= t <= hi)
+        else:
+            value = float(item)
+            selected.update(
+                i for i, (t, _) in enumerate(times) if abs(t - value) <= 1e-9 * max(1.0, abs(t))
+            )
+    return [times[i] for i in sorted(selected)]
+
+
+def load_outputs(script: str) -> Tuple[str, Outputs]:
+    """
+    Run a post-processing script and return the outputs of its post-processors.
+
+    The script is run under the name ``__pyoftools_postprocess__``, so a
+    ``if __name__ == "__main__"`` block is not executed. Only table outputs
+    are supported offline; field averages are skipped with a warning.
+
+    Returns:
+        Base path of the first post-processor and the outputs of all
+    """
+    namespace = runpy.run_path(script, run_name="__pyoftools_postprocess__")
+    processors = [v for v in namespace.values() if isinstance(v, PostProcessorBase)]
+    if not processors:
+        raise ValueError(f"No PostProcessorBase instance found in '{script}'")
+
+    from .field_average import FieldAverageWriter
+
+    outputs = {}
+    for processor in processors:
+        for name, output in processor._outputs.items():
+            _, writer_cls, writer_kwargs = output
+            if writer_cls is FieldAverageWriter:
+                warnings.warn(
+                    f"Output '{name}' averages fields during a run and is skipped offline",
+                    stacklevel=2,
+                )
+                continue
+            _, ext = os.path.splitext(writer_kwargs.get("filename", ""))
+            if writer_cls is not TableWriter or ext not in TableWriter._extension_map:
+                raise ValueError(f"Output '{name}' is not a table and cannot be run offline")
+            outputs[name] = output
+    return processors[0]._base_path, outputs
+
+
+def processor_directories(case: str) -> list[str]:
+    """Return the processor directories of a decomposed case, sorted by rank."""
+    names = [
+        name
+        for name in os.listdir(case)
+        if _PROCESSOR.fullmatch(name) and os.path.isdir(os.path.join(case, name))
+    ]
+    return sorted(names, key=lambda name: int(name[len("processor") :]))
+
+
+class _Worker:
+    """
+    Mesh and outputs of one worker process, loaded once per (processor) mesh.
+
+    With ``sequential`` all times are evaluated by this worker in time order,
+    so the state of stateful nodes is kept across times (one StateStore per
+    output, as in the PostProcessorRunner); otherwise stateful nodes are
+    rejected.
+    """
+
+    def __init__(
+        self,
+        outputs: Outputs,
+        case: str,
+        processor: Optional[str] = None,
+        sequential: bool = False,
+    ) -> None:
+        from pybFoam import Time, fvMesh
+
+        self.processor = processor
+        self.outputs = outputs
+        self.sequential = sequential
+        # a processor directory is read as a case of its own
+        self.run_time = Time(case, processor or ".")
+        self.mesh = fvMesh(self.run_time)
+        self.loader = FieldLoader()
+        self.states = {name: StateStore() for name in outputs}
+
+    def evaluate(self, index: int, time_name: str) -> list[OutputState]:
+        self.run_time.setTime(float(time_name), index)
+        value = self.run_time.value()
+        results = []
+        try:
+            with activate(self.loader):
+                for name, (func, _, _) in self.outputs.items():
+                    store = self.states[name]
+                    store.time = value
+                    with self.loader.output(name), activate_states(store):
+                        workflow = func(self.mesh)
+                        self._check_stateful(name, workflow)
+                        result = workflow.compute()
+                    # plain floats only, so no pybFoam types are pickled
+                    results.append((name, value, partial_state(result)))
+        finally:
+            self.loader.release()
+        return results
+
+    def _check_stateful(self, name: str, workflow: Any) -> None:
+        if self.sequential:
+            return
+        steps = getattr(workflow, "steps", [])
+        stateful = [step.type for step in steps if isinstance(step, _STATEFUL_NODES)]
+        if stateful:
+            raise ValueError(
+                f"Output '{name}' uses {', '.join(stateful)}, which keeps its state across "
+                "times; it can only be evaluated offline in time order, with jobs=1 on a "
+                "reconstructed case"
+            )
+
+
+_outputs: Outputs = {}
+_case = "."
+_sequential = False
+_worker: Optional[_Worker] = None
+
+
+def _init_worker(
+    script: str, case: str, outputs: Optional[Outputs] = None, sequential: bool = False
+) -> None:
+    global _outputs, _case, _sequential, _worker
+    _outputs = outputs if outputs is not None else load_outputs(script)[1]
+    _case = case
+    _sequential = sequential
+    _worker = None
+
+
+def _evaluate(task: Tuple[Optional[str], int, str]) -> list[OutputState]:
+    global _worker
+    processor, index, time_name = task
+    if _worker is None or _worker.processor != processor:
+        _worker = None  # release the previous mesh first
+        _worker = _Worker(_outputs, _case, processor, _sequential)
+    return _worker.evaluate(index, time_name)
+
+
+def _run_mpi(tasks: list[Tuple[Optional[str], int, str]]) -> Optional[list[OutputState]]:
+    """Evaluate a contiguous block of the tasks on every MPI rank; gathered on rank 0."""
+    try:
+        from mpi4py import MPI
+    except ImportError as e:
+        raise ImportError("MPI mode requires mpi4py (pip install mpi4py)") from e
+
+    comm = MPI.COMM_WORLD
+    start = comm.rank * len(tasks) // comm.size
+    stop = (comm.rank + 1) * len(tasks) // comm.size
+    local = [state for task in tasks[start:stop] for state in _evaluate(task)]
+    gathered = comm.gather(local, root=0)
+    if comm.rank != 0:
+        return None
+    return [state for states in gathered for state in states]
+
+
+def _merge(
+    results: Iterable[OutputState],
+) -> dict[str, Tuple[list[str], list[Tuple[float, list[Any]]]]]:
+    """Combine the partial states per output and time into the rows of each table."""
+    partials: dict[Tuple[str, float], list[PartialState]] = {}
+    for name, value, state in results:
+        partials.setdefault((name, value), []).append(state)
+
+    tables: dict[str, Tuple[list[str], list[Tuple[float, list[Any]]]]] = {}
+    for (name, value), states in partials.items():
+        state = combine_partials(states)
+        table = tables.setdefault(name, (["time"] + state.headers, []))
+        table[1].extend((value, [value] + row) for row in state.rows)
+    return tables
+
+
+def run_offline(
+    script: str,
+    case: str = ".",
+    times: Optional[str] = None,
+    jobs: int = 1,
+    decomposed: bool = False,
+    mpi: bool = False,
+) -> dict[str, str]:
+    """
+    Evaluate the table outputs of a script for the time directories of a case.
+
+    For a decomposed case every processor directory is evaluated as a case of
+    its own and the partial results are combined (see
+    :func:`~pyOFTools.partials.combine_partials`), so the case need not be
+    reconstructed and the number of workers is independent of the number of
+    processors. Outputs with stateful nodes (e.g. TimeAverage) are evaluated
+    in time order and require ``jobs=1`` on a reconstructed case.
+
+    Args:
+        script: Post-processing script defining a PostProcessorBase
+        case: Case directory
+        times: Time selection, see :func:`select_times` (default: all times)
+        jobs: Number of worker processes; 1 runs in the current process
+        decomposed: Read the ``processor*`` directories of the case
+        mpi: Distribute the work over the ranks of an MPI run (requires
+            mpi4py) instead of local worker processes; rank 0 writes the tables
+
+    Returns:
+        Path of the written table of every output (empty on ranks other than 0)
+    """
+    case = os.path.abspath(case)
+    processors: list[Optional[str]] = [None]
+    time_root = case
+    if decomposed:
+        names = processor_directories(case)
+        if not names:
+            raise ValueError(f"No processor directories found in '{case}'")
+        processors = list(names)
+        time_root = os.path.join(case, names[0])
+
+    all_times = time_directories(time_root)
+    selected = select_times(all_times, times)
+    if not selected:
+        raise ValueError(f"No time directories selected in '{case}' for times '{times}'")
+    # grouped by processor, so consecutive tasks share the mesh
+    tasks = [
+        (processor, all_times.index(entry), entry[1])
+        for processor in processors
+        for entry in selected
+    ]
+
+    base_path, outputs = load_outputs(script)
+    if mpi:
+        _init_worker(script, case, outputs)
+        gathered = _run_mpi(tasks)
+        if gathered is None:
+            return {}
+        tables = _merge(gathered)
+    elif jobs <= 1:
+        # the tasks are in time order: stateful nodes can be evaluated
+        _init_worker(script, case, outputs, sequential=not decomposed)
+        tables = _merge(state for task in tasks for state in _evaluate(task))
+    else:
+        jobs = min(jobs, len(tasks))
+        chunksize = min(len(selected), -(-len(tasks) // jobs)) if decomposed else 1
+        # spawn: OpenFOAM state must not be shared with forked workers
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(jobs, initializer=_init_worker, initargs=(script, case)) as pool:
+            results = pool.imap_unordered(_evaluate, tasks, chunksize=chunksize)
+            tables = _merge(state for states in results for state in states)
+
+    if not os.path.isabs(base_path):
+        base_path = os.path.join(case, base_path)
+    written = {}
+    for name, (header, rows) in tables.items():
+        file_path = os.path.join(base_path, outputs[name][2]["filename"])
+        rows.sort(key=lambda row: row[0])
+        CSVWriter(file_path=file_path).write_rows(header, [row for _, row in rows])
+        written[name] = file_path
+    return written
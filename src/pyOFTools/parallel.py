@@ -0,0 +1,29 @@
+"""
+Helpers for decisions that all MPI ranks must take together.
+
+Both functions also work in serial runs, where the calling process is the
+master and reductions return the local value.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "is_master",
+    "reduce_max",
+]
+
+
+def is_master() -> bool:
+    """Check if this is the master MPI rank. Returns True in serial runs."""
+    from pybFoam import Pstream
+
+    return bool(Pstream.master())
+
+
+def reduce_max(value: float) -> float:
+    """Return the maximum of ``value`` over all MPI ranks (collective call)."""
+    from pybFoam import scalarField
+
+    from . import aggregation
+
+    return float(aggregation.reduce(scalarField([value]), "max")[0])  # type: ignore[attr-defined]
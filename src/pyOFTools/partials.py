@@ -0,0 +1,124 @@
+"""
+Partial aggregation results of separately evaluated subdomains.
+
+When the processor directories of a decomposed case are post-processed
+independently (see :mod:`pyOFTools.offline`), every processor yields the
+aggregate of its own cells only. :func:`partial_state` converts such a result
+into a picklable :class:`PartialState` of plain floats, and
+:func:`combine_partials` combines the states of all processors according to
+:attr:`AggregatedDataSet.combine <pyOFTools.datasets.AggregatedDataSet.combine>`:
+
+- ``sum``: sum of the partial values (sums and integrals)
+- ``mean``: weighted mean, using the weights reported by the mean kernels
+- ``max``/``min``: component-wise maximum/minimum
+
+Entries are matched by their group, so processors need not contain all
+groups.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal, Optional, Union
+
+from pydantic import BaseModel
+
+from .datasets import AggregatedDataSet, _flatten_types
+
+__all__ = [
+    "PartialEntry",
+    "PartialState",
+    "combine_partials",
+    "partial_state",
+]
+
+# value of a mean without any weight, as returned by the mean kernels
+GREAT = 1e15
+
+
+class PartialEntry(BaseModel):
+    """Value (components) and weight of one group."""
+
+    group: list[Union[int, str]] = []
+    value: list[float]
+    weight: Optional[float] = None
+
+
+class PartialState(BaseModel):
+    """Aggregation result reduced to plain Python types."""
+
+    name: str
+    headers: list[str]
+    combine: Optional[Literal["sum", "mean", "max", "min"]] = None
+    entries: list[PartialEntry]
+
+    @property
+    def rows(self) -> list[list[Any]]:
+        """Table rows as in :attr:`AggregatedDataSet.grouped_values`."""
+        return [entry.value + entry.group for entry in self.entries]
+
+
+def partial_state(dataset: AggregatedDataSet) -> PartialState:
+    """Convert an aggregation result into a partial state."""
+    return PartialState(
+        name=dataset.name,
+        headers=dataset.headers,
+        combine=dataset.combine,
+        entries=[
+            PartialEntry(group=v.group or [], value=_flatten_types(v.value), weight=v.weight)
+            for v in dataset.values
+        ],
+    )
+
+
+def _combine_entries(combine: str, entries: list[PartialEntry]) -> PartialEntry:
+    values = [e.value for e in entries]
+    if combine == "sum":
+        value = [sum(components) for components in zip(*values)]
+        return PartialEntry(group=entries[0].group, value=value)
+    if combine == "max":
+        return PartialEntry(group=entries[0].group, value=[max(c) for c in zip(*values)])
+    if combine == "min":
+        return PartialEntry(group=entries[0].group, value=[min(c) for c in zip(*values)])
+
+    # weighted mean; entries without weight do not contribute
+    weight = sum(e.weight or 0.0 for e in entries)
+    if weight <= 0.0:
+        value = [GREAT] * len(values[0])
+    else:
+        value = [
+            sum((e.weight or 0.0) * c for e, c in zip(entries, components)) / weight
+            for components in zip(*values)
+        ]
+    return PartialEntry(group=entries[0].group, value=value, weight=weight)
+
+
+def combine_partials(states: list[PartialState]) -> PartialState:
+    """
+    Combine the partial states of an output evaluated on several subdomains.
+
+    Raises:
+        ValueError: If the states do not belong to the same output or the
+            output cannot be combined (``combine`` is None)
+    """
+    if len(states) == 1:
+        return states[0]
+    first = states[0]
+    if any(s.name != first.name or s.combine != first.combine for s in states):
+        raise ValueError(f"Cannot combine partial results of different outputs ('{first.name}')")
+    if first.combine is None:
+        raise ValueError(
+            f"Results of '{first.name}' cannot be combined over subdomains; "
+            "only sums, integrals, means, minima and maxima are supported"
+        )
+
+    groups: dict[tuple[Union[int, str], ...], list[PartialEntry]] = {}
+    for state in states:
+        for entry in state.entries:
+            groups.setdefault(tuple(entry.group), []).append(entry)
+
+    return PartialState(
+        name=first.name,
+        headers=first.headers,
+        combine=first.combine,
+        entries=[_combine_entries(first.combine, entries) for entries in groups.values()],
+    )
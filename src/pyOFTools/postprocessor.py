@@ -8,7 +8,23 @@ output registration and extensible writer components.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Protocol, runtime_checkable
+import math
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Literal,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
+
+from .parallel import is_master, reduce_max
+from .profiling import Profiler, activate
+from .selection_cache import observe_mesh_motion
+from .time_average import StateStore
+from .time_average import activate as activate_states
 
 if TYPE_CHECKING:
     from pybFoam import fvMesh
@@ -71,6 +87,12 @@ class PostProcessorBase:
 
     Args:
         base_path: Base directory for output files (default: "postProcessing/")
+        profile: Record wall time and call counts per output and workflow node;
+            a summary is written to ``pyOFTools_profile.csv`` at end() (default: False)
+        trace: Additionally write a Chrome trace-event file ``pyOFTools_trace.json``
+            for flame-graph viewing (implies profile, default: False)
+        profile_memory: Also record memory deltas with tracemalloc, which slows
+            down every Python allocation of the run (implies profile, default: False)
 
     Example:
         >>> postProcess = PostProcessorBase()
@@ -86,9 +108,18 @@ class PostProcessorBase:
         >>> processor.end()      # Called at end of simulation
     """
 
-    def __init__(self, base_path: str = "postProcessing/"):
+    def __init__(
+        self,
+        base_path: str = "postProcessing/",
+        profile: bool = False,
+        trace: bool = False,
+        profile_memory: bool = False,
+    ):
         """Initialize PostProcessorBase with output directory."""
         self._base_path = base_path
+        self._profile = profile or trace or profile_memory
+        self._trace = trace
+        self._profile_memory = profile_memory
         self._outputs: dict[
             str, tuple[Callable[..., Any], type[PostProcessorInterface], dict[str, Any]]
         ] = {}
@@ -106,7 +137,8 @@ class PostProcessorBase:
 
         Args:
             filename: Output filename (extension determines format)
-            \**kwargs: Additional arguments passed to the writer (e.g., writeControl, writeInterval)
+            \**kwargs: Additional arguments passed to the writer (e.g., writeControl,
+                writeInterval, restart, budget)
 
         Returns:
             Decorator function
@@ -125,6 +157,40 @@ class PostProcessorBase:
 
         return decorator
 
+    def FieldAverage(
+        self,
+        fields: list[str],
+        field_type: Literal["scalar", "vector"] = "scalar",
+        prime2Mean: bool = False,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Register running time averages of volume fields.
+
+        The averages are updated every time step and registered as
+        ``<field>Mean`` (and ``<field>Prime2Mean``), so table outputs can use
+        them like any other field (see :mod:`pyOFTools.field_average`).
+
+        Args:
+            fields: Names of the fields to average
+            field_type: Type of the fields, "scalar" or "vector"
+            prime2Mean: Also average the variance
+            name: Name of the output (default: ``<fields>Average``)
+
+        Example:
+            >>> postProcess.FieldAverage(["p"], prime2Mean=True)
+            >>>
+            >>> @postProcess.Table("pMean.csv")
+            ... def mean_pressure(mesh):
+            ...     return field(mesh, "pMean") | VolIntegrate()
+        """
+        from .field_average import FieldAverageWriter
+
+        output = name or f"{'_'.join(fields)}Average"
+        config = {"fields": fields, "field_type": field_type, "prime2Mean": prime2Mean}
+        # no workflow function: the writer updates the averages itself
+        self._outputs[output] = (None, FieldAverageWriter, config)  # type: ignore[assignment]
+
     def __call__(self, mesh: fvMesh) -> PostProcessorRunner:
         """
         Create a processor runner instance for the given mesh.
@@ -135,7 +201,34 @@ class PostProcessorBase:
         Returns:
             PostProcessorRunner instance ready for use as OpenFOAM function object
         """
-        return PostProcessorRunner(mesh, self._outputs, self._base_path)
+        return PostProcessorRunner(
+            mesh,
+            self._outputs,
+            self._base_path,
+            profile=self._profile,
+            trace=self._trace,
+            profile_memory=self._profile_memory,
+        )
+
+
+def _decimation_for(required: float, current: int, max_decimation: int) -> int:
+    """
+    Choose the decimation factor for an output.
+
+    ``required`` is the factor needed to stay within the budget. Factors are
+    powers of two; the factor is only lowered as far as the output uses at
+    most 75% of its budget at the lower factor, to avoid oscillating decisions.
+    """
+    target = _power_of_two(required)
+    target = min(target, max_decimation)
+    if target >= current:
+        return target
+    return max(target, min(_power_of_two(required / 0.75), current))
+
+
+def _power_of_two(factor: float) -> int:
+    """Smallest power of two that is at least ``factor`` (at least 1)."""
+    return 1 if factor <= 1.0 else 2 ** math.ceil(math.log2(factor))
 
 
 class PostProcessorRunner:
@@ -145,10 +238,25 @@ class PostProcessorRunner:
     This class implements the OpenFOAM function object interface (execute, write, end)
     and manages polymorphic output writers via the PostProcessorInterface protocol.
 
+    Writers with a ``budget`` (fraction of the solver wall time) are timed on
+    every write. If an output exceeds its budget, its effective write interval
+    is widened by evaluating only every n-th due write. The costs are reduced
+    over all ranks in one collective call so that all ranks take the same
+    decision.
+
+    The state of stateful nodes (e.g. :class:`~pyOFTools.time_average.TimeAverage`)
+    is kept in one :class:`~pyOFTools.time_average.StateStore` per output, which
+    is active while the output is written. Once every convergence monitor
+    (:class:`~pyOFTools.convergence.Convergence`) has converged, the run is
+    ended with ``Time::writeAndEnd``.
+
     Args:
         mesh: OpenFOAM mesh object
         outputs: Dictionary of registered output configurations (func, writer_cls, kwargs)
         base_path: Base directory for output files
+        profile: Enable timing instrumentation (see :mod:`pyOFTools.profiling`)
+        trace: Write Chrome trace events in addition to the profile summary
+        profile_memory: Also record memory deltas with tracemalloc
     """
 
     def __init__(
@@ -156,16 +264,31 @@ class PostProcessorRunner:
         mesh: fvMesh,
         outputs: dict[str, tuple[Callable[..., Any], type[PostProcessorInterface], dict[str, Any]]],
         base_path: str,
+        profile: bool = False,
+        trace: bool = False,
+        profile_memory: bool = False,
     ):
         """Initialize processor runner with mesh and output configurations."""
         self.mesh = mesh
         self._base_path = base_path
+        self._profiler = (
+            Profiler(trace=trace, memory=profile_memory)
+            if profile or trace or profile_memory
+            else None
+        )
 
         # Instantiate writers from configurations
+        self._names: list[str] = []
         self._writers: list[PostProcessorInterface] = []
+        self._states: list[StateStore] = []
         for name, (func, writer_cls, writer_kwargs) in outputs.items():
             writer = writer_cls(mesh=mesh, func=func, base_path=base_path, **writer_kwargs)  # type: ignore[call-arg]
+            self._names.append(name)
             self._writers.append(writer)
+            self._states.append(StateStore())
+
+        self._budgeted = [w for w in self._writers if getattr(w, "budget", None) is not None]
+        self._last_write_end: Optional[float] = None
 
     def execute(self) -> bool:
         """
@@ -176,8 +299,17 @@ class PostProcessorRunner:
         Returns:
             True to indicate success
         """
-        for writer in self._writers:
-            writer.execute()
+        # the mesh only reports a motion in the time step it moved
+        observe_mesh_motion(self.mesh)
+        if self._profiler is None:
+            for writer in self._writers:
+                writer.execute()
+            return True
+
+        with activate(self._profiler):
+            for name, writer in zip(self._names, self._writers):
+                with self._profiler.section(f"{name}.execute"):
+                    writer.execute()
         return True
 
     def write(self) -> bool:
@@ -189,19 +321,84 @@ class PostProcessorRunner:
         Returns:
             True to indicate success
         """
-        for writer in self._writers:
-            writer.write()
+        start = time.perf_counter()
+        costs: dict[int, float] = {}
+        current_time = self.mesh.time().value()
+        with activate(self._profiler):
+            for name, writer, states in zip(self._names, self._writers, self._states):
+                writer_start = time.perf_counter()
+                states.time = current_time
+                with activate_states(states):
+                    if self._profiler is None:
+                        writer.write()
+                    else:
+                        with self._profiler.section(name):
+                            writer.write()
+                costs[id(writer)] = time.perf_counter() - writer_start
+
+        if self._budgeted and self._last_write_end is not None:
+            self._update_decimation(start - self._last_write_end, costs)
+        self._check_convergence()
+        self._last_write_end = time.perf_counter()
         return True
 
+    def _check_convergence(self) -> None:
+        """End the run once all convergence monitors of all outputs have converged."""
+        decisions = [c for states in self._states for c in states.converged.values()]
+        if not decisions:
+            return
+        # every rank must take the same decision
+        if reduce_max(0.0 if all(decisions) else 1.0) == 0.0:
+            self.mesh.time().writeAndEnd()
+
+    def _update_decimation(self, solver_time: float, costs: dict[int, float]) -> None:
+        """Adapt the decimation of all budgeted writers that were evaluated."""
+        from pybFoam import scalarField
+
+        from . import aggregation
+
+        # one reduction for the solver time and all writer costs
+        local = [solver_time] + [
+            costs[id(w)] if w.evaluated else 0.0  # type: ignore[attr-defined]
+            for w in self._budgeted
+        ]
+        reduced = aggregation.reduce(scalarField(local), "max")  # type: ignore[attr-defined]
+        solver_time = max(float(reduced[0]), 1e-12)
+
+        for i, writer in enumerate(self._budgeted):
+            if not writer.evaluated:  # type: ignore[attr-defined]
+                continue
+            cost = float(reduced[i + 1])
+            required = cost / (writer.budget * solver_time)  # type: ignore[attr-defined]
+            decimation = _decimation_for(
+                required,
+                writer.decimation,  # type: ignore[attr-defined]
+                writer.max_decimation,  # type: ignore[attr-defined]
+            )
+            if decimation != writer.decimation:  # type: ignore[attr-defined]
+                writer.set_decimation(decimation, cost, solver_time)  # type: ignore[attr-defined]
+
     def end(self) -> bool:
         """
         End method called at simulation end.
 
-        Delegates to all registered output writers for cleanup.
+        Delegates to all registered output writers for cleanup and writes the
+        profile summary (and trace) if profiling is enabled.
 
         Returns:
             True to indicate success
         """
         for writer in self._writers:
             writer.end()
+
+        if self._profiler is not None:
+            # all ranks take part in the min/max reduction of the summary
+            header, rows = self._profiler.summary()
+            if is_master():
+                self._profiler.write_summary(
+                    f"{self._base_path}pyOFTools_profile.csv", header, rows
+                )
+                if self._profiler.trace:
+                    self._profiler.write_trace(f"{self._base_path}pyOFTools_trace.json")
+            self._profiler.stop()
         return True
@@ -0,0 +1,207 @@
+"""
+Opt-in timing instrumentation for post-processing.
+
+The PostProcessorRunner activates a :class:`Profiler` while it executes the
+registered outputs. ``WorkFlow.compute`` checks for an active profiler and
+records every node as a nested section of the output that is evaluated, so
+the cost of a single output can be broken down node by node.
+
+Memory deltas are opt-in (``memory=True``): they are measured with
+:mod:`tracemalloc`, which slows down every Python allocation while it is
+tracing, and only cover allocations made through the Python allocator
+(including NumPy arrays), not memory allocated inside OpenFOAM.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+__all__ = [
+    "Profiler",
+    "active_profiler",
+    "activate",
+]
+
+
+_active: Optional[Profiler] = None
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Return the currently active profiler or None if profiling is disabled."""
+    return _active
+
+
+@contextmanager
+def activate(profiler: Optional[Profiler]) -> Iterator[None]:
+    """Make ``profiler`` the active profiler for the duration of the context."""
+    global _active
+    previous = _active
+    _active = profiler
+    try:
+        yield
+    finally:
+        _active = previous
+
+
+class _SectionStats:
+    __slots__ = ("calls", "time", "memory")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.time = 0.0
+        self.memory = 0
+
+
+class Profiler:
+    """
+    Collect wall time, call counts and memory deltas of named sections.
+
+    Sections can be nested; the recorded name is the path of all open
+    sections joined by ``/`` (e.g. ``free_surface_area/1:area``).
+
+    Args:
+        trace: Also record every section as Chrome trace event
+            (viewable in chrome://tracing or https://ui.perfetto.dev)
+        memory: Measure memory allocation deltas with tracemalloc (default: False)
+    """
+
+    def __init__(self, trace: bool = False, memory: bool = False) -> None:
+        self.trace = trace
+        self.memory = memory
+        self._stats: dict[str, _SectionStats] = {}
+        self._stack: list[str] = []
+        self._events: list[dict[str, Any]] = []
+        self._t0 = time.perf_counter()
+        self._owns_tracing = self.memory and not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def section(self, name: str, category: str = "output") -> Iterator[None]:
+        """Time the enclosed block as section ``name``."""
+        self._stack.append(name)
+        path = "/".join(self._stack)
+        mem_start = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            mem_delta = tracemalloc.get_traced_memory()[0] - mem_start if self.memory else 0
+            self._stack.pop()
+
+            stats = self._stats.get(path)
+            if stats is None:
+                stats = self._stats[path] = _SectionStats()
+            stats.calls += 1
+            stats.time += duration
+            stats.memory += mem_delta
+
+            if self.trace:
+                self._events.append(
+                    {
+                        "name": name,
+                        "cat": category,
+                        "ph": "X",
+                        "ts": (start - self._t0) * 1e6,
+                        "dur": duration * 1e6,
+                        "pid": 0,
+                        "tid": 0,
+                        "args": {"path": path, "memory": mem_delta},
+                    }
+                )
+
+    def summary(self) -> tuple[list[str], list[list[Any]]]:
+        """
+        Summarise all sections over all MPI ranks.
+
+        All columns are reduced over the ranks: ``calls_max`` is the largest
+        number of calls of a rank, ``time_mean``/``memory_mean`` the mean and
+        ``*_min``/``*_max`` the extremes over the ranks; ``time_per_call`` is
+        ``time_mean / calls_max``. The summary covers the sections of all
+        ranks; sections that were not entered on a rank count with zero
+        calls, time and memory on that rank.
+
+        All ranks must call this method (one sum, one min and one max
+        reduction).
+
+        Returns:
+            Header and rows of the summary table
+        """
+        from pybFoam import scalarField
+
+        from . import aggregation
+
+        # the reductions are element-wise, so all ranks need the same names
+        names = aggregation.gather_names(sorted(self._stats))  # type: ignore[attr-defined]
+        empty = _SectionStats()
+        stats = [self._stats.get(name, empty) for name in names]
+        # times, memory deltas and calls per section; the trailing 1 counts the ranks
+        local = scalarField(
+            [s.time for s in stats]
+            + [float(s.memory) for s in stats]
+            + [float(s.calls) for s in stats]
+            + [1.0]
+        )
+        rank_sum = aggregation.reduce(local, "sum")  # type: ignore[attr-defined]
+        rank_min = aggregation.reduce(local, "min")  # type: ignore[attr-defined]
+        rank_max = aggregation.reduce(local, "max")  # type: ignore[attr-defined]
+
+        header = [
+            "name",
+            "calls_max",
+            "time_mean",
+            "time_per_call",
+            "time_min",
+            "time_max",
+            "memory_mean",
+            "memory_min",
+            "memory_max",
+        ]
+        n = len(names)
+        n_procs = float(rank_sum[3 * n])
+        rows = []
+        for i, name in enumerate(names):
+            calls = int(rank_max[2 * n + i])
+            time_mean = float(rank_sum[i]) / n_procs
+            rows.append(
+                [
+                    name,
+                    calls,
+                    time_mean,
+                    time_mean / calls if calls else 0.0,
+                    float(rank_min[i]),
+                    float(rank_max[i]),
+                    float(rank_sum[n + i]) / n_procs,
+                    int(rank_min[n + i]),
+                    int(rank_max[n + i]),
+                ]
+            )
+        return header, rows
+
+    def write_summary(self, file_path: str, header: list[str], rows: list[list[Any]]) -> None:
+        """Write the summary table as CSV."""
+        if os.path.dirname(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(",".join(header) + "\n")
+            for row in rows:
+                f.write(",".join(map(str, row)) + "\n")
+
+    def write_trace(self, file_path: str) -> None:
+        """Write the recorded sections in the Chrome trace event format."""
+        if os.path.dirname(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, f)
+
+    def stop(self) -> None:
+        """Stop memory tracing if it was started by this profiler."""
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._owns_tracing = False
@@ -4,23 +4,30 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
+import numpy as np
 from pybFoam import fvMesh
 
 from .datasets import AggregatedData, AggregatedDataSet
 
+_GROUP_NAMES = ["field", "solver", "metric", "iteration"]
 
-def _to_scalar(value: Any) -> float:
-    """Convert residual value to scalar (handle vector/tensor by taking max component)."""
-    return max(value[i] for i in range(len(value))) if hasattr(value, "__len__") else float(value)
 
-
-def residual_dataset(mesh: fvMesh, time_value: Optional[float] = None) -> AggregatedDataSet:
+def residual_dataset(
+    mesh: fvMesh, time_value: Optional[float] = None, components: bool = False
+) -> AggregatedDataSet:
     """
     Extract solver performance information from mesh including inner iterations.
 
+    All entries are read in one call to the compiled
+    ``aggregation.solver_performance``, which returns them as columns; the
+    type of each entry is taken from the registered field, or from the entry
+    itself for fields that are not registered on the mesh.
+
     Args:
         mesh: OpenFOAM mesh object
         time_value: Optional time value (unused, kept for API consistency)
+        components: One row per component of vector and tensor fields (with an
+            additional ``component`` group) instead of the maximum component
 
     Returns:
         AggregatedDataSet with solver performance for all fields in long format.
@@ -29,51 +36,33 @@ def residual_dataset(mesh: fvMesh, time_value: Optional[float] = None) -> Aggreg
     Example:
         >>> mesh = pf.fvMesh(time)
         >>> perf_data = residual_dataset(mesh)
-        >>> # Headers: ['solverPerformance', 'field', 'solver', 'metric', 'iteration']
+        >>> # Headers: ['residuals', 'field', 'solver', 'metric', 'iteration']
     """
-    solver_dict = mesh.solverPerformanceDict()
-    field_names = solver_dict.toc()
+    from . import aggregation
 
-    if not field_names or not field_names.list():
+    table = aggregation.solver_performance(mesh, components)  # type: ignore[attr-defined]
+    fields = table.field
+    if not fields:
         return AggregatedDataSet(name="solverPerformance", values=[])
 
-    aggregated_values = []
-    lookup_methods = [
-        solver_dict.lookupSolverPerformanceScalarList,
-        solver_dict.lookupSolverPerformanceVectorList,
-        solver_dict.lookupSolverPerformanceTensorList,
+    columns: list[tuple[str, list[Any]]] = [
+        ("init_res", np.asarray(table.initialResidual).tolist()),
+        ("final_res", np.asarray(table.finalResidual).tolist()),
+        ("nSolverIters", np.asarray(table.nIterations, dtype=float).tolist()),
     ]
+    iterations = np.asarray(table.iteration).tolist()
+    cmpts = np.asarray(table.component).tolist()
+    group_names = _GROUP_NAMES + ["component"] if components else _GROUP_NAMES
 
-    for field_name_word in field_names.list():
-        field_name = str(field_name_word)
-
-        for lookup_method in lookup_methods:
-            try:
-                solver_perf_list = lookup_method(field_name)
-
-                # Iterate through all solver performances (inner iterations)
-                for iter_idx, solver_perf in enumerate(solver_perf_list):  # type: ignore[var-annotated, arg-type]
-                    solver_name = str(solver_perf.solverName())
-                    init_res = _to_scalar(solver_perf.initialResidual())
-                    final_res = _to_scalar(solver_perf.finalResidual())
-                    n_iters = float(solver_perf.nIterations())
-
-                    group_names = ["field", "solver", "metric", "iteration"]
-
-                    for metric_name, value in [
-                        ("init_res", init_res),
-                        ("final_res", final_res),
-                        ("nSolverIters", n_iters),
-                    ]:
-                        aggregated_values.append(
-                            AggregatedData(
-                                value=value,
-                                group=[field_name, solver_name, metric_name, iter_idx],
-                                group_name=group_names,
-                            )
-                        )
-                break
-            except Exception:
-                continue
+    # the columns are already typed, so the rows are built without validation
+    aggregated_values = []
+    for i, (field_name, solver_name) in enumerate(zip(fields, table.solver)):
+        for metric_name, values in columns:
+            group = [field_name, solver_name, metric_name, iterations[i]]
+            if components:
+                group.append(cmpts[i])
+            aggregated_values.append(
+                AggregatedData.model_construct(value=values[i], group=group, group_name=group_names)
+            )
 
     return AggregatedDataSet(name="residuals", values=aggregated_values)
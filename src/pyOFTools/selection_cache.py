@@ -0,0 +1,175 @@
+"""
+Memoization of spatial selections.
+
+On a static mesh the selection of a spatial selector never changes, so it
+is computed once and reused by every later evaluation of the workflow. The
+cache key combines
+
+- the selector definition (its JSON serialisation),
+- the identity of the mesh and
+- the mesh state: the number of cells (topology changes) and the time of
+  the last observed motion of the mesh (see :func:`mesh_state`).
+
+Entries are evicted in least-recently-used order once the cached selections
+exceed a memory budget (see :meth:`SelectionCache.resize`).
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, MutableMapping, Optional, Tuple
+
+import numpy as np
+
+__all__ = [
+    "SelectionCache",
+    "mesh_reference",
+    "mesh_state",
+    "observe_mesh_motion",
+    "selection_cache",
+]
+
+# Default memory budget of the cached selections (bytes)
+DEFAULT_MAX_BYTES = 256 * 1024**2
+
+
+# Time of the last observed change of every mesh that reports changing()
+_last_change: dict[int, Tuple[Callable[[], Any], float]] = {}
+
+
+def observe_mesh_motion(mesh: Any) -> Optional[float]:
+    """
+    Record a change of ``mesh`` at the current time if it reports ``changing()``.
+
+    OpenFOAM only reports a change for the time step in which the mesh moved,
+    so the PostProcessorRunner calls this every time step.
+
+    Returns:
+        Time of the last observed change, None if the mesh never changed
+    """
+    entry = _last_change.get(id(mesh))
+    if entry is not None and entry[0]() is not mesh:
+        entry = None
+    if mesh.changing():
+        time = mesh.time().value()
+        if entry is None or entry[1] != time:
+            ref = entry[0] if entry is not None else mesh_reference(mesh, _last_change)
+            entry = _last_change[id(mesh)] = (ref, time)
+    return None if entry is None else entry[1]
+
+
+def mesh_state(mesh: Any) -> Tuple[Any, ...]:
+    """
+    Return a key describing the identity and state of ``mesh``.
+
+    The state is the number of cells (topology changes) and the time of the
+    last observed change (see :func:`observe_mesh_motion`), so it stays
+    different from the initial state after the motion stopped. Meshes
+    without a ``changing()`` method are treated as changing at every time.
+    """
+    if getattr(mesh, "changing", None) is None:
+        return (id(mesh), mesh.nCells(), mesh.time().value())
+    return (id(mesh), mesh.nCells(), observe_mesh_motion(mesh))
+
+
+def mesh_reference(
+    mesh: Any, registry: MutableMapping[Any, Any], key: Any = None
+) -> Callable[[], Any]:
+    """
+    Return a weak reference to ``mesh`` for an entry ``registry[key]``.
+
+    ``key`` defaults to ``id(mesh)``; the first item of the entry must be
+    the returned reference. The entry is removed when the mesh is freed, so
+    per-mesh caches do not keep meshes alive. Objects that do not support
+    weak references are referenced strongly (one entry per mesh).
+    """
+    if key is None:
+        key = id(mesh)
+
+    def _drop(ref: Any) -> None:
+        entry = registry.get(key)
+        if entry is not None and entry[0] is ref:
+            del registry[key]
+
+    try:
+        return weakref.ref(mesh, _drop)
+    except TypeError:
+        return lambda: mesh
+
+
+class SelectionCache:
+    """
+    LRU cache of selections bounded by memory.
+
+    A selection is the sorted index array or the bool mask returned by a
+    selector together with the number of elements it was computed for.
+    Cached arrays are read-only.
+
+    Args:
+        max_bytes: Memory budget of the cached arrays
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, np.ndarray, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, owner: Any = None) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Return the cached ``(selection, size)`` for ``key`` or None.
+
+        Args:
+            key: Cache key
+            owner: Object the entry was stored for (e.g. the mesh); guards
+                against ids in the key being reused by a new object
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not owner:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def put(self, key: Hashable, selection: np.ndarray, size: int, owner: Any = None) -> None:
+        """Store a selection, evicting the least recently used ones if needed."""
+        selection = np.asarray(selection)
+        if selection.nbytes > self.max_bytes:
+            return
+        selection.flags.writeable = False
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1].nbytes
+        self._entries[key] = (owner, selection, size)
+        self.nbytes += selection.nbytes
+        self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the memory budget."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop all cached selections."""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and self._entries:
+            _, (_, selection, _) = self._entries.popitem(last=False)
+            self.nbytes -= selection.nbytes
+
+
+_cache = SelectionCache()
+
+
+def selection_cache() -> SelectionCache:
+    """Return the cache shared by all spatial selectors."""
+    return _cache
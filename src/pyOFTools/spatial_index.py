@@ -0,0 +1,169 @@
+"""
+Spatial index over cell centres for fast region queries.
+
+Selecting a small region (probe boxes, refinement zones) on a large mesh does
+not need to test every cell centre. A :class:`UniformGridIndex` sorts the
+points into a regular grid of bins once; a query then only gathers the
+points of the bins overlapping the query box, which the selectors test
+exactly.
+
+The index is built lazily, once per mesh state, and shared by all selectors
+evaluated on that mesh (see :func:`index_for_mesh`). It is rebuilt when the
+mesh moves or changes its topology.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from .selection_cache import mesh_reference, mesh_state
+
+if TYPE_CHECKING:
+    from pybFoam import fvMesh
+
+
+__all__ = [
+    "UniformGridIndex",
+    "index_for_mesh",
+    "clear",
+    "MIN_POINTS",
+]
+
+# Meshes with fewer cells are not indexed: a dense test is fast enough
+MIN_POINTS = 100_000
+
+
+class UniformGridIndex:
+    """
+    Uniform grid of bins over a point cloud.
+
+    Args:
+        positions: Points of shape ``(n, 3)``
+        points_per_bin: Average number of points per bin (default: 8)
+    """
+
+    def __init__(self, positions: np.ndarray, points_per_bin: int = 8) -> None:
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.n_points = len(positions)
+
+        if self.n_points == 0:
+            self._lo = np.zeros(3)
+            self._hi = np.zeros(3)
+        else:
+            self._lo = positions.min(axis=0)
+            self._hi = positions.max(axis=0)
+        extent = self._hi - self._lo
+
+        # bin size for the requested density; axes thinner than one bin
+        # (e.g. the empty direction of 2D cases) are not subdivided
+        active = extent > 0.0
+        n_bins = max(self.n_points // points_per_bin, 1)
+        for _ in range(3):
+            if not active.any():
+                break
+            h = (np.prod(extent[active]) / n_bins) ** (1.0 / active.sum())
+            thin = active & (extent < h)
+            if not thin.any():
+                break
+            active &= ~thin
+        dims = np.ones(3, dtype=np.int64)
+        if active.any():
+            dims[active] = np.clip(np.ceil(extent[active] / h), 1, None).astype(np.int64)
+        self._dims = dims
+        self._scale = np.where(active, dims / np.where(active, extent, 1.0), 0.0)
+
+        bins = self._bin_ids(positions)
+        self._order = np.argsort(bins, kind="stable")
+        counts = np.bincount(bins, minlength=int(np.prod(dims)))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def _bin_ijk(self, points: np.ndarray) -> np.ndarray:
+        ijk = np.floor((points - self._lo) * self._scale).astype(np.int64)
+        return np.clip(ijk, 0, self._dims - 1)  # type: ignore[no-any-return]
+
+    def _bin_ids(self, positions: np.ndarray) -> np.ndarray:
+        ijk = self._bin_ijk(positions)
+        return np.ravel_multi_index(tuple(ijk.T), tuple(self._dims))  # type: ignore[no-any-return]
+
+    def query(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """
+        Return the sorted indices of all points in bins overlapping ``[lo, hi]``.
+
+        The result is a superset of the points inside the box; callers apply
+        the exact test on the candidates.
+        """
+        lo = np.asarray(lo, dtype=float)
+        hi = np.asarray(hi, dtype=float)
+        outside = np.any(hi < self._lo) or np.any(lo > self._hi) or np.any(lo > hi)
+        if self.n_points == 0 or outside:
+            return np.empty(0, dtype=np.int64)
+
+        i0 = self._bin_ijk(np.maximum(lo, self._lo)[None, :])[0]
+        i1 = self._bin_ijk(np.minimum(hi, self._hi)[None, :])[0]
+        ranges = [np.arange(a, b + 1) for a, b in zip(i0, i1)]
+        grid = np.meshgrid(*ranges, indexing="ij")
+        bins = np.ravel_multi_index(tuple(g.ravel() for g in grid), tuple(self._dims))
+
+        starts = self._offsets[bins]
+        lengths = self._offsets[bins + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # concatenate the ranges [start, start + length) without a Python loop
+        run_start = np.cumsum(lengths) - lengths
+        idx = np.arange(total) - np.repeat(run_start - starts, lengths)
+        return np.sort(self._order[idx])
+
+    def estimate(self, lo: np.ndarray, hi: np.ndarray) -> float:
+        """Estimated fraction of points returned by :meth:`query` (cheap, no gather)."""
+        if self.n_points == 0:
+            return 0.0
+        lo = np.maximum(np.asarray(lo, dtype=float), self._lo)
+        hi = np.minimum(np.asarray(hi, dtype=float), self._hi)
+        if np.any(lo > hi):
+            return 0.0
+        n_bins = np.prod(self._bin_ijk(hi[None, :])[0] - self._bin_ijk(lo[None, :])[0] + 1)
+        return float(n_bins / np.prod(self._dims))
+
+
+# Index of the current state of every mesh: id -> (reference to the mesh,
+# mesh state, index). Only the newest index of a mesh is kept and the entry
+# is dropped when the mesh is freed.
+_indices: dict[int, Tuple[Callable[[], Any], Tuple[Any, ...], UniformGridIndex]] = {}
+
+
+def index_for_mesh(mesh: fvMesh, positions: Any) -> Optional[UniformGridIndex]:
+    """
+    Return the spatial index of the cell centres of ``mesh``.
+
+    The index is built on first use and shared afterwards, until the state of
+    the mesh changes (see :func:`~pyOFTools.selection_cache.mesh_state`).
+    Returns None for meshes with fewer than :data:`MIN_POINTS` cells.
+
+    Args:
+        mesh: OpenFOAM mesh object (identity of the index)
+        positions: Cell centres of ``mesh``
+    """
+    if len(positions) < MIN_POINTS:
+        _indices.pop(id(mesh), None)
+        return None
+    state = mesh_state(mesh)
+    entry = _indices.get(id(mesh))
+    if (
+        entry is not None
+        and entry[0]() is mesh
+        and entry[1] == state
+        and entry[2].n_points == len(positions)
+    ):
+        return entry[2]
+    index = UniformGridIndex(np.asarray(positions))
+    _indices[id(mesh)] = (mesh_reference(mesh, _indices), state, index)
+    return index
+
+
+def clear() -> None:
+    """Drop all cached indices."""
+    _indices.clear()
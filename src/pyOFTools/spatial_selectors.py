@@ -1,18 +1,134 @@
-from copy import copy
-from typing import Annotated, Literal, Tuple, Union
+import os
+from typing import Annotated, Any, Literal, Optional, Tuple, Union
 
 import numpy as np
-from pybFoam import boolList
 from pydantic import Field
 
-from .datasets import DataSets
+from .datasets import DataSets, set_selection
 from .node import Node
+from .selection_cache import selection_cache
+from .spatial_index import UniformGridIndex
+from .triangulated_surface import load_surface
+
+# Axis-aligned bounding box (min, max) of a selected region, None if unbounded
+Bounds = Optional[Tuple[np.ndarray, np.ndarray]]
+
+# Evaluate a sub-expression only on the candidate points if they make up less
+# than this fraction of all points; otherwise evaluate it on all points
+_SUBSET_FRACTION = 0.25
+
+
+def _in_bounds(positions: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Points inside the axis-aligned box [lo, hi], built with in-place ops."""
+    mask = positions[:, 0] >= lo[0]
+    mask &= positions[:, 0] <= hi[0]
+    for i in (1, 2):
+        mask &= positions[:, i] >= lo[i]
+        mask &= positions[:, i] <= hi[i]
+    return mask
+
+
+def _select_on(
+    selector: "SpatialSelector", positions: np.ndarray, candidates: np.ndarray
+) -> np.ndarray:
+    """Evaluate ``selector`` only on the points flagged in ``candidates``.
+
+    ``candidates`` is modified in place and returned as the result.
+    """
+    idx = np.flatnonzero(candidates)
+    if idx.size == 0:
+        return candidates
+    if idx.size < _SUBSET_FRACTION * len(positions):
+        candidates[idx] = selector._select(positions[idx])
+    else:
+        candidates &= selector._select(positions)
+    return candidates
+
 
 # --- Base class ---
 
 
 class SpatialSelector(Node):
-    def compute(self, coords: DataSets) -> DataSets:
+    """Base class of all spatial selectors.
+
+    A selector tree (combined with ``&``, ``|`` and ``~``) is evaluated in a
+    single pass over one positions array: sub-expressions are culled with
+    their bounding boxes, the right operand of ``&``/``|`` is only evaluated
+    on the points that are still undecided, and all boolean combinations are
+    done in place. Only the final selection is converted to a ``boolList``,
+    or to a ``labelList`` of indices if only a few points are selected
+    (see :func:`pyOFTools.datasets.set_selection`).
+
+    If the geometry provides a ``spatial_index`` (see
+    :mod:`pyOFTools.spatial_index`) and the selected region is small, only
+    the candidate points returned by the index are tested.
+
+    If the geometry provides a ``cache_key``, the selection is memoized (see
+    :mod:`pyOFTools.selection_cache`) and repeated evaluations on a static
+    mesh skip the selection entirely.
+    """
+
+    def compute(self, dataset: DataSets) -> DataSets:
+        geometry = dataset.geometry  # type: ignore[union-attr]
+        geometry_key = getattr(geometry, "cache_key", None)
+        if geometry_key is None:
+            selected, size = self._compute_selection(geometry)
+        else:
+            key = (self._cache_key(), geometry_key)
+            owner = getattr(geometry, "mesh", None)
+            cached = selection_cache().get(key, owner)
+            if cached is None:
+                selected, size = self._compute_selection(geometry)
+                selection_cache().put(key, selected, size, owner)
+            else:
+                selected, size = cached
+        set_selection(dataset, selected, size)  # type: ignore[arg-type]
+        return dataset
+
+    def _compute_selection(self, geometry: Any) -> Tuple[np.ndarray, int]:
+        positions = np.asarray(geometry.positions)
+        index = getattr(geometry, "spatial_index", None)
+        selected = self.select_indices(positions, index) if index is not None else None
+        if selected is None:
+            selected = self.evaluate(positions)
+        return selected, len(positions)
+
+    def _cache_key(self) -> str:
+        """Identifies the selection of this selector (for caching)."""
+        return self.model_dump_json()
+
+    def select_indices(
+        self, positions: np.ndarray, index: UniformGridIndex
+    ) -> Optional[np.ndarray]:
+        """
+        Return the sorted indices of the selected points using a spatial index.
+
+        Returns None if the region is unbounded or too large for the index to
+        pay off; use :meth:`evaluate` in that case.
+        """
+        bounds = self._bounds()
+        if bounds is None or index.estimate(*bounds) > _SUBSET_FRACTION:
+            return None
+        candidates = index.query(*bounds)
+        if candidates.size == 0:
+            return candidates
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        return candidates[self._select(positions[candidates])]  # type: ignore[no-any-return]
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        """Return the selection of ``positions`` (shape ``(n, 3)``) as bool array."""
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        bounds = self._bounds()
+        if bounds is None:
+            return np.ascontiguousarray(self._select(positions), dtype=bool)
+        return _select_on(self, positions, _in_bounds(positions, *bounds))
+
+    def _bounds(self) -> Bounds:
+        """Bounding box of the selected region (None if unbounded)."""
+        return None
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        """Return a new bool array; the caller may modify it in place."""
         raise NotImplementedError
 
     def __and__(self, other: "SpatialSelector") -> "BinarySpatialSelector":
@@ -32,11 +148,16 @@ class Box(SpatialSelector):
     min: Tuple[float, float, float]
     max: Tuple[float, float, float]
 
-    def compute(self, dataset: DataSets) -> DataSets:
-        positions = np.asarray(dataset.geometry.positions)  # type: ignore[union-attr]
-        mask = np.all((positions >= self.min) & (positions <= self.max), axis=1)
-        dataset.mask = boolList(np.ascontiguousarray(mask, dtype=bool))  # type: ignore[union-attr]
-        return dataset
+    def _bounds(self) -> Bounds:
+        return np.array(self.min, dtype=float), np.array(self.max, dtype=float)
+
+    def evaluate(self, positions: np.ndarray) -> np.ndarray:
+        # the bounding box test is the exact test
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        return self._select(positions)
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        return _in_bounds(positions, *self._bounds())  # type: ignore[misc]
 
 
 @Node.register()
@@ -45,11 +166,121 @@ class Sphere(SpatialSelector):
     center: Tuple[float, float, float]
     radius: float
 
-    def compute(self, dataset: DataSets) -> DataSets:
-        positions = np.asarray(dataset.geometry.positions)  # type: ignore[union-attr]
-        mask = np.linalg.norm(positions - self.center, axis=1) <= self.radius
-        dataset.mask = boolList(np.ascontiguousarray(mask, dtype=bool))  # type: ignore[union-attr]
-        return dataset
+    def _bounds(self) -> Bounds:
+        center = np.array(self.center, dtype=float)
+        return center - self.radius, center + self.radius
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        d = positions - np.asarray(self.center)
+        return np.einsum("ij,ij->i", d, d) <= self.radius * self.radius  # type: ignore[no-any-return]
+
+
+@Node.register()
+class Cylinder(SpatialSelector):
+    """Finite cylinder between the centres of its end caps ``point1`` and ``point2``."""
+
+    type: Literal["cylinder"] = "cylinder"
+    point1: Tuple[float, float, float]
+    point2: Tuple[float, float, float]
+    radius: float
+
+    def _bounds(self) -> Bounds:
+        p1 = np.array(self.point1, dtype=float)
+        p2 = np.array(self.point2, dtype=float)
+        axis = p2 - p1
+        length = np.linalg.norm(axis)
+        if length == 0.0:
+            return p1, p1
+        # extent of the circular end caps in each direction
+        extent = self.radius * np.sqrt(np.clip(1.0 - (axis / length) ** 2, 0.0, None))
+        return np.minimum(p1, p2) - extent, np.maximum(p1, p2) + extent
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        p1 = np.asarray(self.point1, dtype=float)
+        axis = np.asarray(self.point2, dtype=float) - p1
+        length_sqr = float(axis @ axis)
+        d = positions - p1
+        t = d @ axis
+        mask = t >= 0.0
+        mask &= t <= length_sqr
+        # squared distance to the axis: |d|^2 - (d.axis)^2 / |axis|^2
+        dist_sqr = np.einsum("ij,ij->i", d, d)
+        if length_sqr > 0.0:
+            dist_sqr -= t * t / length_sqr
+        mask &= dist_sqr <= self.radius * self.radius
+        return mask
+
+
+@Node.register()
+class HalfSpace(SpatialSelector):
+    """Half-space on the side of the plane the ``normal`` points to."""
+
+    type: Literal["halfSpace"] = "halfSpace"
+    point: Tuple[float, float, float]
+    normal: Tuple[float, float, float]
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        distance = (positions - np.asarray(self.point, dtype=float)) @ np.asarray(self.normal)
+        return distance >= 0.0  # type: ignore[no-any-return]
+
+
+@Node.register()
+class OrientedBox(SpatialSelector):
+    """
+    Box spanned by the edge vectors ``i``, ``j`` and ``k`` from ``origin``.
+
+    The edges need not be orthogonal (a parallelepiped).
+    """
+
+    type: Literal["orientedBox"] = "orientedBox"
+    origin: Tuple[float, float, float]
+    i: Tuple[float, float, float]
+    j: Tuple[float, float, float]
+    k: Tuple[float, float, float]
+
+    def _bounds(self) -> Bounds:
+        edges = np.array([self.i, self.j, self.k], dtype=float)
+        corners = np.asarray(self.origin, dtype=float) + np.array(
+            [[a, b, c] for a in (0, 1) for b in (0, 1) for c in (0, 1)], dtype=float
+        ) @ edges
+        return corners.min(axis=0), corners.max(axis=0)
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        edges = np.array([self.i, self.j, self.k], dtype=float)
+        # local coordinates in the basis of the edges; inside if all in [0, 1]
+        local = np.linalg.solve(edges.T, (positions - np.asarray(self.origin, dtype=float)).T).T
+        return _in_bounds(local, np.zeros(3), np.ones(3))
+
+
+@Node.register()
+class SurfaceInside(SpatialSelector):
+    """
+    Region inside (or outside) a closed STL surface.
+
+    The surface is read once and kept until the file changes (see
+    :mod:`pyOFTools.triangulated_surface`).
+    """
+
+    type: Literal["surfaceInside"] = "surfaceInside"
+    file: str
+    inside: bool = True
+
+    def _cache_key(self) -> str:
+        # a changed file yields a different selection
+        stat = os.stat(self.file)
+        return f"{self.model_dump_json()}:{stat.st_mtime}:{stat.st_size}"
+
+    def _bounds(self) -> Bounds:
+        if not self.inside:
+            return None
+        lo, hi = load_surface(self.file).bounds
+        return lo.copy(), hi.copy()
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        mask = load_surface(self.file).inside(positions)
+        if not self.inside:
+            np.logical_not(mask, out=mask)
+        return mask
 
 
 # --- Logical ---
@@ -58,10 +289,9 @@ class NotSpatialSelector(SpatialSelector):
     type: Literal["not"]
     region: "SpatialSelectorModel"
 
-    def compute(self, dataset: DataSets) -> DataSets:
-        mask = ~np.asarray(self.region.compute(dataset).mask)  # type: ignore[union-attr]
-        dataset.mask = boolList(np.ascontiguousarray(mask, dtype=bool))  # type: ignore[union-attr]
-        return dataset
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        mask = self.region._select(positions)
+        return np.logical_not(mask, out=mask)
 
 
 @Node.register()
@@ -71,18 +301,48 @@ class BinarySpatialSelector(SpatialSelector):
     left: "SpatialSelectorModel"
     right: "SpatialSelectorModel"
 
-    def compute(self, dataset: DataSets) -> DataSets:
-        ds_l = self.left.compute(copy(dataset))
-        ds_r = self.right.compute(copy(dataset))
+    def _bounds(self) -> Bounds:
+        left = self.left._bounds()
+        right = self.right._bounds()
         if self.op == "and":
-            mask = np.asarray(ds_l.mask) & np.asarray(ds_r.mask)  # type: ignore[union-attr]
-        else:  # self.op == "or"
-            mask = np.asarray(ds_l.mask) | np.asarray(ds_r.mask)  # type: ignore[union-attr]
-        dataset.mask = boolList(np.ascontiguousarray(mask, dtype=bool))  # type: ignore[union-attr]
-        return dataset
+            if left is None or right is None:
+                return left if right is None else right
+            return np.maximum(left[0], right[0]), np.minimum(left[1], right[1])
+        # self.op == "or"
+        if left is None or right is None:
+            return None
+        return np.minimum(left[0], right[0]), np.maximum(left[1], right[1])
+
+    def _select(self, positions: np.ndarray) -> np.ndarray:
+        bounds = self._bounds()
+        if bounds is not None and np.any(bounds[0] > bounds[1]):
+            # disjoint operands of "and": nothing can be selected
+            return np.zeros(len(positions), dtype=bool)
+
+        mask = self.left._select(positions)
+        if self.op == "and":
+            # only points selected by the left operand can be selected
+            return _select_on(self.right, positions, mask)
+
+        # self.op == "or": only points not yet selected need to be tested
+        undecided = np.logical_not(mask)
+        right = self.right._bounds()
+        if right is not None:
+            undecided &= _in_bounds(positions, *right)
+        mask |= _select_on(self.right, positions, undecided)
+        return mask
 
 
 SpatialSelectorModel = Annotated[
-    Union[Box, Sphere, NotSpatialSelector, BinarySpatialSelector],
+    Union[
+        Box,
+        Sphere,
+        Cylinder,
+        HalfSpace,
+        OrientedBox,
+        SurfaceInside,
+        NotSpatialSelector,
+        BinarySpatialSelector,
+    ],
     Field(discriminator="type"),
 ]
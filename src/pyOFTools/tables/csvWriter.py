@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import json
+import math
 import os
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from ..datasets import DataSets
 
@@ -29,9 +31,77 @@ def _add_indices(values: Any) -> list[str]:
     return out
 
 
+def _reverse_lines(
+    f: Any, start: int, end: int, block_size: int = 1 << 16
+) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` pairs of a binary file from ``end`` back to ``start``.
+
+    Reads the file in blocks of ``block_size`` bytes, so only the scanned tail
+    is touched regardless of the file size.
+    """
+    pos = end
+    tail = b""
+    while pos > start:
+        size = min(block_size, pos - start)
+        pos -= size
+        f.seek(pos)
+        chunk = f.read(size) + tail
+        lines = chunk.split(b"\n")
+        tail = lines[0]
+        offset = pos + len(chunk)
+        for line in reversed(lines[1:]):
+            offset -= len(line)
+            yield offset, line
+            offset -= 1
+    yield start, tail
+
+
+def _truncate_rows_after(file_path: str, time: float, block_size: int = 1 << 16) -> list[str]:
+    """Drop all rows with a time value larger than ``time`` from a CSV table.
+
+    The file is scanned backwards from its end until the first row with a time
+    less or equal to ``time`` is found, so the cost only depends on the number
+    of removed rows. Incomplete or unparsable trailing rows (e.g. from an aborted
+    run) are removed as well.
+
+    Returns:
+        The header of the table (empty if the file has no header).
+    """
+    with open(file_path, "rb+") as f:
+        header = f.readline()
+        header_end = f.tell()
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+
+        cut = end
+        for offset, line in _reverse_lines(f, header_end, end, block_size):
+            if not line.strip():
+                cut = offset
+                continue
+            try:
+                row_time = float(line.split(b",", 1)[0])
+            except ValueError:
+                cut = offset
+                continue
+            if row_time > time and not math.isclose(row_time, time, rel_tol=1e-9):
+                cut = offset
+                continue
+            break
+
+        f.truncate(cut)
+        # make sure appended rows start on a new line
+        if cut > 0:
+            f.seek(cut - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    return header.decode().strip().split(",") if header.strip() else []
+
+
 class CSVWriter(BaseModel):
     file_path: str
     header: Optional[list[str]] = None
+    _verify_header: bool = PrivateAttr(default=False)
 
     def create_file(self) -> None:
         # create parent folder if it does not exists and parent folder is not ''
@@ -41,20 +111,55 @@ class CSVWriter(BaseModel):
             if self.header:
                 f.write(",".join(self.header) + "\n")
 
+    def resume(self, start_time: float) -> None:
+        """Continue an existing table after a restart at ``start_time``.
+
+        Rows written after ``start_time`` by the previous run are removed and
+        new results are appended. The existing header is compared against the
+        header of the first new result; if the columns differ, the table is
+        recreated from scratch. Falls back to :meth:`create_file` if there is no
+        table to continue.
+        """
+        if not os.path.isfile(self.file_path) or os.path.getsize(self.file_path) == 0:
+            self.create_file()
+            return
+
+        header = _truncate_rows_after(self.file_path, start_time)
+        if self.header is None and header:
+            self.header = header
+            self._verify_header = True
+
     def _write_header(self, dataset: DataSets) -> None:
-        if self.header is None:
-            self.header = ["time"] + dataset.headers  # type: ignore[union-attr]
-            with open(self.file_path, "w") as f:
-                f.write(",".join(self.header) + "\n")
+        header = ["time"] + dataset.headers  # type: ignore[union-attr]
+        self._verify_header = False
+        if header == self.header:
+            # resumed table with matching columns, keep appending
+            return
+        self.header = header
+        with open(self.file_path, "w") as f:
+            f.write(",".join(self.header) + "\n")
 
     def write_result(self, time: float, result: DataSets) -> None:
         """Write pre-computed result to CSV (no workflow.compute() call)."""
-        if self.header is None:
+        if self.header is None or self._verify_header:
             self._write_header(result)
 
         with open(self.file_path, "a") as f:
             for val in result.grouped_values:  # type: ignore[union-attr]
                 f.write(",".join(map(str, [time] + val)) + "\n")
 
+    def write_rows(self, header: list[str], rows: list[list[Any]]) -> None:
+        """Write a complete table (e.g. merged offline results), replacing the file."""
+        self.header = header
+        self.create_file()
+        with open(self.file_path, "a") as f:
+            for row in rows:
+                f.write(",".join(map(str, row)) + "\n")
+
+    def write_metadata(self, metadata: dict[str, Any]) -> None:
+        """Write table metadata to a JSON file next to the table (``<file>.meta.json``)."""
+        with open(f"{self.file_path}.meta.json", "w") as f:
+            json.dump(metadata, f, indent=2)
+
     def close(self) -> None:
         pass
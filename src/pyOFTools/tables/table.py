@@ -9,7 +9,8 @@ using Pydantic discriminated unions for format selection.
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Annotated, Any, Callable, Literal, Union
+import time
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -17,14 +18,12 @@ if TYPE_CHECKING:
     from pybFoam import fvMesh
 
 
+from ..parallel import is_master, reduce_max
 from .csvWriter import CSVWriter
 
 
-def _is_master() -> bool:
-    """Check if this is the master MPI rank. Returns True in serial runs."""
-    from pybFoam import Pstream
-
-    return bool(Pstream.master())
+# Supported write controls, following the OpenFOAM function object semantics
+_WRITE_CONTROLS = ("writeTime", "timeStep", "runTime", "adjustableRunTime", "clockTime", "cpuTime")
 
 
 class CSVFormatConfig(BaseModel):
@@ -69,8 +68,17 @@ class TableWriter:
         func: Workflow function to evaluate
         base_path: Base directory for output files
         filename: Output filename (extension determines format)
-        writeControl: When to write ("writeTime" or "timeStep")
-        writeInterval: Interval for writing (default: 1)
+        writeControl: When to write. One of "writeTime", "timeStep" (interval in
+            time steps), "runTime"/"adjustableRunTime" (interval in simulated
+            seconds), "clockTime" (wall-clock seconds) or "cpuTime" (CPU seconds)
+        writeInterval: Interval for writing (default: 1); a whole number of time
+            steps for "timeStep"
+        restart: Continue an existing table instead of overwriting it. Rows
+            written after the current (start) time are removed (default: False)
+        budget: Maximum fraction of the solver wall time this output may use.
+            If exceeded, the PostProcessorRunner only evaluates every n-th due
+            write (default: None, no budget)
+        maxDecimation: Upper limit for the decimation factor (default: 64)
 
     Example:
         >>> def compute_mass(mesh):
@@ -101,9 +109,29 @@ class TableWriter:
         base_path: str,
         filename: str,
         writeControl: str = "writeTime",
-        writeInterval: int = 1,
+        writeInterval: float = 1,
+        restart: bool = False,
+        budget: Optional[float] = None,
+        maxDecimation: int = 64,
     ):
         """Initialize TableWriter with configuration and format dispatch."""
+        if writeControl not in _WRITE_CONTROLS:
+            raise ValueError(
+                f"Unsupported writeControl '{writeControl}'. "
+                f"Supported controls: {', '.join(_WRITE_CONTROLS)}"
+            )
+        if writeInterval <= 0:
+            raise ValueError(f"writeInterval must be positive, got {writeInterval}")
+        if writeControl == "timeStep" and (
+            writeInterval < 1 or float(writeInterval) != int(writeInterval)
+        ):
+            raise ValueError(
+                f"writeInterval must be a whole number of time steps for writeControl "
+                f"'timeStep', got {writeInterval}"
+            )
+        if budget is not None and budget <= 0:
+            raise ValueError(f"budget must be positive, got {budget}")
+
         self.mesh = mesh
         self.func = func
         self.filename = filename
@@ -111,6 +139,23 @@ class TableWriter:
         self.write_interval = writeInterval
         self._step_count = 0
 
+        # State for the time based write controls: the output is due whenever
+        # the interval index (elapsed / writeInterval) increases
+        self._execution_index = 0
+        self._start_time = self.mesh.time().value()
+        self._last_time = self._start_time
+        self._start_clock = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+        # Compute budget: only every `decimation`-th due write is evaluated.
+        # The factor is adjusted by the PostProcessorRunner.
+        self.budget = budget
+        self.max_decimation = maxDecimation
+        self.decimation = 1
+        self.evaluated = False
+        self._due_count = 0
+        self._decimation_log: list[dict[str, float]] = []
+
         # Extract file extension and map to format
         _, ext = os.path.splitext(filename)
 
@@ -133,10 +178,13 @@ class TableWriter:
             raise ValueError(f"Unknown format: {format_name}")
 
         # Create format writer (only master rank writes files)
-        self._is_master = _is_master()
+        self._is_master = is_master()
         self._format_writer = format_config.create_writer()
         if self._is_master:
-            self._format_writer.create_file()
+            if restart:
+                self._format_writer.resume(start_time=self.mesh.time().value())
+            else:
+                self._format_writer.create_file()
 
     def execute(self) -> bool:
         """
@@ -160,14 +208,14 @@ class TableWriter:
         Returns:
             True to indicate success
         """
-        # Check if we should write this output
-        should_write = False
-        if self.write_control == "writeTime":
-            should_write = True
-        elif self.write_control == "timeStep":
-            should_write = (self._step_count % self.write_interval) == 0
-
-        if should_write:
+        # Check if we should write this output before building the workflow,
+        # so skipped steps do not pay for e.g. iso-surface construction
+        self.evaluated = False
+        if self._should_write():
+            self._due_count += 1
+            if (self._due_count - 1) % self.decimation != 0:
+                return True
+            self.evaluated = True
             current_time = self.mesh.time().value()
             # All ranks must compute — aggregation uses Foam::reduce internally
             workflow: Any = self.func(self.mesh)  # WorkFlow
@@ -178,6 +226,68 @@ class TableWriter:
 
         return True
 
+    def _should_write(self) -> bool:
+        """Evaluate the write control for the current time step.
+
+        The time based controls follow the OpenFOAM ``timeControl`` semantics:
+        the output is written when ``elapsed / writeInterval`` passes the next
+        integer. For "runTime" half a time step is added to the elapsed time to
+        avoid missing a write due to round-off. Clock and CPU times are reduced
+        with the maximum over all ranks so every rank takes the same decision.
+        Under "adjustableRunTime" the time step is not adjusted by this writer;
+        the output is written at the first step reaching the interval.
+        """
+        if self.write_control == "writeTime":
+            return True
+        if self.write_control == "timeStep":
+            return (self._step_count % int(self.write_interval)) == 0
+
+        if self.write_control in ("runTime", "adjustableRunTime"):
+            current_time = self.mesh.time().value()
+            delta_t = current_time - self._last_time
+            self._last_time = current_time
+            elapsed = current_time - self._start_time + 0.5 * delta_t
+        elif self.write_control == "clockTime":
+            elapsed = reduce_max(time.perf_counter() - self._start_clock)
+        else:  # self.write_control == "cpuTime"
+            elapsed = reduce_max(time.process_time() - self._start_cpu)
+
+        index = int(elapsed / self.write_interval)
+        if index > self._execution_index:
+            self._execution_index = index
+            return True
+        return False
+
+    def set_decimation(self, decimation: int, cost: float, solver_time: float) -> None:
+        """
+        Change the decimation factor and record the decision in the table metadata.
+
+        Args:
+            decimation: Evaluate only every n-th due write
+            cost: Measured wall time of the last evaluation in seconds
+            solver_time: Solver wall time between two runner writes in seconds
+        """
+        self.decimation = decimation
+        # the evaluation that triggered the change starts the new cycle
+        self._due_count = 1
+        self._decimation_log.append(
+            {
+                "time": self.mesh.time().value(),
+                "decimation": decimation,
+                "cost": cost,
+                "solverTime": solver_time,
+            }
+        )
+        if self._is_master:
+            self._format_writer.write_metadata(
+                {
+                    "writeControl": self.write_control,
+                    "writeInterval": self.write_interval,
+                    "budget": self.budget,
+                    "decimation": self._decimation_log,
+                }
+            )
+
     def end(self) -> bool:
         """
         End method called at simulation end.
@@ -0,0 +1,187 @@
+"""
+Running time averages of aggregated results.
+
+:class:`TimeAverage` is appended to a workflow after an aggregator and
+writes the running mean next to the instantaneous value of every entry, in
+long format with an additional ``statistic`` group column
+(``instant``/``mean``)::
+
+    @postProcess.Table("mass.csv")
+    def mass(mesh):
+        return field(mesh, "alpha.water") | VolIntegrate() | TimeAverage(window=2.0)
+
+Workflows are rebuilt for every write, so the state of the averages is kept
+by the PostProcessorRunner: it activates one :class:`StateStore` per output
+while the output is written (see :func:`activate`). The mean is weighted with
+the time between the writes (trapezoidal rule), so adjustable time steps
+and write intervals are handled. Without a window the cumulative mean since
+the start of the run is written and the state of every entry is constant in
+size; with a window only the samples within the last ``window`` seconds of
+simulated time are kept (ring buffer). The state is not written to disk, so
+averaging restarts with a restarted run.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator, Literal, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .datasets import AggregatedData, AggregatedDataSet, _flatten_types
+from .node import Node
+
+__all__ = [
+    "StateStore",
+    "TimeAverage",
+    "activate",
+    "active_store",
+]
+
+
+_active: Optional[StateStore] = None
+
+
+def active_store() -> Optional[StateStore]:
+    """Return the currently active state store or None outside of a runner."""
+    return _active
+
+
+@contextmanager
+def activate(store: Optional[StateStore]) -> Iterator[None]:
+    """Make ``store`` the active state store for the duration of the context."""
+    global _active
+    previous = _active
+    _active = store
+    try:
+        yield
+    finally:
+        _active = previous
+
+
+class StateStore:
+    """
+    State of the stateful nodes of one output, kept across writes.
+
+    Attributes:
+        time: Current simulation time, set by the runner before each write
+        converged: Last decision of every convergence monitor of the output
+            (see :class:`~pyOFTools.convergence.Convergence`)
+    """
+
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.converged: dict[Any, bool] = {}
+        self._states: dict[Any, Any] = {}
+
+    def get(self, key: Any, default: Any) -> Any:
+        """Return the state stored under ``key``, storing ``default`` if there is none."""
+        return self._states.setdefault(key, default)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class _RunningMean:
+    """Time-weighted running mean of one entry (cumulative or over a window)."""
+
+    __slots__ = ("window", "_time", "_value", "_area", "_duration", "_segments")
+
+    def __init__(self, window: Optional[float] = None) -> None:
+        self.window = window
+        self._time: Optional[float] = None
+        self._value: Optional[np.ndarray] = None
+        self._area: Optional[np.ndarray] = None
+        self._duration = 0.0
+        # (start time, duration, area) of the intervals within the window
+        self._segments: deque[Tuple[float, float, np.ndarray]] = deque()
+
+    def update(self, time: float, value: np.ndarray) -> np.ndarray:
+        """Add the value at ``time`` and return the mean."""
+        if self._time is None or self._value is None or self._area is None:
+            self._time, self._value = time, value
+            self._area = np.zeros_like(value)
+            return value.copy()
+        dt = time - self._time
+        if dt <= 0.0:
+            # written twice at the same time (e.g. a final write)
+            return self._mean(self._value, self._area)
+
+        area = 0.5 * (self._value + value) * dt
+        self._area += area
+        self._duration += dt
+        if self.window is not None:
+            self._segments.append((self._time, dt, area))
+            while self._segments and time - self._segments[0][0] > self.window * (1 + 1e-9):
+                _, old_dt, old_area = self._segments.popleft()
+                self._area -= old_area
+                self._duration -= old_dt
+            if not self._segments:
+                # window shorter than the write interval, drop the round-off
+                self._area[...] = 0.0
+                self._duration = 0.0
+        self._time, self._value = time, value
+        return self._mean(value, self._area)
+
+    def _mean(self, value: np.ndarray, area: np.ndarray) -> np.ndarray:
+        if self._duration <= 0.0:
+            return value.copy()
+        return area / self._duration
+
+
+@Node.register()
+class TimeAverage(BaseModel):
+    """
+    Running time average of an aggregated result.
+
+    Every entry is written twice, with the group ``statistic`` set to
+    ``instant`` and ``mean``.
+
+    Args:
+        window: Averaging window in seconds of simulated time; None averages
+            over the whole run
+        name: Name of the result (default: name of the aggregated result)
+    """
+
+    type: Literal["timeAverage"] = "timeAverage"
+    window: Optional[float] = Field(default=None, gt=0)
+    name: Optional[str] = None
+
+    def compute(self, dataset: AggregatedDataSet) -> AggregatedDataSet:
+        store = active_store()
+        if store is None:
+            raise RuntimeError(
+                "TimeAverage keeps its state across writes and can only be "
+                "evaluated by a PostProcessorRunner"
+            )
+        name = self.name or dataset.name
+        states: dict[Tuple[Union[int, str], ...], _RunningMean] = store.get(
+            ("timeAverage", name, self.window), {}
+        )
+
+        instant = []
+        means = []
+        for data in dataset.values:
+            group = list(data.group or [])
+            group_name = list(data.group_name or []) + ["statistic"]
+            state = states.setdefault(tuple(group), _RunningMean(self.window))
+            mean = state.update(store.time, np.asarray(_flatten_types(data.value)))
+            instant.append(
+                data.model_copy(update={"group": group + ["instant"], "group_name": group_name})
+            )
+            means.append(
+                AggregatedData(
+                    value=_like(data.value, mean), group=group + ["mean"], group_name=group_name
+                )
+            )
+
+        return AggregatedDataSet(name=name, values=instant + means)
+
+
+def _like(value: Any, components: np.ndarray) -> Any:
+    """Convert the components of a mean to the type of the aggregated value."""
+    if hasattr(value, "__len__"):
+        return type(value)(*components.tolist())
+    return float(components[0])
@@ -0,0 +1,189 @@
+"""
+Triangulated surfaces (STL) and vectorised point-in-surface tests.
+
+Used by the :class:`~pyOFTools.spatial_selectors.SurfaceInside` selector.
+A surface is read once per file and kept as long as the file is unchanged
+(see :func:`load_surface`).
+
+The inside test casts a ray from every point in +x direction and counts the
+crossings with the surface (odd: inside). The triangles are binned into a
+uniform grid over their projection onto the yz-plane, so each point is only
+tested against the few triangles of its grid cell. Points on a shared edge
+or vertex are attributed to exactly one triangle (top-left rule), so rays
+through edges are not counted twice.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Tuple
+
+import numpy as np
+
+__all__ = [
+    "TriangulatedSurface",
+    "load_surface",
+    "read_stl",
+]
+
+# Number of (point, triangle) pairs tested at once; bounds the memory use
+_CHUNK_PAIRS = 1 << 22
+
+
+def read_stl(file_path: str) -> np.ndarray:
+    """
+    Read an ASCII or binary STL file.
+
+    Returns:
+        Triangle vertices of shape ``(n, 3, 3)``
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        header = f.read(84)
+        if len(header) == 84:
+            n_triangles = int(np.frombuffer(header, dtype="<u4", count=1, offset=80)[0])
+            if size == 84 + 50 * n_triangles:
+                record = np.dtype(
+                    [("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attr", "<u2")]
+                )
+                data = np.frombuffer(f.read(), dtype=record, count=n_triangles)
+                return data["vertices"].astype(float)
+
+    vertices = []
+    with open(file_path) as f:
+        for line in f:
+            parts = line.split()
+            if parts and parts[0] == "vertex":
+                vertices.append([float(v) for v in parts[1:4]])
+    if len(vertices) % 3 != 0:
+        raise ValueError(f"Malformed STL file '{file_path}'")
+    return np.asarray(vertices, dtype=float).reshape(-1, 3, 3)
+
+
+class TriangulatedSurface:
+    """
+    Closed triangulated surface with a point-in-surface test.
+
+    Args:
+        triangles: Triangle vertices of shape ``(n, 3, 3)``
+    """
+
+    def __init__(self, triangles: np.ndarray) -> None:
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 3, 3)
+        self.n_triangles = len(triangles)
+        if self.n_triangles == 0:
+            raise ValueError("Surface has no triangles")
+        self.bounds = triangles.reshape(-1, 3).min(axis=0), triangles.reshape(-1, 3).max(axis=0)
+
+        # projection onto the yz-plane, oriented counter-clockwise; triangles
+        # that are parallel to the rays cannot be crossed and are dropped
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        area = _cross2(b[:, 1:] - a[:, 1:], c[:, 1:] - a[:, 1:])
+        flip = area < 0
+        b, c = np.where(flip[:, None], c, b), np.where(flip[:, None], b, c)
+        keep = area != 0
+        self._a, self._b, self._c = a[keep], b[keep], c[keep]
+        self._area = np.abs(area[keep])
+
+        # uniform grid over the projected bounding box
+        lo, hi = self.bounds[0][1:], self.bounds[1][1:]
+        n = max(int(np.sqrt(len(self._a))), 1)
+        self._lo = lo
+        self._dims = np.array([n, n])
+        self._scale = np.where(hi > lo, n / np.where(hi > lo, hi - lo, 1.0), 0.0)
+
+        yz = np.stack([self._a[:, 1:], self._b[:, 1:], self._c[:, 1:]], axis=1)
+        c0 = self._cell_ij(yz.min(axis=1))
+        c1 = self._cell_ij(yz.max(axis=1))
+        span = c1 - c0 + 1
+        counts = span[:, 0] * span[:, 1]
+        tri = np.repeat(np.arange(len(yz)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        ci = c0[tri, 0] + local // span[tri, 1]
+        cj = c0[tri, 1] + local % span[tri, 1]
+        cells = ci * n + cj
+        order = np.argsort(cells, kind="stable")
+        self._cell_triangles = tri[order]
+        self._offsets = np.concatenate(([0], np.cumsum(np.bincount(cells, minlength=n * n))))
+
+    def _cell_ij(self, yz: np.ndarray) -> np.ndarray:
+        ij = np.floor((yz - self._lo) * self._scale).astype(np.int64)
+        return np.clip(ij, 0, self._dims - 1)  # type: ignore[no-any-return]
+
+    def inside(self, points: np.ndarray) -> np.ndarray:
+        """Return a bool array flagging the points inside the surface."""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        result = np.zeros(len(points), dtype=bool)
+        lo, hi = self.bounds
+        candidates = np.flatnonzero(np.all((points >= lo) & (points <= hi), axis=1))
+        if candidates.size == 0 or len(self._a) == 0:
+            return result
+
+        ij = self._cell_ij(points[candidates, 1:])
+        cells = ij[:, 0] * self._dims[1] + ij[:, 1]
+        counts = self._offsets[cells + 1] - self._offsets[cells]
+
+        # process the candidates in chunks with a bounded number of pairs
+        ends = np.cumsum(counts)
+        start = 0
+        while start < len(candidates):
+            base = ends[start - 1] if start > 0 else 0
+            stop = max(int(np.searchsorted(ends, base + _CHUNK_PAIRS, side="right")), start + 1)
+            crossings = self._count_crossings(
+                points[candidates[start:stop]], cells[start:stop], counts[start:stop]
+            )
+            result[candidates[start:stop]] = crossings % 2 == 1
+            start = stop
+        return result
+
+    def _count_crossings(
+        self, points: np.ndarray, cells: np.ndarray, counts: np.ndarray
+    ) -> np.ndarray:
+        total = int(counts.sum())
+        if total == 0:
+            return np.zeros(len(points), dtype=np.int64)
+        pair_point = np.repeat(np.arange(len(points)), counts)
+        run_start = np.cumsum(counts) - counts
+        offset = np.arange(total) - np.repeat(run_start, counts)
+        pair_tri = self._cell_triangles[self._offsets[cells][pair_point] + offset]
+
+        p = points[pair_point]
+        a, b, c = self._a[pair_tri], self._b[pair_tri], self._c[pair_tri]
+        w_a, in_a = _edge(b, c, p)
+        w_b, in_b = _edge(c, a, p)
+        w_c, in_c = _edge(a, b, p)
+        hit = in_a & in_b & in_c
+
+        # x-coordinate of the crossing from the barycentric coordinates
+        area = self._area[pair_tri]
+        x = (w_a * a[:, 0] + w_b * b[:, 0] + w_c * c[:, 0]) / area
+        hit &= x > p[:, 0]
+        return np.bincount(pair_point[hit], minlength=len(points))
+
+
+def _cross2(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]  # type: ignore[no-any-return]
+
+
+def _edge(a: np.ndarray, b: np.ndarray, p: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Edge function of the yz-projection and the top-left inside test."""
+    d = b[:, 1:] - a[:, 1:]
+    w = _cross2(d, p[:, 1:] - a[:, 1:])
+    top_left = (d[:, 1] < 0) | ((d[:, 1] == 0) & (d[:, 0] > 0))
+    return w, (w > 0) | ((w == 0) & top_left)
+
+
+# Surfaces by file path, kept with the modification time and size of the file
+_surfaces: dict[str, Tuple[float, int, TriangulatedSurface]] = {}
+
+
+def load_surface(file_path: str) -> TriangulatedSurface:
+    """Return the surface of an STL file, reading it only if it has changed."""
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    entry = _surfaces.get(path)
+    if entry is not None and entry[0] == stat.st_mtime and entry[1] == stat.st_size:
+        return entry[2]
+    surface = TriangulatedSurface(read_stl(path))
+    _surfaces[path] = (stat.st_mtime, stat.st_size, surface)
+    return surface
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 
 from .datasets import DataSets
 from .node import Node
+from .profiling import active_profiler
 
 
 def create_workflow() -> "WorkFlow":  # type: ignore[valid-type]
@@ -13,8 +14,13 @@ def create_workflow() -> "WorkFlow":  # type: ignore[valid-type]
 
         def compute(self) -> DataSets:
             dataset = self.initial_dataset.model_copy()
-            for step in self.steps:
-                dataset = step.compute(dataset)  # type: ignore[attr-defined]
+            profiler = active_profiler()
+            for i, step in enumerate(self.steps):
+                if profiler is None:
+                    dataset = step.compute(dataset)  # type: ignore[attr-defined]
+                else:
+                    with profiler.section(f"{i}:{step.type}", category="node"):  # type: ignore[attr-defined]
+                        dataset = step.compute(dataset)  # type: ignore[attr-defined]
             return dataset
 
         model_config = {"arbitrary_types_allowed": True}
@@ -0,0 +1,85 @@
+"""
+Selectors based on the cellZones and cellSets of the mesh.
+
+The cell addressing is read by the C++ aggregation extension, cached per
+mesh and handed to the aggregation kernels as index list
+(``dataset.indices``), so no geometric test is done::
+
+    field(mesh, "p") | CellZone(name="porosity") | VolIntegrate()
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Literal, Tuple
+
+from pybFoam import labelList
+from pydantic import BaseModel
+
+from pyOFTools import aggregation
+
+from .datasets import DataSets, InternalDataSet
+from .node import Node
+from .selection_cache import mesh_reference, mesh_state
+
+__all__ = [
+    "CellSet",
+    "CellZone",
+    "clear",
+]
+
+
+# Cell addressing by (kind, name, id of the mesh): a weak reference to the
+# mesh, the mesh state it was read for and the cells
+_addressing: dict[Tuple[Any, ...], Tuple[Callable[[], Any], Tuple[Any, ...], labelList]] = {}
+
+
+def _cells(dataset: DataSets, kind: str, name: str) -> labelList:
+    if not isinstance(dataset, InternalDataSet):
+        raise TypeError(
+            f"Selecting {kind} '{name}' requires a dataset on the mesh cells, "
+            f"got {type(dataset).__name__}"
+        )
+    mesh = dataset.geometry.mesh  # type: ignore[attr-defined]
+    key = (kind, name, id(mesh))
+    state = mesh_state(mesh)
+    entry = _addressing.get(key)
+    if entry is not None and entry[0]() is mesh and entry[1] == state:
+        return entry[2]
+
+    reader = aggregation.cell_zone if kind == "cellZone" else aggregation.cell_set  # type: ignore[attr-defined]
+    cells = reader(mesh, name)
+    _addressing[key] = (mesh_reference(mesh, _addressing, key), state, cells)
+    return cells
+
+
+def clear() -> None:
+    """Drop the cached cell addressing (e.g. after a cellSet was rewritten)."""
+    _addressing.clear()
+
+
+def _select_cells(dataset: DataSets, cells: labelList) -> DataSets:
+    dataset.mask = None  # type: ignore[union-attr]
+    dataset.indices = cells  # type: ignore[union-attr]
+    return dataset
+
+
+@Node.register()
+class CellZone(BaseModel):
+    """Select the cells of a cellZone of the mesh."""
+
+    type: Literal["cellZone"] = "cellZone"
+    name: str
+
+    def compute(self, dataset: DataSets) -> DataSets:
+        return _select_cells(dataset, _cells(dataset, "cellZone", self.name))
+
+
+@Node.register()
+class CellSet(BaseModel):
+    """Select the cells of a cellSet (``constant/polyMesh/sets/<name>``)."""
+
+    type: Literal["cellSet"] = "cellSet"
+    name: str
+
+    def compute(self, dataset: DataSets) -> DataSets:
+        return _select_cells(dataset, _cells(dataset, "cellSet", self.name))
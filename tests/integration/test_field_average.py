@@ -0,0 +1,53 @@
+"""
+Integration tests for running field averages.
+"""
+
+import numpy as np
+import pytest
+from pybFoam import volScalarField
+
+from pyOFTools.aggregators import Mean
+from pyOFTools.builders import field
+from pyOFTools.field_average import create_field_average
+from pyOFTools.postprocessor import PostProcessorBase
+
+
+def test_field_average(time_mesh):
+    time, mesh = time_mesh
+    p = volScalarField.read_field(mesh, "p")
+    values = np.asarray(p["internalField"])
+    average = create_field_average(mesh, "p", prime2Mean=True)
+
+    values[:] = 1.0
+    time.setTime(0.0005, 1)
+    assert average.update()
+    values[:] = 3.0
+    time.setTime(0.001, 2)
+    assert average.update()
+    # only one update per time step
+    assert not average.update()
+
+    assert average.total_time == pytest.approx(0.001)
+    assert np.allclose(np.asarray(average.mean()["internalField"]), 2.0)
+    assert np.allclose(np.asarray(average.prime2Mean()["internalField"]), 1.0)
+
+    result = (field(mesh, "pMean") | Mean()).compute()
+    assert result.values[0].value == pytest.approx(2.0)
+
+
+def test_runner_field_average(time_mesh):
+    time, mesh = time_mesh
+    p = volScalarField.read_field(mesh, "p")
+    np.asarray(p["internalField"])[:] = 4.0
+
+    processor = PostProcessorBase()
+    processor.FieldAverage(["p"])
+    assert "pAverage" in processor._outputs
+
+    bound = processor(mesh)
+    time.setTime(0.0005, 1)
+    bound.execute()
+
+    mean = volScalarField.from_registry(mesh, "pMean")
+    assert np.allclose(np.asarray(mean["internalField"]), 4.0)
+    bound.end()
@@ -0,0 +1,80 @@
+"""
+Integration tests for offline post-processing of time directories.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from pyOFTools.cli.cli import app
+from pyOFTools.offline import run_offline
+
+SCRIPT = """
+from pyOFTools.aggregators import VolIntegrate
+from pyOFTools.builders import field
+from pyOFTools.postprocessor import PostProcessorBase
+
+postProcess = PostProcessorBase(base_path={base_path!r})
+
+
+@postProcess.Table("vol_alpha.csv")
+def vol_alpha(mesh):
+    return field(mesh, "alpha.water") | VolIntegrate()
+"""
+
+
+STATEFUL_SCRIPT = """
+from pyOFTools.aggregators import VolIntegrate
+from pyOFTools.builders import field
+from pyOFTools.postprocessor import PostProcessorBase
+from pyOFTools.time_average import TimeAverage
+
+postProcess = PostProcessorBase(base_path={base_path!r})
+postProcess.FieldAverage(["alpha.water"])
+
+
+@postProcess.Table("mean_alpha.csv")
+def mean_alpha(mesh):
+    return field(mesh, "alpha.water") | VolIntegrate() | TimeAverage()
+"""
+
+
+def _write_script(tmp_path, source=SCRIPT):
+    script = tmp_path / "postProcess.py"
+    script.write_text(source.format(base_path=str(tmp_path / "postProcessing") + "/"))
+    return str(script)
+
+
+def test_run_offline(change_test_dir, tmp_path):
+    written = run_offline(_write_script(tmp_path), ".", times="0")
+
+    assert list(written) == ["vol_alpha"]
+    df = pd.read_csv(written["vol_alpha"])
+    assert list(df.columns) == ["time", "alpha.water_volIntegrate"]
+    assert list(df["time"]) == [0.0]
+    assert df["alpha.water_volIntegrate"].notna().all()
+
+
+def test_postprocess_cli(change_test_dir, tmp_path):
+    result = CliRunner().invoke(
+        app, ["postprocess", _write_script(tmp_path), "--case", ".", "--times", "0:1", "-j", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert os.path.isfile(tmp_path / "postProcessing" / "vol_alpha.csv")
+
+
+def test_run_offline_stateful(change_test_dir, tmp_path):
+    script = _write_script(tmp_path, STATEFUL_SCRIPT)
+    with pytest.warns(UserWarning, match="skipped offline"):
+        written = run_offline(script, ".", times="0")
+
+    # the field average is skipped, the time average evaluated in time order
+    assert list(written) == ["mean_alpha"]
+    df = pd.read_csv(written["mean_alpha"])
+    assert list(df["statistic"]) == ["instant", "mean"]
+
+    # the workers of a pool do not see the times in order
+    with pytest.raises(ValueError, match="timeAverage"):
+        run_offline(script, ".", times="0", jobs=2)
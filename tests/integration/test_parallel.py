@@ -9,10 +9,12 @@ import os
 
 import numpy as np
 import pytest
-from pybFoam import Time, fvMesh, volScalarField
+from pybFoam import Pstream, Time, fvMesh, volScalarField
 
-from pyOFTools.aggregators import Max, Mean, Min, Sum, VolIntegrate
-from pyOFTools.builders import field
+from pyOFTools.aggregators import AreaMean, Max, Mean, Min, Sum, VolIntegrate
+from pyOFTools.binning import Directional
+from pyOFTools.builders import field, forces, patch
+from pyOFTools.profiling import Profiler
 
 
 @pytest.fixture
@@ -86,3 +88,49 @@ def test_min_max_parallel(time_mesh):
     assert np.isfinite(min_val)
     assert np.isfinite(max_val)
     assert min_val <= max_val
+
+
+@pytest.mark.parallel
+def test_groups_missing_on_a_rank_parallel(time_mesh):
+    """Test grouped aggregation with groups that are empty on some ranks."""
+    _, mesh = time_mesh
+
+    volScalarField.read_field(mesh, "p")
+    # the cube is split at x = 0: each rank only has cells of two of the bins
+    binned = field(mesh, "p") | Directional(bins=[-0.1, 0.0, 0.1], direction=(1, 0, 0))
+    for aggregator in (Sum(), Mean(), Max(), Min(), VolIntegrate()):
+        result = (binned | aggregator).compute()
+        assert [v.group for v in result.values] == [[0], [1], [2], [3]]
+
+    # leftWall and rightWall are on different ranks
+    result = (patch(mesh, "p", ["leftWall", "rightWall"], per_patch=True) | AreaMean()).compute()
+    assert [v.group for v in result.values] == [[0], [1]]
+
+    result = forces(
+        mesh, ["leftWall", "rightWall"], viscous=False, bins=[0.0], direction=(1, 0, 0)
+    ).compute()
+    assert sorted({v.group[1] for v in result.values}) == [0, 1]
+
+
+@pytest.mark.parallel
+def test_profiler_sections_missing_on_a_rank_parallel(time_mesh):
+    """Test the profile summary with sections that are only entered on some ranks."""
+    profiler = Profiler()
+    with profiler.section("all"):
+        pass
+    if Pstream.master():
+        with profiler.section("master"):
+            pass
+    else:
+        with profiler.section("others"):
+            pass
+
+    header, rows = profiler.summary()
+    table = {row[0]: dict(zip(header, row)) for row in rows}
+    assert list(table) == ["all", "master", "others"]
+    # all columns are reduced, so every rank writes the same summary
+    assert all(section["calls_max"] == 1 for section in table.values())
+    # the ranks without the section count with zero time
+    assert table["master"]["time_min"] == 0.0
+    assert table["others"]["time_min"] == 0.0
+    assert table["master"]["time_mean"] <= table["master"]["time_max"]
@@ -0,0 +1,76 @@
+"""
+Integration tests for the patch() builder.
+"""
+
+import numpy as np
+import pytest
+from pybFoam import volScalarField
+
+from pyOFTools import aggregation
+from pyOFTools.aggregators import AreaMean, SurfIntegrate
+from pyOFTools.builders import patch
+from pyOFTools.geometry import FvMeshBoundaryAdapter
+
+PATCHES = ["topWall", "bottomWall"]
+
+
+def test_boundary_geometry(time_mesh):
+    _, mesh = time_mesh
+
+    geometry = FvMeshBoundaryAdapter(mesh, PATCHES)
+    assert len(geometry.positions) == 200
+    assert geometry.total_area == pytest.approx(0.5)
+    assert list(np.unique(np.asarray(geometry.patch_ids))) == [0, 1]
+
+    # geometry is shared between adapters of the same patches
+    assert FvMeshBoundaryAdapter(mesh, PATCHES)._geometry is geometry._geometry
+
+    with pytest.raises(ValueError):
+        FvMeshBoundaryAdapter(mesh, ["doesNotExist"]).positions
+
+
+def test_patch_area_weighted_mean(time_mesh):
+    _, mesh = time_mesh
+    vf = volScalarField.read_field(mesh, "alpha.water")
+
+    values = np.asarray(aggregation.boundary_values(vf, PATCHES))
+    mag_sf = np.asarray(FvMeshBoundaryAdapter(mesh, PATCHES).face_area_magnitudes)
+
+    result = (patch(mesh, "alpha.water", PATCHES) | SurfIntegrate()).compute()
+    assert result.values[0].value == pytest.approx(np.sum(values * mag_sf))
+
+    result = (patch(mesh, "alpha.water", PATCHES) | AreaMean()).compute()
+    assert result.values[0].value == pytest.approx(np.sum(values * mag_sf) / np.sum(mag_sf))
+
+
+def test_patch_per_patch(time_mesh):
+    _, mesh = time_mesh
+    volScalarField.read_field(mesh, "alpha.water")
+
+    result = (patch(mesh, "alpha.water", PATCHES, per_patch=True) | AreaMean()).compute()
+    assert len(result.values) == 2
+    assert [v.group for v in result.values] == [[0], [1]]
+
+
+def test_forces_on_closed_box(time_mesh):
+    from pyOFTools.builders import forces
+
+    _, mesh = time_mesh
+    volScalarField.read_field(mesh, "p")  # uniform 0
+    walls = ["topWall", "bottomWall", "leftWall", "rightWall", "frontWall", "backWall"]
+
+    # p - pRef = 1 everywhere: no net force on the closed surface
+    result = forces(mesh, walls, pRef=-1.0, viscous=False).compute()
+    assert len(result.values) == 6
+    total = next(v.value for v in result.values if v.group == ["total_force"])
+    assert np.allclose(list(total), 0.0, atol=1e-12)
+
+    # a single wall of area 0.25
+    result = forces(mesh, ["topWall"], pRef=-1.0, viscous=False).compute()
+    total = next(v.value for v in result.values if v.group == ["total_force"])
+    assert np.linalg.norm(list(total)) == pytest.approx(0.25)
+
+    result = forces(
+        mesh, ["topWall"], pRef=-1.0, viscous=False, bins=[0.0], direction=(1, 0, 0)
+    ).compute()
+    assert result.headers[-2:] == ["quantity", "group"]
@@ -3,9 +3,16 @@ Tests for PostProcessorBase decorator and registration system.
 """
 
 import os
+import shutil
 
+import pytest
+from pybFoam import Time, fvMesh, volScalarField
+
+from pyOFTools.aggregators import VolIntegrate
 from pyOFTools.builders import field, residuals
+from pyOFTools.convergence import Convergence
 from pyOFTools.postprocessor import PostProcessorBase
+from pyOFTools.time_average import TimeAverage
 
 
 def test_postprocessor_base_initialization():
@@ -136,3 +143,56 @@ def test_bound_processor_end_returns_true(time_mesh):
     # Cleanup
     if os.path.exists("postProcessing/test.csv"):
         os.remove("postProcessing/test.csv")
+
+
+def test_runner_time_average(time_mesh, tmp_path):
+    """Test that the runner keeps the state of TimeAverage across writes."""
+    time, mesh = time_mesh
+    alpha = volScalarField.read_field(mesh, "alpha.water")  # noqa: F841
+
+    processor = PostProcessorBase(base_path=f"{tmp_path}/")
+
+    @processor.Table("average.csv")
+    def average(m):
+        return field(m, "alpha.water") | VolIntegrate() | TimeAverage(name="average")
+
+    bound = processor(mesh)
+    start = time.value()
+    bound.write()
+    time.setTime(start + 1.0, 1)
+    bound.write()
+    bound.end()
+
+    with open(tmp_path / "average.csv") as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "time,average,statistic"
+    rows = [line.split(",") for line in lines[1:]]
+    assert [row[2] for row in rows] == ["instant", "mean"] * 2
+    # alpha.water does not change, so the mean equals the instantaneous value
+    assert float(rows[3][1]) == pytest.approx(float(rows[2][1]))
+
+
+def test_runner_ends_converged_run(change_test_dir, tmp_path):
+    """Test that the runner ends the run once all convergence monitors have converged."""
+    # writeAndEnd writes the fields, so the run works on a copy of the case
+    case = tmp_path / "cube"
+    shutil.copytree(os.getcwd(), case, ignore=shutil.ignore_patterns("processor*"))
+    time = Time(str(case), ".")
+    mesh = fvMesh(time)
+    volScalarField.read_field(mesh, "alpha.water")
+
+    processor = PostProcessorBase(base_path=f"{tmp_path}/")
+
+    @processor.Table("converged.csv")
+    def converged(m):
+        return field(m, "alpha.water") | VolIntegrate() | Convergence(tolerance=1e-6, window=2)
+
+    bound = processor(mesh)
+    bound.write()
+    assert time.run()
+
+    # alpha.water does not change: converged at the second write
+    time.setTime(0.1, 1)
+    bound.write()
+    assert not time.run()
+    bound.end()
@@ -0,0 +1,106 @@
+"""
+Integration tests for JSON-driven setFields.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+from pybFoam import Time, fvMesh, volScalarField
+from typer.testing import CliRunner
+
+from pyOFTools.cli.cli import app
+
+CONFIG = {
+    "fields": [{"name": "alpha.water", "type": "volScalarField", "value": 0.0}],
+    "regions": [
+        {
+            "region": {"type": "box", "min": [-1, -1, -1], "max": [0, 1, 1]},
+            "fieldValues": {"alpha.water": 1.0},
+        }
+    ],
+}
+
+
+def test_set_fields_json(change_test_dir, tmp_path):
+    case = tmp_path / "cube"
+    shutil.copytree(os.getcwd(), case, ignore=shutil.ignore_patterns("processor*"))
+    config = tmp_path / "setFields.json"
+    config.write_text(json.dumps(CONFIG))
+
+    result = CliRunner().invoke(app, ["setFields", str(config), "--case", str(case)])
+    assert result.exit_code == 0, result.output
+    assert "Region 0 (box): 500 cells" in result.output
+
+    time = Time(str(case), ".")
+    mesh = fvMesh(time)
+    alpha = np.asarray(volScalarField.read_field(mesh, "alpha.water")["internalField"])
+    x = np.asarray(mesh.C()["internalField"])[:, 0]
+    assert np.all(alpha[x <= 0] == 1.0)
+    assert np.all(alpha[x > 0] == 0.0)
+
+
+def test_set_fields_json_dry_run(change_test_dir, tmp_path):
+    config = tmp_path / "setFields.json"
+    config.write_text(json.dumps(CONFIG))
+    before = open(os.path.join("0", "alpha.water")).read()
+
+    result = CliRunner().invoke(app, ["setFields", str(config), "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "Would set fields: alpha.water" in result.output
+    assert open(os.path.join("0", "alpha.water")).read() == before
+
+
+def test_set_fields_json_fraction(change_test_dir, tmp_path):
+    case = tmp_path / "cube"
+    shutil.copytree(os.getcwd(), case, ignore=shutil.ignore_patterns("processor*"))
+    config = tmp_path / "setFields.json"
+    # the plane cuts the cells with centre x = 0.025 (width 0.05) at a quarter
+    region = {"type": "halfSpace", "point": [0.0125, 0, 0], "normal": [1, 0, 0]}
+    config.write_text(
+        json.dumps(
+            {
+                "fields": [{"name": "alpha.water", "value": 0.0}],
+                "regions": [
+                    {"region": region, "fieldValues": {"alpha.water": 1.0}, "fraction": True}
+                ],
+            }
+        )
+    )
+
+    result = CliRunner().invoke(app, ["setFields", str(config), "--case", str(case)])
+    assert result.exit_code == 0, result.output
+
+    time = Time(str(case), ".")
+    mesh = fvMesh(time)
+    alpha = np.asarray(volScalarField.read_field(mesh, "alpha.water")["internalField"])
+    x = np.asarray(mesh.C()["internalField"])[:, 0]
+    assert np.allclose(alpha[np.isclose(x, 0.025)], 0.75)
+    assert np.all(alpha[x > 0.05] == 1.0)
+    assert np.all(alpha[x < 0.0] == 0.0)
+
+
+@pytest.mark.skipif(shutil.which("decomposePar") is None, reason="decomposePar not available")
+def test_set_fields_json_decomposed(change_test_dir, tmp_path):
+    case = tmp_path / "cube"
+    shutil.copytree(os.getcwd(), case, ignore=shutil.ignore_patterns("processor*"))
+    subprocess.run(["decomposePar", "-case", str(case)], check=True, capture_output=True)
+    config = tmp_path / "setFields.json"
+    config.write_text(json.dumps(CONFIG))
+
+    result = CliRunner().invoke(
+        app, ["setFields", str(config), "--case", str(case), "--decomposed", "-j", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Region 0 (box): 500 cells" in result.output
+
+    for processor in ["processor0", "processor1"]:
+        time = Time(str(case), processor)
+        mesh = fvMesh(time)
+        alpha = np.asarray(volScalarField.read_field(mesh, "alpha.water")["internalField"])
+        x = np.asarray(mesh.C()["internalField"])[:, 0]
+        assert np.all(alpha[x <= 0] == 1.0)
+        assert np.all(alpha[x > 0] == 0.0)
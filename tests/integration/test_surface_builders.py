@@ -5,9 +5,9 @@ Verifies Proposal H: surface builders return geometry-only datasets,
 area() and sample() are pipe nodes that populate the field.
 """
 
-from pybFoam import volScalarField
+from pybFoam import volScalarField, volVectorField
 
-from pyOFTools.aggregators import Max, Mean, Min, Sum
+from pyOFTools.aggregators import FluxIntegrate, Max, Mean, Min, Sum
 from pyOFTools.builders import area, iso_surface, plane, sample
 
 
@@ -55,6 +55,21 @@ def test_sample_with_plane(time_mesh):
     assert len(result.values) > 0
 
 
+def test_flux_through_plane(time_mesh):
+    """sample(field_type="vector") | FluxIntegrate() should give the flow rate."""
+    _, mesh = time_mesh
+
+    volVectorField.read_field(mesh, "U")  # uniform (0 0 0)
+
+    result = (
+        plane(mesh, point=(0.0, 0.0, 0.0), normal=(1, 0, 0))
+        | sample(mesh, "U", field_type="vector")
+        | FluxIntegrate()
+    ).compute()
+
+    assert result.values[0].value == 0.0
+
+
 def test_sample_min_max_with_plane(time_mesh):
     """sample() should work with Min and Max aggregators."""
     _, mesh = time_mesh
@@ -0,0 +1,104 @@
+"""
+Integration tests for the cellZone and cellSet selectors.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from pybFoam import Time, boolList, fvMesh, volScalarField
+
+from pyOFTools.aggregators import VolIntegrate
+from pyOFTools.builders import field, patch
+from pyOFTools.zone_selectors import CellSet, CellZone, clear
+
+CELLS = [0, 5, 17, 123, 999]
+
+
+@pytest.fixture
+def cell_set(change_test_dir):
+    """Write constant/polyMesh/sets/testCells and remove it afterwards."""
+    sets_dir = os.path.join("constant", "polyMesh", "sets")
+    os.makedirs(sets_dir, exist_ok=True)
+    path = os.path.join(sets_dir, "testCells")
+    with open(path, "w") as f:
+        f.write(
+            "FoamFile\n{\n    version 2.0;\n    format ascii;\n    class cellSet;\n"
+            '    location "constant/polyMesh/sets";\n    object testCells;\n}\n'
+        )
+        f.write(f"{len(CELLS)}\n(\n" + "\n".join(str(c) for c in reversed(CELLS)) + "\n)\n")
+    yield "testCells"
+    os.remove(path)
+    os.rmdir(sets_dir)
+    clear()
+
+
+@pytest.fixture
+def zone_mesh(change_test_dir):
+    """Write constant/polyMesh/cellZones before reading the mesh; remove it afterwards."""
+    path = os.path.join("constant", "polyMesh", "cellZones")
+    with open(path, "w") as f:
+        f.write(
+            "FoamFile\n{\n    version 2.0;\n    format ascii;\n    class regIOobject;\n"
+            '    location "constant/polyMesh";\n    object cellZones;\n}\n'
+        )
+        labels = " ".join(str(c) for c in CELLS)
+        f.write(
+            f"1\n(\ntestZone\n{{\n    type cellZone;\n"
+            f"    cellLabels List<label> {len(CELLS)}({labels});\n}}\n)\n"
+        )
+    time = Time(".", ".")
+    mesh = fvMesh(time)
+    yield mesh
+    os.remove(path)
+    clear()
+
+
+def _integral_over_cells(mesh):
+    mask = np.zeros(mesh.nCells(), dtype=bool)
+    mask[CELLS] = True
+    wf = field(mesh, "alpha.water")
+    wf.initial_dataset.mask = boolList(mask)
+    return (wf | VolIntegrate()).compute().values[0].value
+
+
+def test_cell_zone_selects_cells(zone_mesh):
+    mesh = zone_mesh
+    volScalarField.read_field(mesh, "alpha.water")
+
+    ds = (field(mesh, "alpha.water") | CellZone(name="testZone")).compute()
+    assert ds.mask is None
+    assert list(ds.indices) == CELLS
+
+    result = (field(mesh, "alpha.water") | CellZone(name="testZone") | VolIntegrate()).compute()
+    assert result.values[0].value == pytest.approx(_integral_over_cells(mesh))
+
+
+def test_cell_set_selects_cells(time_mesh, cell_set):
+    _, mesh = time_mesh
+    volScalarField.read_field(mesh, "alpha.water")
+
+    ds = (field(mesh, "alpha.water") | CellSet(name=cell_set)).compute()
+    assert ds.mask is None
+    assert list(ds.indices) == CELLS
+
+    result = (field(mesh, "alpha.water") | CellSet(name=cell_set) | VolIntegrate()).compute()
+    assert result.values[0].value == pytest.approx(_integral_over_cells(mesh))
+
+
+def test_unknown_zone_raises(time_mesh):
+    _, mesh = time_mesh
+    volScalarField.read_field(mesh, "alpha.water")
+
+    with pytest.raises(ValueError):
+        (field(mesh, "alpha.water") | CellZone(name="doesNotExist")).compute()
+    with pytest.raises(ValueError):
+        (field(mesh, "alpha.water") | CellSet(name="doesNotExist")).compute()
+
+
+def test_zone_requires_cell_dataset(time_mesh):
+    _, mesh = time_mesh
+    volScalarField.read_field(mesh, "alpha.water")
+
+    with pytest.raises(TypeError):
+        (patch(mesh, "alpha.water", ["topWall"]) | CellZone(name="testZone")).compute()
@@ -55,6 +55,12 @@ def solver_residuals(mesh):
     return residuals(mesh)
 
 
+@postProcess.Table("residual_components.csv")
+def solver_residual_components(mesh):
+    """Track solver residuals per component."""
+    return residuals(mesh, components=True)
+
+
 def build(mesh: pybFoam.fvMesh):
     """
     Factory function to create post-processor instance.
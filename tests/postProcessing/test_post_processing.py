@@ -131,6 +131,21 @@ def test_solver_residuals(run_reset_case, change_test_dir):
     assert (df["residuals"] >= 0).all(), "Residuals values should be positive"
 
 
+def test_solver_residual_components(run_reset_case, change_test_dir):
+    """Test residual_components.csv has one row per component."""
+    df = pd.read_csv("postProcessing/residual_components.csv")
+    expected_columns = ["time", "residuals", "field", "solver", "metric", "iteration", "component"]
+    assert list(df.columns) == expected_columns
+
+    # scalar fields have a single component, same values as residuals.csv
+    p_rgh = df[df["field"] == "p_rgh"]
+    assert set(p_rgh["component"]) == {0}
+    df_max = pd.read_csv("postProcessing/residuals.csv")
+    assert np.allclose(
+        p_rgh["residuals"].values, df_max[df_max["field"] == "p_rgh"]["residuals"].values
+    )
+
+
 def test_csv_values_match_reference(run_reset_case, change_test_dir):
     """Test that CSV values match reference data (first few timesteps)."""
 
@@ -144,3 +144,54 @@ def test_max():
     assert (
         aggregation.max(field, boolList([True, False, True]), labelList([0, 1, 1])).values[1] == 3
     )
+
+
+def test_indices():
+    field = scalarField([1, 2, 3, 4])
+    indices = labelList([1, 3])
+    assert aggregation.sum(field, None, None, indices=indices).values[0] == 6
+    assert aggregation.mean(field, None, None, indices=indices).values[0] == 3
+    assert aggregation.max(field, None, None, indices=indices).values[0] == 4
+    assert aggregation.min(field, None, None, indices=indices).values[0] == 2
+
+    # indices are combined with the mask, groups and scaling factor
+    mask = boolList([True, True, True, False])
+    assert aggregation.sum(field, mask, None, indices=indices).values[0] == 2
+    agg_res = aggregation.sum(
+        field,
+        None,
+        labelList([0, 1, 1, 0]),
+        scalingFactor=scalarField([1, 2, 3, 4]),
+        indices=indices,
+    )
+    assert agg_res.values[0] == 16
+    assert agg_res.values[1] == 4
+
+    field = vectorField([vector(1, 2, 3), vector(4, 5, 6)])
+    assert aggregation.sum(field, None, None, indices=labelList([1])).values[0] == vector(4, 5, 6)
+
+
+def test_threshold():
+    field = scalarField([0.1, 0.5, 0.9, 1.5])
+    assert list(aggregation.threshold(field, 0.5, 1.0)) == [False, True, True, False]
+    assert list(aggregation.threshold(field, None, 0.5)) == [True, True, False, False]
+    assert list(aggregation.threshold(field, 0.5)) == [False, True, True, True]
+
+    # combined with the existing selection
+    mask = boolList([True, True, False, True])
+    assert list(aggregation.threshold(field, 0.5, mask=mask)) == [False, True, False, True]
+    indices = labelList([0, 3])
+    assert list(aggregation.threshold(field, 0.5, indices=indices)) == [False, False, False, True]
+
+    # vector fields are compared by magnitude
+    field = vectorField([vector(3, 4, 0), vector(1, 0, 0)])
+    assert list(aggregation.threshold(field, 2.0)) == [True, False]
+
+
+def test_flux():
+    field = vectorField([vector(1, 0, 0), vector(0, 2, 0), vector(1, 1, 1)])
+    Sf = vectorField([vector(2, 0, 0), vector(0, 1, 0), vector(0, 0, -1)])
+    assert aggregation.flux(field, Sf).values[0] == 3.0
+    assert list(aggregation.flux(field, Sf, None, labelList([0, 0, 1])).values) == [4.0, -1.0]
+    assert aggregation.flux(field, Sf, boolList([True, False, True])).values[0] == 1.0
+    assert aggregation.flux(field, Sf, indices=labelList([1])).values[0] == 2.0
@@ -1,8 +1,17 @@
 import pytest
 from pybFoam import boolList, labelList, scalarField, vector, vectorField
 
-from pyOFTools.aggregators import Max, Mean, Min, Sum, VolIntegrate
-from pyOFTools.datasets import AggregatedData, AggregatedDataSet, InternalDataSet
+from pyOFTools.aggregators import (
+    AreaMean,
+    FluxIntegrate,
+    Max,
+    Mean,
+    Min,
+    Sum,
+    SurfIntegrate,
+    VolIntegrate,
+)
+from pyOFTools.datasets import AggregatedData, AggregatedDataSet, InternalDataSet, PatchDataSet
 
 
 class DummyGeometry:
@@ -129,6 +138,57 @@ def test_volIntegrate():
     assert res_values == [14.0, 14.0, 14.0]
 
 
+class DummyPatchGeometry:
+    @property
+    def positions(self):
+        return vectorField([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+
+    @property
+    def face_areas(self):
+        return vectorField([[0, 0, 1.0], [0, 0, 2.0], [0, 0, 3.0]])
+
+    @property
+    def face_area_magnitudes(self):
+        return scalarField([1.0, 2.0, 3.0])
+
+
+def test_patch_area_weighted():
+    dataSet = PatchDataSet(
+        name="p",
+        field=scalarField([1.0, 2.0, 3.0]),
+        geometry=DummyPatchGeometry(),
+        groups=labelList([0, 1, 1]),
+    )
+    res = SurfIntegrate().compute(dataSet)
+    assert [v.value for v in res.values] == [1.0, 2.0 * 2 + 3.0 * 3]
+
+    res = AreaMean().compute(dataSet)
+    assert res.name == "p_areaMean"
+    assert [v.value for v in res.values] == pytest.approx([1.0, 13.0 / 5.0])
+
+
+def test_flux_integrate():
+    dataSet = PatchDataSet(
+        name="U",
+        field=vectorField([[1, 0, 1.0], [0, 1, 2.0], [0, 0, -1.0]]),
+        geometry=DummyPatchGeometry(),
+    )
+    res = FluxIntegrate().compute(dataSet)
+    assert res.name == "U_flux"
+    assert [v.value for v in res.values] == [1.0 * 1 + 2.0 * 2 - 1.0 * 3]
+
+    # scalar fields are face fluxes (phi)
+    dataSet = PatchDataSet(
+        name="phi",
+        field=scalarField([1.0, 2.0, -0.5]),
+        geometry=DummyPatchGeometry(),
+        groups=labelList([0, 1, 1]),
+    )
+    res = FluxIntegrate(name="Q").compute(dataSet)
+    assert res.name == "Q"
+    assert [v.value for v in res.values] == [1.0, 1.5]
+
+
 @pytest.mark.parametrize(
     "mask,zones,expected",
     [
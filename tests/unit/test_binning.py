@@ -38,3 +38,5 @@ def test_directional():
     assert ds.groups is not None
     assert isinstance(ds.groups, labelList)
     assert np.array_equal(np.asarray(ds.groups), [0, 1, 2, 3])  # 0 and 3 are out of range
+    # all bins, also those without elements
+    assert ds.n_groups == 4
@@ -0,0 +1,48 @@
+import pytest
+
+from pyOFTools.convergence import Convergence
+from pyOFTools.datasets import AggregatedData, AggregatedDataSet
+from pyOFTools.time_average import StateStore, activate
+
+
+def _residuals(p, U):
+    group_name = ["field", "solver", "metric", "iteration"]
+    return AggregatedDataSet(
+        name="residuals",
+        values=[
+            AggregatedData(value=p, group=["p", "GAMG", "init_res", 0], group_name=group_name),
+            AggregatedData(value=U, group=["U", "PBiCG", "init_res", 0], group_name=group_name),
+            AggregatedData(
+                value=5.0, group=["p", "GAMG", "nSolverIters", 0], group_name=group_name
+            ),
+        ],
+    )
+
+
+def _decisions(node, store, results):
+    decisions = []
+    with activate(store):
+        for result in results:
+            assert node.compute(result) is result
+            decisions.append(list(store.converged.values()))
+    return decisions
+
+
+def test_convergence_residual():
+    node = Convergence(residual=1e-3, where={"metric": "init_res"})
+    results = [_residuals(1e-2, 1e-2), _residuals(1e-4, 1e-2), _residuals(1e-4, 1e-4)]
+    assert _decisions(node, StateStore(), results) == [[False], [False], [True]]
+
+
+def test_convergence_plateau():
+    node = Convergence(tolerance=0.1, window=3)
+    values = [1.0, 2.0, 2.0, 2.0, 2.0, 2.0]
+    results = [AggregatedDataSet(name="drag", values=[AggregatedData(value=v)]) for v in values]
+    decisions = _decisions(node, StateStore(), results)
+    # the moving average of the relative change decays below the tolerance
+    assert [d[0] for d in decisions] == [False, False, False, False, True, True]
+
+
+def test_convergence_requires_store():
+    with pytest.raises(RuntimeError, match="PostProcessorRunner"):
+        Convergence().compute(_residuals(1.0, 1.0))
@@ -1,7 +1,13 @@
 import numpy as np
 from pybFoam import boolList, labelList, scalarField, vectorField
 
-from pyOFTools.datasets import InternalDataSet, PatchDataSet, PointDataSet, SurfaceDataSet
+from pyOFTools.datasets import (
+    InternalDataSet,
+    PatchDataSet,
+    PointDataSet,
+    SurfaceDataSet,
+    set_selection,
+)
 
 
 class DummyInternalMesh:
@@ -23,6 +29,14 @@ class DummyBoundaryMesh:
     def positions(self):
         return vectorField([[0, 0, 0], [1, 1, 1]])
 
+    @property
+    def face_areas(self):
+        return vectorField([[0, 0, 1.0], [0, 0, 2.0]])
+
+    @property
+    def face_area_magnitudes(self):
+        return scalarField([1.0, 2.0])
+
 
 class DummySurfaceMesh:
     """Implements SurfaceMesh protocol."""
@@ -131,3 +145,23 @@ def test_point_field_creation():
     assert (np.asarray(f.groups) == zones).all()
     assert f.field == field
     assert isinstance(f.geometry, DummyPointMesh)
+
+
+def test_set_selection_dense_and_sparse():
+    f = InternalDataSet(
+        name="internal",
+        field=scalarField([1.0] * 100),
+        geometry=DummyInternalMesh(),
+        mask=boolList([True] * 100),
+    )
+    few = np.zeros(100, dtype=bool)
+    few[[3, 50]] = True
+    set_selection(f, few, 100)
+    assert f.mask is None
+    assert isinstance(f.indices, labelList)
+    assert list(f.indices) == [3, 50]
+
+    many = np.arange(100) % 2 == 0
+    set_selection(f, np.flatnonzero(many), 100)
+    assert f.indices is None
+    assert np.array_equal(np.asarray(f.mask), many)
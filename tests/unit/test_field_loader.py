@@ -0,0 +1,59 @@
+from pyOFTools.field_loader import FieldLoader, activate, active_loader, lookup_field
+
+
+class DummyField:
+    reads: list[str] = []
+
+    def __init__(self, name):
+        self.name = name
+
+    @classmethod
+    def read_field(cls, mesh, name):
+        cls.reads.append(name)
+        return cls(name)
+
+    @classmethod
+    def from_registry(cls, mesh, name):
+        return cls(f"registry:{name}")
+
+
+class OtherField(DummyField):
+    pass
+
+
+def test_lookup_without_loader():
+    DummyField.reads = []
+    assert active_loader() is None
+    assert lookup_field(None, DummyField, "p").name == "registry:p"
+    assert lookup_field(None, DummyField, "p", read=True).name == "p"
+    assert DummyField.reads == ["p"]
+
+
+def test_loader_reads_once_and_records_dependencies():
+    DummyField.reads = []
+    loader = FieldLoader()
+    with activate(loader):
+        assert active_loader() is loader
+        with loader.output("a"):
+            p = lookup_field(None, DummyField, "p")
+            lookup_field(None, DummyField, "alpha.water")
+        with loader.output("b"):
+            assert lookup_field(None, DummyField, "p") is p
+            lookup_field(None, OtherField, "p")
+    assert active_loader() is None
+
+    assert DummyField.reads == ["p", "alpha.water", "p"]
+    assert loader.reads == 3
+    assert loader.dependencies == {
+        "a": {("DummyField", "p"), ("DummyField", "alpha.water")},
+        "b": {("DummyField", "p"), ("OtherField", "p")},
+    }
+    assert len(loader.required) == 3
+
+    # the working set is dropped and read again for the next time
+    assert len(loader) == 3
+    loader.release()
+    assert len(loader) == 0
+    with activate(loader):
+        assert lookup_field(None, DummyField, "p") is not p
+    assert loader.reads == 4
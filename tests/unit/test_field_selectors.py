@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+import pytest
+from pybFoam import boolList, labelList, scalarField
+
+from pyOFTools.aggregators import VolIntegrate
+from pyOFTools.datasets import InternalDataSet, PatchDataSet
+from pyOFTools.field_selectors import Threshold, Where, parse_condition
+
+
+class DummyGeometry:
+    @property
+    def positions(self):
+        return None
+
+    @property
+    def volumes(self):
+        return scalarField([1.0, 2.0, 3.0, 4.0])
+
+
+def create_dataset(mask=None, indices=None) -> InternalDataSet:
+    return InternalDataSet(
+        name="alpha",
+        field=scalarField([0.1, 0.5, 0.9, 1.0]),
+        geometry=DummyGeometry(),
+        mask=mask,
+        indices=indices,
+    )
+
+
+def test_parse_condition():
+    (cond,) = parse_condition("alpha.water >= 0.5")
+    assert cond.field_name == "alpha.water"
+    assert not cond.magnitude
+    assert cond.lower == 0.5
+    assert cond.upper is None
+
+    (cond,) = parse_condition("mag(U) > 2")
+    assert cond.field_name == "U"
+    assert cond.magnitude
+    assert cond.lower == math.nextafter(2.0, math.inf)
+
+    (cond,) = parse_condition("0.1 < alpha.water <= 0.9")
+    assert cond.lower == math.nextafter(0.1, math.inf)
+    assert cond.upper == 0.9
+
+    first, second = parse_condition("mag(U) < 1e-3 and T >= 300")
+    assert first.upper == math.nextafter(1e-3, -math.inf)
+    assert second.field_name == "T"
+    assert second.lower == 300
+
+
+@pytest.mark.parametrize("expr", ["alpha.water", "alpha.water == 1", "p > abc", "> 2"])
+def test_parse_condition_invalid(expr):
+    with pytest.raises(ValueError):
+        parse_condition(expr)
+
+
+def test_where_validates_expression():
+    with pytest.raises(ValueError):
+        Where(expr="U")
+
+
+def test_threshold_on_dataset_field():
+    ds = Threshold(lower=0.5).compute(create_dataset())
+    assert np.array_equal(np.asarray(ds.mask), [False, True, True, True])
+
+    ds = Threshold(lower=0.5, upper=0.95).compute(
+        create_dataset(mask=boolList([True, False, True, True]))
+    )
+    assert np.array_equal(np.asarray(ds.mask), [False, False, True, False])
+
+    ds = Threshold(upper=0.5).compute(create_dataset(indices=labelList([1, 2])))
+    assert np.array_equal(np.asarray(ds.mask), [False, True, False, False])
+    assert list(ds.indices) == [1, 2]
+
+
+def test_threshold_then_integral():
+    ds = Threshold(lower=0.5).compute(create_dataset())
+    res = VolIntegrate().compute(ds)
+    assert res.values[0].value == pytest.approx(0.5 * 2 + 0.9 * 3 + 1.0 * 4)
+
+
+class DummyPatchGeometry:
+    # patches know their mesh, but the values of a named field are per cell
+    mesh = object()
+
+    @property
+    def positions(self):
+        return None
+
+    @property
+    def face_areas(self):
+        return None
+
+    @property
+    def face_area_magnitudes(self):
+        return None
+
+
+def test_threshold_by_name_requires_cell_dataset():
+    dataset = PatchDataSet(name="p", field=scalarField([0.1, 0.5]), geometry=DummyPatchGeometry())
+    with pytest.raises(TypeError, match="PatchDataSet"):
+        Threshold(field_name="alpha.water", lower=0.5).compute(dataset)
+    with pytest.raises(TypeError):
+        Where(expr="alpha.water >= 0.5").compute(dataset)
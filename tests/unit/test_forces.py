@@ -0,0 +1,149 @@
+import pytest
+from pybFoam import boolList, labelList, scalarField, symmTensorField, vector, vectorField
+
+from pyOFTools.datasets import PatchDataSet
+from pyOFTools.forces import QUANTITIES, Forces
+
+
+class DummyPatchGeometry:
+    mesh = None
+
+    @property
+    def positions(self):
+        return vectorField([[0, 0, 1.0], [0, 0, -1.0]])
+
+    @property
+    def face_areas(self):
+        return vectorField([[0, 0, 2.0], [0, 0, -1.0]])
+
+    @property
+    def face_area_magnitudes(self):
+        return scalarField([2.0, 1.0])
+
+
+def create_dataset(mask=None, groups=None) -> PatchDataSet:
+    return PatchDataSet(
+        name="p",
+        field=scalarField([3.0, 1.0]),
+        geometry=DummyPatchGeometry(),
+        mask=mask,
+        groups=groups,
+    )
+
+
+def values_by_quantity(res):
+    return {tuple(v.group): v.value for v in res.values}
+
+
+def test_pressure_forces():
+    res = Forces(rho=2.0, pRef=2.0, viscous=False).compute(create_dataset())
+    assert res.name == "forces"
+    assert [v.group[0] for v in res.values] == list(QUANTITIES)
+
+    values = values_by_quantity(res)
+    # rho * (p - pRef / rho) * Sf: 2 * 2 * (0, 0, 2) + 2 * 0 * (0, 0, -1)
+    assert values[("pressure_force",)] == vector(0, 0, 8)
+    assert values[("viscous_force",)] == vector(0, 0, 0)
+    assert values[("total_force",)] == vector(0, 0, 8)
+    # force parallel to the lever arm: no moment
+    assert values[("pressure_moment",)] == vector(0, 0, 0)
+
+
+def test_pressure_reference_in_pascal():
+    # kinematic p with rho and pRef in Pa gives the same force as p in Pa
+    kinematic = Forces(rho=1000.0, pRef=1e5, viscous=False).compute(create_dataset())
+    dataset = create_dataset()
+    dataset.field = scalarField([3000.0, 1000.0])
+    dynamic = Forces(pRef=1e5, viscous=False).compute(dataset)
+
+    values = values_by_quantity(kinematic)
+    # (1000 * 3 - 1e5) * (0, 0, 2) + (1000 * 1 - 1e5) * (0, 0, -1)
+    assert values[("pressure_force",)] == vector(0, 0, -95000)
+    assert values == values_by_quantity(dynamic)
+
+
+def test_moment_about_cofr():
+    res = Forces(CofR=(1.0, 0.0, 0.0), viscous=False).compute(create_dataset())
+    values = values_by_quantity(res)
+    # (Cf - CofR) ^ F = (-1, 0, 1) ^ (0, 0, 6) + (-1, 0, -1) ^ (0, 0, -1)
+    assert values[("pressure_force",)] == vector(0, 0, 5)
+    assert values[("pressure_moment",)] == vector(0, 5, 0)
+
+
+def test_forces_per_group_and_mask():
+    res = Forces(viscous=False).compute(
+        create_dataset(mask=boolList([True, False]), groups=labelList([0, 1]))
+    )
+    values = values_by_quantity(res)
+    assert values[("pressure_force", 0)] == vector(0, 0, 6)
+    assert values[("pressure_force", 1)] == vector(0, 0, 0)
+    assert res.headers == ["forces_0", "forces_1", "forces_2", "quantity", "group"]
+
+
+def test_forces_requires_patch_dataset():
+    from pyOFTools.datasets import AggregatedDataSet
+
+    with pytest.raises(TypeError):
+        Forces().compute(AggregatedDataSet(name="x", values=[]))
+
+
+def test_viscous_stress_kernel():
+    from pyOFTools import aggregation
+
+    geometry = DummyPatchGeometry()
+    # stress xz = 1: Sf & stress = (Sf_z, 0, Sf_x)
+    stress = symmTensorField([[0, 0, 1.0, 0, 0, 0], [0, 0, 1.0, 0, 0, 0]])
+    res = aggregation.forces(
+        scalarField([0.0, 0.0]),
+        geometry.face_areas,
+        geometry.positions,
+        vector(0, 0, 0),
+        stress,
+    )
+    assert res.viscousForce[0] == vector(1, 0, 0)
+
+    # a kinematic stress is scaled with rho, a dynamic one is not
+    res = aggregation.forces(
+        scalarField([0.0, 0.0]),
+        geometry.face_areas,
+        geometry.positions,
+        vector(0, 0, 0),
+        stress,
+        rho=2.0,
+        kinematicStress=True,
+    )
+    assert res.viscousForce[0] == vector(2, 0, 0)
+    res = aggregation.forces(
+        scalarField([0.0, 0.0]),
+        geometry.face_areas,
+        geometry.positions,
+        vector(0, 0, 0),
+        stress,
+        rho=2.0,
+    )
+    assert res.viscousForce[0] == vector(1, 0, 0)
+
+
+def test_viscous_forces_of_known_stress(monkeypatch):
+    # stress xz = 1 on both faces: Sf & stress = (2, 0, 0) + (-1, 0, 0)
+    stress = symmTensorField([[0, 0, 1.0, 0, 0, 0], [0, 0, 1.0, 0, 0, 0]])
+    monkeypatch.setattr(Forces, "_stress", lambda self, dataset: stress)
+
+    values = values_by_quantity(Forces().compute(create_dataset()))
+    assert values[("viscous_force",)] == vector(1, 0, 0)
+
+    # kinematic pressure and stress: both scaled once with rho
+    values = values_by_quantity(Forces(rho=1000.0).compute(create_dataset()))
+    assert values[("viscous_force",)] == vector(1000, 0, 0)
+    assert values[("pressure_force",)] == vector(0, 0, 5000)
+
+
+def test_viscous_forces_without_turbulence_model(monkeypatch):
+    from pyOFTools import fieldFunctions
+
+    def not_registered(mesh):
+        raise RuntimeError("object turbulenceProperties not found")
+
+    monkeypatch.setattr(fieldFunctions, "kinematicViscousStressTensorEff", not_registered)
+    with pytest.raises(RuntimeError, match="stress_field or viscous=False"):
+        Forces(rho=1000.0).compute(create_dataset())
@@ -0,0 +1,95 @@
+import pytest
+
+from pyOFTools.offline import (
+    load_outputs,
+    processor_directories,
+    select_times,
+    time_directories,
+)
+from pyOFTools.tables.csvWriter import CSVWriter
+
+
+@pytest.fixture
+def case(tmp_path):
+    for name in ["0", "0.5", "1", "2.5", "10"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "constant").mkdir()
+    (tmp_path / "system").mkdir()
+    (tmp_path / "3").write_text("not a directory")
+    return tmp_path
+
+
+def test_time_directories(case):
+    assert time_directories(str(case)) == [
+        (0.0, "0"),
+        (0.5, "0.5"),
+        (1.0, "1"),
+        (2.5, "2.5"),
+        (10.0, "10"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "spec,expected",
+    [
+        (None, ["0", "0.5", "1", "2.5", "10"]),
+        ("0:1", ["0", "0.5", "1"]),
+        (":0.5,10", ["0", "0.5", "10"]),
+        ("2:", ["2.5", "10"]),
+        ("1,2.5", ["1", "2.5"]),
+        ("latestTime", ["10"]),
+        ("3", []),
+    ],
+)
+def test_select_times(case, spec, expected):
+    assert [name for _, name in select_times(time_directories(str(case)), spec)] == expected
+
+
+def test_processor_directories(tmp_path):
+    for name in ["processor10", "processor2", "processor0", "processors4"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "processor3").write_text("not a directory")
+    assert processor_directories(str(tmp_path)) == ["processor0", "processor2", "processor10"]
+
+
+def test_load_outputs(tmp_path):
+    script = tmp_path / "postProcess.py"
+    script.write_text(
+        "from pyOFTools.postprocessor import PostProcessorBase\n"
+        "postProcess = PostProcessorBase(base_path='results/')\n"
+        "@postProcess.Table('a.csv')\n"
+        "def a(mesh):\n"
+        "    return None\n"
+        "if __name__ == '__main__':\n"
+        "    raise RuntimeError('main block must not run')\n"
+    )
+    base_path, outputs = load_outputs(str(script))
+    assert base_path == "results/"
+    assert list(outputs) == ["a"]
+    assert outputs["a"][2]["filename"] == "a.csv"
+
+    script.write_text("x = 1\n")
+    with pytest.raises(ValueError):
+        load_outputs(str(script))
+
+
+def test_load_outputs_skips_field_averages(tmp_path):
+    script = tmp_path / "postProcess.py"
+    script.write_text(
+        "from pyOFTools.postprocessor import PostProcessorBase\n"
+        "postProcess = PostProcessorBase()\n"
+        "postProcess.FieldAverage(['p'])\n"
+        "@postProcess.Table('a.csv')\n"
+        "def a(mesh):\n"
+        "    return None\n"
+    )
+    with pytest.warns(UserWarning, match="pAverage"):
+        _, outputs = load_outputs(str(script))
+    assert list(outputs) == ["a"]
+
+
+def test_write_rows(tmp_path):
+    file_path = tmp_path / "out" / "table.csv"
+    writer = CSVWriter(file_path=str(file_path))
+    writer.write_rows(["time", "value"], [[0.0, 1.0], [1.0, 2.0]])
+    assert file_path.read_text() == "time,value\n0.0,1.0\n1.0,2.0\n"
@@ -0,0 +1,61 @@
+import pytest
+from pybFoam import vector
+
+from pyOFTools.datasets import AggregatedData, AggregatedDataSet
+from pyOFTools.partials import GREAT, PartialEntry, PartialState, combine_partials, partial_state
+
+
+def state(combine, entries, name="out"):
+    return PartialState(
+        name=name,
+        headers=["out", "group"],
+        combine=combine,
+        entries=[PartialEntry(group=g, value=v, weight=w) for g, v, w in entries],
+    )
+
+
+def test_partial_state():
+    dataset = AggregatedDataSet(
+        name="U_mean",
+        values=[
+            AggregatedData(value=vector(1, 2, 3), group=[0], group_name=["group"], weight=2.0),
+            AggregatedData(value=vector(4, 5, 6), group=[1], group_name=["group"], weight=0.5),
+        ],
+        combine="mean",
+    )
+    result = partial_state(dataset)
+    assert result.headers == dataset.headers
+    assert result.combine == "mean"
+    assert result.rows == [[1.0, 2.0, 3.0, 0], [4.0, 5.0, 6.0, 1]]
+    assert [e.weight for e in result.entries] == [2.0, 0.5]
+
+
+@pytest.mark.parametrize(
+    "combine,expected",
+    [
+        ("sum", [[4.0, 0], [2.0, 1], [5.0, 2]]),
+        ("max", [[3.0, 0], [2.0, 1], [5.0, 2]]),
+        ("min", [[1.0, 0], [2.0, 1], [5.0, 2]]),
+    ],
+)
+def test_combine(combine, expected):
+    # the second processor has no cells in group 1, the first none in group 2
+    first = state(combine, [([0], [1.0], None), ([1], [2.0], None)])
+    second = state(combine, [([0], [3.0], None), ([2], [5.0], None)])
+    assert combine_partials([first, second]).rows == expected
+
+
+def test_combine_mean():
+    first = state("mean", [([0], [1.0], 1.0), ([1], [GREAT], 0.0)])
+    second = state("mean", [([0], [4.0], 3.0), ([1], [GREAT], 0.0)])
+    result = combine_partials([first, second])
+    assert result.rows == [[pytest.approx(3.25), 0], [GREAT, 1]]
+    assert result.entries[0].weight == 4.0
+
+
+def test_combine_errors():
+    assert combine_partials([state(None, [([], [1.0], None)])]).rows == [[1.0]]
+    with pytest.raises(ValueError):
+        combine_partials([state(None, [([], [1.0], None)])] * 2)
+    with pytest.raises(ValueError):
+        combine_partials([state("sum", []), state("sum", [], name="other")])
@@ -0,0 +1,21 @@
+import pytest
+
+from pyOFTools.postprocessor import _decimation_for
+
+
+@pytest.mark.parametrize(
+    "required,current,expected",
+    [
+        (0.5, 1, 1),  # within budget
+        (1.5, 1, 2),  # widen to next power of two
+        (5.0, 2, 8),
+        (500.0, 1, 64),  # limited by max decimation
+        (1.9, 4, 4),  # lowering would exceed 75% of the budget
+        (1.4, 4, 2),
+        (0.2, 8, 1),
+        (2.0, 8, 4),  # drops more than one level: lowered to the 75% rule
+        (1.0, 8, 2),
+    ],
+)
+def test_decimation_for(required, current, expected):
+    assert _decimation_for(required, current, max_decimation=64) == expected
@@ -0,0 +1,81 @@
+import json
+import tracemalloc
+
+import pandas as pd
+from pybFoam import scalarField
+
+from pyOFTools.aggregators import Sum
+from pyOFTools.datasets import InternalDataSet
+from pyOFTools.profiling import Profiler, activate, active_profiler
+from pyOFTools.workflow import WorkFlow
+
+
+class DummyGeometry:
+    @property
+    def positions(self):
+        return None
+
+    @property
+    def volumes(self):
+        return scalarField([1.0, 2.0, 3.0])
+
+
+def create_workflow():
+    dataset = InternalDataSet(
+        name="internal",
+        field=scalarField([1.0, 2.0, 3.0]),
+        geometry=DummyGeometry(),
+    )
+    return WorkFlow(initial_dataset=dataset).then(Sum())
+
+
+def test_profiler_records_nodes(tmp_path):
+    profiler = Profiler(trace=True)
+    assert active_profiler() is None
+
+    with activate(profiler):
+        for _ in range(3):
+            with profiler.section("total"):
+                create_workflow().compute()
+    assert active_profiler() is None
+
+    header, rows = profiler.summary()
+    table = pd.DataFrame(rows, columns=header).set_index("name")
+    assert list(table.index) == ["total", "total/0:sum"]
+    assert (table["calls_max"] == 3).all()
+    assert (table["time_mean"] >= 0).all()
+    assert table.loc["total", "time_mean"] >= table.loc["total/0:sum", "time_mean"]
+    # a serial run: all ranks are this rank
+    assert (table["time_min"] == table["time_mean"]).all()
+
+    profiler.write_summary(str(tmp_path / "profile.csv"), header, rows)
+    assert pd.read_csv(tmp_path / "profile.csv").columns.tolist() == header
+
+    profiler.write_trace(str(tmp_path / "trace.json"))
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == 6
+    assert {e["ph"] for e in events} == {"X"}
+    profiler.stop()
+
+
+def test_workflow_without_profiler_is_not_recorded():
+    profiler = Profiler(memory=False)
+    create_workflow().compute()
+    header, rows = profiler.summary()
+    assert rows == []
+
+
+def test_profiler_memory_is_opt_in():
+    profiler = Profiler()
+    assert not tracemalloc.is_tracing()
+    with activate(profiler), profiler.section("total"):
+        create_workflow().compute()
+    _, rows = profiler.summary()
+    assert all(row[6] == 0 for row in rows)
+    profiler.stop()
+
+    profiler = Profiler(memory=True)
+    assert tracemalloc.is_tracing()
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,167 @@
+import numpy as np
+import pytest
+from pybFoam import boolList, scalarField, vectorField
+
+from pyOFTools.datasets import InternalDataSet
+from pyOFTools.selection_cache import SelectionCache, mesh_state, selection_cache
+from pyOFTools.spatial_selectors import Box, Sphere
+
+
+class DummyTime:
+    def __init__(self):
+        self.time = 0.0
+
+    def value(self):
+        return self.time
+
+
+class DummyMesh:
+    def __init__(self, n_cells=3, changing=None):
+        self._time = DummyTime()
+        self._n_cells = n_cells
+        if changing is not None:
+            self.changing = lambda: changing
+
+    def time(self):
+        return self._time
+
+    def nCells(self):
+        return self._n_cells
+
+
+class CountingGeometry:
+    """Counts accesses of the positions made by the selectors."""
+
+    def __init__(self, mesh, positions):
+        self.mesh = mesh
+        self._positions = positions
+        self.evaluations = 0
+
+    @property
+    def positions(self):
+        self.evaluations += 1
+        return self._positions
+
+    @property
+    def volumes(self):
+        return scalarField([1.0, 2.0, 3.0])
+
+    @property
+    def cache_key(self):
+        return ("cells", *mesh_state(self.mesh))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    selection_cache().clear()
+    yield
+    selection_cache().clear()
+
+
+def create_dataset(geo) -> InternalDataSet:
+    evaluations = geo.evaluations
+    ds = InternalDataSet(
+        name="internal",
+        field=scalarField([1.0, 2.0, 3.0]),
+        geometry=geo,
+        mask=boolList([True, True, True]),
+    )
+    # the protocol check of the geometry accesses the positions as well
+    geo.evaluations = evaluations
+    return ds
+
+
+def test_lru_eviction_by_memory():
+    cache = SelectionCache(max_bytes=250)
+    cache.put("a", np.zeros(100, dtype=bool), 100)
+    cache.put("b", np.zeros(100, dtype=bool), 100)
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", np.zeros(100, dtype=bool), 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.nbytes == 200
+
+    cache.resize(100)
+    assert len(cache) == 1
+
+
+def test_cached_selection_is_read_only():
+    cache = SelectionCache()
+    cache.put("a", np.array([True, False]), 2)
+    selection, size = cache.get("a")
+    assert size == 2
+    with pytest.raises(ValueError):
+        selection[0] = False
+
+
+def test_entry_is_bound_to_owner():
+    cache = SelectionCache()
+    mesh = DummyMesh()
+    cache.put("a", np.array([1, 2]), 10, owner=mesh)
+    assert cache.get("a", owner=DummyMesh()) is None
+    assert cache.get("a", owner=mesh) is not None
+
+
+def test_selector_skips_selection_on_static_mesh():
+    geo = CountingGeometry(DummyMesh(changing=False), vectorField([[0.5, 0.5, 0.5], [2, 2, 2], [0.1, 0.1, 0.1]]))
+    box = Box(min=(0, 0, 0), max=(1, 1, 1))
+
+    for _ in range(3):
+        ds = box.compute(create_dataset(geo))
+        assert np.array_equal(np.asarray(ds.mask), [True, False, True])
+    assert geo.evaluations == 1
+
+    # a different selector is not served from the cache
+    ds = Sphere(center=(0, 0, 0), radius=0.5).compute(create_dataset(geo))
+    assert np.array_equal(np.asarray(ds.mask), [False, False, True])
+    assert geo.evaluations == 2
+
+
+def test_selector_recomputes_on_moving_mesh():
+    mesh = DummyMesh(changing=True)
+    geo = CountingGeometry(mesh, vectorField([[0.5, 0.5, 0.5], [2, 2, 2], [0.1, 0.1, 0.1]]))
+    box = Box(min=(0, 0, 0), max=(1, 1, 1))
+
+    box.compute(create_dataset(geo))
+    box.compute(create_dataset(geo))
+    assert geo.evaluations == 1
+
+    mesh.time().time = 0.1
+    box.compute(create_dataset(geo))
+    assert geo.evaluations == 2
+
+
+def test_selector_recomputes_after_motion_stopped():
+    mesh = DummyMesh(changing=False)
+    geo = CountingGeometry(mesh, vectorField([[0.5, 0.5, 0.5], [2, 2, 2], [0.1, 0.1, 0.1]]))
+    box = Box(min=(0, 0, 0), max=(1, 1, 1))
+    assert np.array_equal(np.asarray(box.compute(create_dataset(geo)).mask), [1, 0, 1])
+
+    # the mesh moves in one time step ...
+    mesh.changing = lambda: True
+    mesh.time().time = 0.1
+    geo._positions = vectorField([[2, 2, 2], [0.5, 0.5, 0.5], [0.1, 0.1, 0.1]])
+    assert np.array_equal(np.asarray(box.compute(create_dataset(geo)).mask), [0, 1, 1])
+    assert geo.evaluations == 2
+
+    # ... and stops: the selection of the moved mesh is reused, not the initial one
+    mesh.changing = lambda: False
+    mesh.time().time = 0.2
+    assert np.array_equal(np.asarray(box.compute(create_dataset(geo)).mask), [0, 1, 1])
+    assert geo.evaluations == 2
+
+
+def test_mesh_without_changing_is_not_static():
+    mesh = DummyMesh()
+    geo = CountingGeometry(mesh, vectorField([[0.5, 0.5, 0.5], [2, 2, 2], [0.1, 0.1, 0.1]]))
+    box = Box(min=(0, 0, 0), max=(1, 1, 1))
+
+    box.compute(create_dataset(geo))
+    box.compute(create_dataset(geo))
+    assert geo.evaluations == 1
+
+    mesh.time().time = 0.1
+    box.compute(create_dataset(geo))
+    assert geo.evaluations == 2
@@ -0,0 +1,167 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from pyOFTools.setfields import (
+    SetFieldsConfig,
+    select_regions,
+    selection_size,
+    set_fields_decomposed,
+    volume_fractions,
+)
+from pyOFTools.spatial_selectors import BinarySpatialSelector, Box, HalfSpace, Sphere
+
+
+class DummyMesh:
+    def __init__(self, positions):
+        self._positions = np.asarray(positions, dtype=float)
+
+    def C(self):
+        return {"internalField": self._positions}
+
+    def nCells(self):
+        return len(self._positions)
+
+
+CONFIG = {
+    "fields": [
+        {"name": "alpha.water", "value": 0.0},
+        {"name": "U", "type": "volVectorField", "value": [0, 0, 0]},
+    ],
+    "regions": [
+        {
+            "region": {"type": "box", "min": [0, 0, 0], "max": [1, 1, 1]},
+            "fieldValues": {"alpha.water": 1, "T": 300.0},
+        },
+        {
+            "region": {
+                "type": "binary",
+                "op": "or",
+                "left": {"type": "sphere", "center": [2, 0, 0], "radius": 0.1},
+                "right": {"type": "halfSpace", "point": [0, 0, 5], "normal": [0, 0, 1]},
+            },
+            "fieldValues": {"U": [1, 0, 0], "p_extra": [0, 0, 1]},
+        },
+    ],
+}
+
+
+def test_config():
+    config = SetFieldsConfig.model_validate(CONFIG)
+    assert isinstance(config.regions[0].region, Box)
+    assert isinstance(config.regions[1].region, BinarySpatialSelector)
+    assert config.regions[0].fieldValues["alpha.water"] == 1.0
+    assert config.field_types() == {
+        "alpha.water": "volScalarField",
+        "U": "volVectorField",
+        "T": "volScalarField",
+        "p_extra": "volVectorField",
+    }
+
+    with pytest.raises(ValidationError):
+        SetFieldsConfig.model_validate(
+            {"regions": [{"region": {"type": "cube"}, "fieldValues": {}}]}
+        )
+
+
+def test_select_regions():
+    config = SetFieldsConfig.model_validate(CONFIG)
+    mesh = DummyMesh([[0.5, 0.5, 0.5], [2.0, 0.0, 0.0], [0.0, 0.0, 6.0], [3.0, 3.0, 3.0]])
+    selections = select_regions(config, mesh)
+    assert [list(np.flatnonzero(s)) for s, _ in selections] == [[0], [1, 2]]
+    assert [selection_size(s) for s, _ in selections] == [1, 2]
+    assert selection_size(np.array([4, 7, 9])) == 3
+
+
+def unit_cells(centres, size=(1.0, 1.0, 1.0)):
+    centres = np.asarray(centres, dtype=float)
+    half = 0.5 * np.asarray(size)
+    return centres - half, centres + half
+
+
+def test_volume_fractions_half_space():
+    lower, upper = unit_cells([[0.0, 0, 0], [1.0, 0, 0], [2.0, 0, 0]])
+    selector = HalfSpace(point=(1.25, 0, 0), normal=(1, 0, 0))
+    indices, fractions = volume_fractions(selector, lower, upper, subdivisions=4)
+    assert list(indices) == [1, 2]
+    assert list(fractions) == [0.25, 1.0]
+
+
+def test_volume_fractions_flat_cells():
+    # one layer of thin cells (2D case): the real cell bounds are used
+    lower, upper = unit_cells([[0.5, 0, 0], [1.5, 0, 0], [2.5, 0, 0]], size=(1.0, 1.0, 0.1))
+
+    # plane on a cell face: sharp
+    selector = HalfSpace(point=(1.0, 0, 0), normal=(1, 0, 0))
+    indices, fractions = volume_fractions(selector, lower, upper)
+    assert list(indices) == [1, 2]
+    assert list(fractions) == [1.0, 1.0]
+
+    selector = HalfSpace(point=(1.25, 0, 0), normal=(1, 0, 0))
+    indices, fractions = volume_fractions(selector, lower, upper)
+    assert list(indices) == [1, 2]
+    assert list(fractions) == [0.75, 1.0]
+
+
+def test_volume_fractions_region_smaller_than_cell():
+    lower, upper = unit_cells([[0.0, 0, 0], [1.0, 0, 0]])
+    # no corner of the cell is inside the sphere
+    sphere = Sphere(center=(0.0, 0.0, 0.0), radius=0.3)
+    indices, fractions = volume_fractions(sphere, lower, upper, subdivisions=8)
+    assert list(indices) == [0]
+    assert fractions[0] == pytest.approx(4 / 3 * np.pi * 0.3**3, rel=0.25)
+
+    # a slab thinner than the cells crossing them
+    slab = Box(min=(-1.0, -1.0, 0.0), max=(2.0, 1.0, 0.25))
+    indices, fractions = volume_fractions(slab, lower, upper)
+    assert list(indices) == [0, 1]
+    assert list(fractions) == [0.25, 0.25]
+
+
+def test_volume_fractions_non_convex():
+    lower, upper = unit_cells([[0.0, 0, 0]])
+    # all corners are inside, but the cell has a hole
+    hollow = Box(min=(-1.0, -1.0, -1.0), max=(1.0, 1.0, 1.0)) & ~Sphere(
+        center=(0.0, 0.0, 0.0), radius=0.25
+    )
+    _, fractions = volume_fractions(hollow, lower, upper, subdivisions=8)
+    assert 0.0 < fractions[0] < 1.0
+
+
+def test_volume_fractions_reject_points_outside_cell():
+    # cell 1 is a prism filling half of its box (x + y < 1 within the cell)
+    lower, upper = unit_cells([[-0.5, 0.5, 0.5], [0.5, 0.5, 0.5]])
+    selector = HalfSpace(point=(0.5, 0, 0), normal=(1, 0, 0))
+
+    def in_cell(points, cells):
+        local = points - lower[cells]
+        return (cells != 1) | (local[:, 0] + local[:, 1] < 1.0)
+
+    indices, fractions = volume_fractions(selector, lower, upper, 8, in_cell=in_cell)
+    assert list(indices) == [1]
+    assert fractions[0] == pytest.approx(0.25, abs=0.05)
+
+    # the bounding box alone counts the empty half of the box
+    _, fractions = volume_fractions(selector, lower, upper, 8)
+    assert fractions[0] == pytest.approx(0.5)
+
+
+def test_volume_fractions_sphere():
+    n = 20
+    ticks = (np.arange(n) + 0.5) / n
+    centres = np.stack(np.meshgrid(ticks, ticks, ticks, indexing="ij"), axis=-1).reshape(-1, 3)
+    lower, upper = unit_cells(centres, size=(1.0 / n, 1.0 / n, 1.0 / n))
+    sphere = Sphere(center=(0.5, 0.5, 0.5), radius=0.3)
+
+    indices, fractions = volume_fractions(sphere, lower, upper)
+    volume = 1.0 / n**3
+    assert np.sum(fractions) * volume == pytest.approx(4 / 3 * np.pi * 0.3**3, rel=0.02)
+    # cells far inside are complete, partial cells only on the boundary
+    partial = indices[fractions < 1.0]
+    distance = np.linalg.norm(centres[partial] - 0.5, axis=1)
+    assert np.all(np.abs(distance - 0.3) < np.sqrt(3) / n)
+
+
+def test_set_fields_decomposed_requires_processors(tmp_path):
+    with pytest.raises(ValueError, match="No processor directories"):
+        set_fields_decomposed(SetFieldsConfig(), str(tmp_path))
@@ -0,0 +1,137 @@
+import gc
+
+import numpy as np
+import pytest
+
+from pyOFTools import spatial_index
+from pyOFTools.spatial_index import UniformGridIndex, index_for_mesh
+from pyOFTools.spatial_selectors import Box, Sphere
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(42)
+    return rng.random((5000, 3))
+
+
+@pytest.mark.parametrize(
+    "lo, hi",
+    [
+        ((0.1, 0.1, 0.1), (0.3, 0.2, 0.4)),
+        ((-1.0, -1.0, -1.0), (0.05, 2.0, 2.0)),
+        ((0.5, 0.5, 0.5), (0.5, 0.5, 0.5)),
+    ],
+)
+def test_query_returns_sorted_superset(points, lo, hi):
+    index = UniformGridIndex(points)
+    candidates = index.query(np.array(lo), np.array(hi))
+
+    inside = np.flatnonzero(np.all((points >= lo) & (points <= hi), axis=1))
+    assert np.all(np.diff(candidates) > 0)
+    assert np.isin(inside, candidates).all()
+
+
+def test_query_outside_domain(points):
+    index = UniformGridIndex(points)
+    assert index.query(np.array([2.0, 2.0, 2.0]), np.array([3.0, 3.0, 3.0])).size == 0
+    assert index.estimate(np.array([2.0, 2.0, 2.0]), np.array([3.0, 3.0, 3.0])) == 0.0
+
+
+def test_index_of_2d_domain():
+    rng = np.random.default_rng(0)
+    points = rng.random((2000, 3))
+    points[:, 2] = 0.05
+    index = UniformGridIndex(points)
+
+    lo, hi = np.array([0.2, 0.2, -1.0]), np.array([0.4, 0.3, 1.0])
+    inside = np.flatnonzero(np.all((points >= lo) & (points <= hi), axis=1))
+    assert np.isin(inside, index.query(lo, hi)).all()
+    assert index.estimate(lo, hi) < 0.1
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        Box(type="box", min=(0.1, 0.2, 0.3), max=(0.3, 0.4, 0.5)),
+        Sphere(type="sphere", center=(0.6, 0.6, 0.6), radius=0.1),
+        Sphere(type="sphere", center=(0.6, 0.6, 0.6), radius=0.1)
+        & ~Box(type="box", min=(0.6, 0.0, 0.0), max=(1.0, 1.0, 1.0)),
+    ],
+)
+def test_select_indices_matches_evaluate(points, selector):
+    index = UniformGridIndex(points)
+    selected = selector.select_indices(points, index)
+
+    assert selected is not None
+    np.testing.assert_array_equal(selected, np.flatnonzero(selector.evaluate(points)))
+
+
+def test_select_indices_skips_large_regions(points):
+    index = UniformGridIndex(points)
+    box = Box(type="box", min=(0.0, 0.0, 0.0), max=(0.9, 0.9, 0.9))
+    assert box.select_indices(points, index) is None
+    assert (~box).select_indices(points, index) is None
+
+
+class DummyTime:
+    def __init__(self):
+        self.time = 0.0
+
+    def value(self):
+        return self.time
+
+
+class DummyMesh:
+    def __init__(self, n_cells, changing=False):
+        self._time = DummyTime()
+        self._n_cells = n_cells
+        self.changing = lambda: changing
+
+    def time(self):
+        return self._time
+
+    def nCells(self):
+        return self._n_cells
+
+
+def test_index_for_mesh_is_shared(monkeypatch):
+    monkeypatch.setattr(spatial_index, "MIN_POINTS", 100)
+    spatial_index.clear()
+    mesh = DummyMesh(200)
+    points = np.random.default_rng(1).random((200, 3))
+
+    index = index_for_mesh(mesh, points)
+    assert index is not None
+    assert index_for_mesh(mesh, points) is index
+    assert index_for_mesh(DummyMesh(50), points[:50]) is None
+    spatial_index.clear()
+
+
+def test_index_for_mesh_follows_moving_mesh(monkeypatch):
+    monkeypatch.setattr(spatial_index, "MIN_POINTS", 100)
+    spatial_index.clear()
+    mesh = DummyMesh(1000, changing=True)
+    points = np.random.default_rng(2).random((1000, 3))
+    box = Box(type="box", min=(2.0, 0.1, 0.1), max=(2.2, 0.3, 0.3))
+
+    assert box.select_indices(points, index_for_mesh(mesh, points)).size == 0
+
+    # the mesh moves by 2 in x: the index must be rebuilt
+    mesh.time().time = 0.1
+    moved = points + [2.0, 0.0, 0.0]
+    selected = box.select_indices(moved, index_for_mesh(mesh, moved))
+    np.testing.assert_array_equal(selected, np.flatnonzero(box.evaluate(moved)))
+    assert selected.size > 0
+    spatial_index.clear()
+
+
+def test_index_for_mesh_does_not_keep_mesh_alive(monkeypatch):
+    monkeypatch.setattr(spatial_index, "MIN_POINTS", 100)
+    spatial_index.clear()
+    mesh = DummyMesh(200)
+    index_for_mesh(mesh, np.random.default_rng(3).random((200, 3)))
+    assert len(spatial_index._indices) == 1
+
+    del mesh
+    gc.collect()
+    assert len(spatial_index._indices) == 0
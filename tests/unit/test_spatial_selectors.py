@@ -5,7 +5,10 @@ from pyOFTools.datasets import InternalDataSet
 from pyOFTools.spatial_selectors import (
     BinarySpatialSelector,
     Box,
+    Cylinder,
+    HalfSpace,
     NotSpatialSelector,
+    OrientedBox,
     Sphere,
 )
 
@@ -117,3 +120,68 @@ def test_operator_overloads_equivalent():
     region_manual = BinarySpatialSelector(type="binary", op="or", left=box, right=sphere)
     region_op = box | sphere
     assert np.array_equal(region_manual.compute(dataSet), region_op.compute(dataSet))
+
+
+def test_nested_tree_matches_reference():
+    rng = np.random.default_rng(0)
+    positions = rng.random((5000, 3)) * 2 - 0.5
+
+    box = Box(min=(0, 0, 0), max=(1, 1, 1))
+    small_box = Box(min=(0.4, 0.4, 0.4), max=(0.5, 0.5, 0.5))
+    sphere = Sphere(center=(0.5, 0.5, 0.5), radius=0.3)
+    far_sphere = Sphere(center=(5, 5, 5), radius=0.1)
+    region = ((box & ~sphere) | (small_box & sphere)) | (box & far_sphere)
+
+    in_box = np.all((positions >= 0) & (positions <= 1), axis=1)
+    in_small_box = np.all((positions >= 0.4) & (positions <= 0.5), axis=1)
+    in_sphere = np.linalg.norm(positions - 0.5, axis=1) <= 0.3
+    expected = (in_box & ~in_sphere) | (in_small_box & in_sphere)
+
+    assert np.array_equal(region.evaluate(positions), expected)
+
+    ds = region.compute(create_dataset(DummyGeometry(positions=vectorField(positions))))
+    assert np.array_equal(np.asarray(ds.mask), expected)
+
+
+def test_disjoint_and_selects_nothing():
+    region = Box(min=(0, 0, 0), max=(1, 1, 1)) & Sphere(center=(5, 5, 5), radius=1.0)
+    positions = np.array([[0.5, 0.5, 0.5], [5.0, 5.0, 5.0]])
+    assert not region.evaluate(positions).any()
+
+
+def test_cylinder():
+    cylinder = Cylinder(point1=(0, 0, 0), point2=(0, 0, 2), radius=0.5)
+    positions = np.array([[0.3, 0.3, 1.0], [0.4, 0.4, 1.0], [0.0, 0.0, 2.5], [0.0, 0.0, 0.0]])
+    assert np.array_equal(cylinder.evaluate(positions), [True, False, False, True])
+
+    lo, hi = cylinder._bounds()
+    assert np.allclose(lo, [-0.5, -0.5, 0.0])
+    assert np.allclose(hi, [0.5, 0.5, 2.0])
+
+
+def test_half_space():
+    half_space = HalfSpace(point=(1, 0, 0), normal=(1, 1, 0))
+    positions = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    assert np.array_equal(half_space.evaluate(positions), [True, False, True])
+
+
+def test_oriented_box():
+    # unit cube rotated by 45 degrees around z
+    s = np.sqrt(0.5)
+    box = OrientedBox(origin=(0, 0, 0), i=(s, s, 0), j=(-s, s, 0), k=(0, 0, 1))
+    positions = np.array([[0.0, 0.5, 0.5], [0.5, 0.0, 0.5], [0.0, 1.4, 0.5], [0.0, 0.5, 1.5]])
+    assert np.array_equal(box.evaluate(positions), [True, False, True, False])
+
+
+def test_new_primitives_compose():
+    rng = np.random.default_rng(1)
+    positions = rng.random((2000, 3)) * 2 - 0.5
+
+    cylinder = Cylinder(point1=(0, 0, 0), point2=(1, 1, 1), radius=0.3)
+    half_space = HalfSpace(point=(0.5, 0.5, 0.5), normal=(0, 0, 1))
+    region = (cylinder & ~half_space) | Box(min=(0, 0, 0), max=(0.2, 0.2, 0.2))
+
+    expected = (cylinder.evaluate(positions) & ~half_space.evaluate(positions)) | np.all(
+        (positions >= 0) & (positions <= 0.2), axis=1
+    )
+    assert np.array_equal(region.evaluate(positions), expected)
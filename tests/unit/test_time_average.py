@@ -0,0 +1,64 @@
+import pytest
+from pybFoam import vector
+
+from pyOFTools.datasets import AggregatedData, AggregatedDataSet
+from pyOFTools.time_average import StateStore, TimeAverage, activate
+
+
+def _result(*values, groups=None):
+    return AggregatedDataSet(
+        name="mass",
+        values=[
+            AggregatedData(
+                value=v,
+                group=[groups[i]] if groups else None,
+                group_name=["group"] if groups else None,
+            )
+            for i, v in enumerate(values)
+        ],
+    )
+
+
+def _run(node, store, samples):
+    results = []
+    with activate(store):
+        for time, values in samples:
+            store.time = time
+            results.append(node.compute(_result(*values)))
+    return results
+
+
+def test_time_average_cumulative():
+    results = _run(TimeAverage(), StateStore(), [(0.0, [1.0]), (1.0, [3.0]), (3.0, [3.0])])
+    means = [r.values[1].value for r in results]
+    # trapezoidal rule: (2 * 1 + 3 * 2) / 3
+    assert means == pytest.approx([1.0, 2.0, 8.0 / 3.0])
+
+    last = results[-1]
+    assert last.headers == ["mass", "statistic"]
+    assert last.grouped_values == [[3.0, "instant"], [pytest.approx(8.0 / 3.0), "mean"]]
+
+
+def test_time_average_window():
+    samples = [(float(t), [float(t)]) for t in range(6)]
+    results = _run(TimeAverage(window=2.0), StateStore(), samples)
+    # mean of the linear signal over [t - 2, t]
+    assert results[-1].values[1].value == pytest.approx(4.0)
+
+
+def test_time_average_groups_and_vectors():
+    store = StateStore()
+    node = TimeAverage()
+    with activate(store):
+        for time, scale in [(0.0, 1.0), (1.0, 3.0)]:
+            store.time = time
+            result = node.compute(_result(vector(scale, 0, 0), vector(0, scale, 0), groups=[1, 2]))
+    assert result.headers == ["mass_0", "mass_1", "mass_2", "group", "statistic"]
+    assert result.grouped_values[2] == [2.0, 0.0, 0.0, 1, "mean"]
+    assert result.grouped_values[3] == [0.0, 2.0, 0.0, 2, "mean"]
+    assert len(store) == 1
+
+
+def test_time_average_requires_store():
+    with pytest.raises(RuntimeError, match="PostProcessorRunner"):
+        TimeAverage().compute(_result(1.0))
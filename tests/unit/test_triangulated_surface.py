@@ -0,0 +1,72 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pyOFTools.spatial_selectors import SurfaceInside
+from pyOFTools.triangulated_surface import TriangulatedSurface, load_surface, read_stl
+
+
+def unit_cube_triangles():
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=float)
+    faces = [
+        (0, 1, 3, 2),
+        (4, 6, 7, 5),
+        (0, 4, 5, 1),
+        (2, 3, 7, 6),
+        (0, 2, 6, 4),
+        (1, 5, 7, 3),
+    ]
+    triangles = []
+    for a, b, c, d in faces:
+        triangles += [(a, b, c), (a, c, d)]
+    return corners[np.array(triangles)]
+
+
+def write_ascii_stl(path, triangles):
+    with open(path, "w") as f:
+        f.write("solid cube\n")
+        for tri in triangles:
+            f.write("  facet normal 0 0 0\n    outer loop\n")
+            for vertex in tri:
+                f.write("      vertex {} {} {}\n".format(*vertex))
+            f.write("    endloop\n  endfacet\n")
+        f.write("endsolid cube\n")
+
+
+def write_binary_stl(path, triangles):
+    with open(path, "wb") as f:
+        f.write(b"\0" * 80 + struct.pack("<I", len(triangles)))
+        for tri in triangles:
+            f.write(struct.pack("<12fH", 0, 0, 0, *tri.ravel(), 0))
+
+
+@pytest.mark.parametrize("writer", [write_ascii_stl, write_binary_stl])
+def test_read_stl(tmp_path, writer):
+    triangles = unit_cube_triangles()
+    path = str(tmp_path / "cube.stl")
+    writer(path, triangles)
+    assert np.allclose(read_stl(path), triangles)
+
+
+def test_inside_with_rays_through_edges():
+    surface = TriangulatedSurface(unit_cube_triangles())
+    # grid points whose rays run along the edges and diagonals of the triangles
+    g = np.linspace(-0.25, 1.25, 13)
+    points = np.array(np.meshgrid(g, g, g)).reshape(3, -1).T
+    on_boundary = np.any(np.isin(points, [0.0, 1.0]), axis=1)
+
+    expected = np.all((points > 0) & (points < 1), axis=1)
+    inside = surface.inside(points)
+    assert np.array_equal(inside[~on_boundary], expected[~on_boundary])
+
+
+def test_surface_inside_selector(tmp_path):
+    path = str(tmp_path / "cube.stl")
+    write_binary_stl(path, unit_cube_triangles())
+    positions = np.random.default_rng(0).random((1000, 3)) * 2 - 0.5
+    expected = np.all((positions > 0) & (positions < 1), axis=1)
+
+    assert np.array_equal(SurfaceInside(file=path).evaluate(positions), expected)
+    assert np.array_equal(SurfaceInside(file=path, inside=False).evaluate(positions), ~expected)
+    assert load_surface(path) is load_surface(path)
@@ -1,3 +1,4 @@
+import json
 import os
 
 import numpy as np
@@ -7,7 +8,8 @@ from pybFoam import boolList, labelList, scalarField, vectorField
 
 from pyOFTools.aggregators import Sum
 from pyOFTools.datasets import InternalDataSet
-from pyOFTools.tables.csvWriter import CSVWriter
+from pyOFTools.tables.csvWriter import CSVWriter, _truncate_rows_after
+from pyOFTools.tables.table import TableWriter
 from pyOFTools.workflow import WorkFlow
 
 
@@ -113,3 +115,163 @@ def test_csv_write_aggregated_dataset(change_test_dir, mask, zones, expected):
     assert np.allclose(table.iloc[:, 1:], np.array(expected[1]))
     os.remove("test_output.csv")
     assert not os.path.isfile("test_output.csv")
+
+
+def _write_rows(file_path, times, restart_time=None):
+    workflow = WorkFlow(initial_dataset=create_dataset(scalarField([1.0, 2.0, 3.0]))).then(Sum())
+    writer = CSVWriter(file_path=file_path)
+    if restart_time is None:
+        writer.create_file()
+    else:
+        writer.resume(start_time=restart_time)
+    for time in times:
+        writer.write_result(time=time, result=workflow.compute())
+
+
+def test_csv_resume_truncates_later_rows(change_test_dir):
+    _write_rows("test_output.csv", [0.0, 0.1, 0.2, 0.3, 0.4])
+    _write_rows("test_output.csv", [0.3, 0.4, 0.5], restart_time=0.2)
+
+    table = pd.read_csv("test_output.csv")
+    assert table.columns.tolist() == ["time", "internal_sum"]
+    assert np.allclose(table["time"], [0.0, 0.1, 0.2, 0.3, 0.4, 0.5])
+    os.remove("test_output.csv")
+
+
+def test_csv_resume_header_mismatch_recreates_file(change_test_dir):
+    with open("test_output.csv", "w") as f:
+        f.write("time,other\n0.0,1.0\n0.1,1.0\n")
+
+    _write_rows("test_output.csv", [0.2], restart_time=0.1)
+
+    table = pd.read_csv("test_output.csv")
+    assert table.columns.tolist() == ["time", "internal_sum"]
+    assert np.allclose(table["time"], [0.2])
+    os.remove("test_output.csv")
+
+
+def test_csv_resume_without_file_creates_it(change_test_dir):
+    _write_rows("test_output.csv", [0.0, 0.1], restart_time=0.0)
+
+    table = pd.read_csv("test_output.csv")
+    assert np.allclose(table["time"], [0.0, 0.1])
+    os.remove("test_output.csv")
+
+
+def test_truncate_rows_after_small_blocks(change_test_dir):
+    with open("test_output.csv", "w") as f:
+        f.write("time,a\n")
+        for i in range(20):
+            f.write(f"{i * 0.1},{i}\n")
+        f.write("2.0,1")  # incomplete row of an aborted run
+
+    header = _truncate_rows_after("test_output.csv", 0.5, block_size=7)
+
+    assert header == ["time", "a"]
+    table = pd.read_csv("test_output.csv")
+    assert np.allclose(table["time"], [0.0, 0.1, 0.2, 0.3, 0.4, 0.5])
+    os.remove("test_output.csv")
+
+
+class DummyTime:
+    def __init__(self):
+        self.t = 0.0
+
+    def value(self):
+        return self.t
+
+
+class DummyMesh:
+    def __init__(self):
+        self._time = DummyTime()
+
+    def time(self):
+        return self._time
+
+
+def test_table_writer_run_time_control(change_test_dir, tmp_path):
+    mesh = DummyMesh()
+    n_calls = []
+
+    def func(m):
+        n_calls.append(m.time().value())
+        return WorkFlow(initial_dataset=create_dataset(scalarField([1.0, 2.0, 3.0]))).then(Sum())
+
+    writer = TableWriter(
+        mesh=mesh,
+        func=func,
+        base_path=f"{tmp_path}/",
+        filename="run_time.csv",
+        writeControl="runTime",
+        writeInterval=0.3,
+    )
+    for i in range(1, 7):
+        mesh.time().t = i * 0.1
+        writer.execute()
+        writer.write()
+    writer.end()
+
+    # workflow is only built when the output is due
+    assert np.allclose(n_calls, [0.3, 0.6])
+    table = pd.read_csv(tmp_path / "run_time.csv")
+    assert np.allclose(table["time"], [0.3, 0.6])
+
+
+def test_table_writer_unknown_write_control(tmp_path):
+    with pytest.raises(ValueError, match="writeControl"):
+        TableWriter(
+            mesh=DummyMesh(),
+            func=lambda m: None,
+            base_path=f"{tmp_path}/",
+            filename="out.csv",
+            writeControl="outputTime",
+        )
+
+
+@pytest.mark.parametrize("interval", [0.5, 2.5])
+def test_table_writer_time_step_interval(tmp_path, interval):
+    with pytest.raises(ValueError, match="whole number"):
+        TableWriter(
+            mesh=DummyMesh(),
+            func=lambda m: None,
+            base_path=f"{tmp_path}/",
+            filename="out.csv",
+            writeControl="timeStep",
+            writeInterval=interval,
+        )
+
+
+def test_table_writer_decimation(change_test_dir, tmp_path):
+    mesh = DummyMesh()
+    n_calls = []
+
+    def func(m):
+        n_calls.append(m.time().value())
+        return WorkFlow(initial_dataset=create_dataset(scalarField([1.0, 2.0, 3.0]))).then(Sum())
+
+    writer = TableWriter(
+        mesh=mesh,
+        func=func,
+        base_path=f"{tmp_path}/",
+        filename="decimated.csv",
+        writeControl="timeStep",
+        budget=0.1,
+    )
+    mesh.time().t = 1.0
+    writer.execute()
+    writer.write()
+    assert writer.evaluated
+    writer.set_decimation(3, cost=0.3, solver_time=1.0)
+
+    for i in range(2, 9):
+        mesh.time().t = float(i)
+        writer.execute()
+        writer.write()
+
+    assert n_calls == [1.0, 4.0, 7.0]
+    with open(tmp_path / "decimated.csv.meta.json") as f:
+        metadata = json.load(f)
+    assert metadata["budget"] == 0.1
+    assert metadata["decimation"] == [
+        {"time": 1.0, "decimation": 3, "cost": 0.3, "solverTime": 1.0}
+    ]